@@ -1,33 +1,64 @@
 """
 Agent and initialization management for SpaceTraders
 """
+import asyncio
+import functools
 import os
 import logging
+from importlib.util import find_spec
 from typing import Optional
 
+import httpx
 from dotenv import load_dotenv
 from space_traders_api_client import AuthenticatedClient
 from space_traders_api_client.api.agents import get_my_agent
 from space_traders_api_client.models.agent import Agent
 
 from .rate_limiter import RateLimiter
+from .ttl_cache import ttl_cache
 
 logger = logging.getLogger(__name__)
 
+# HTTP/2 lets concurrent requests share one connection; needs httpx[http2]
+HTTP2_AVAILABLE = find_spec('h2') is not None
+
+# Keep idle connections around between the bursts of a trading cycle
+CONNECTION_LIMITS = httpx.Limits(
+    max_keepalive_connections=50,
+    max_connections=200,
+    keepalive_expiry=30.0
+)
+# Fail fast on connect, but leave room for slow API responses
+REQUEST_TIMEOUT = httpx.Timeout(30.0, connect=5.0)
+
+
+@functools.lru_cache(maxsize=1)
+def _load_env_once() -> bool:
+    """Read .env into the environment on the first call only"""
+    return load_dotenv()
+
 
 class AgentManager:
     """Handles agent authentication and status"""
+
+    STATUS_TTL = 3.0  # Seconds an agent status is reused within a cycle
     
-    def __init__(self, token: Optional[str] = None):
+    def __init__(
+        self,
+        token: Optional[str] = None,
+        api_semaphore: Optional[asyncio.Semaphore] = None
+    ):
         """Initialize the AgentManager
         
         Args:
             token: Optional API token. If not provided, will read from env var.
+            api_semaphore: Optional semaphore shared by all managers to bound
+                concurrent API requests
             
         Raises:
             ValueError: If no token is provided or found in environment.
         """
-        load_dotenv()
+        _load_env_once()
         self.token = token or os.getenv('SPACETRADERS_TOKEN')
         if not self.token:
             raise ValueError(
@@ -35,18 +66,20 @@ class AgentManager:
                 'or pass token.'
             )
         
-        # Initialize the client
+        # Initialize the client. Every manager shares it, and with it a
+        # single keep-alive connection pool.
         self.client = AuthenticatedClient(
             base_url='https://api.spacetraders.io/v2',
             token=self.token,
-            timeout=30.0,
+            timeout=REQUEST_TIMEOUT,
             verify_ssl=True,
-            raise_on_unexpected_status=True
+            raise_on_unexpected_status=True,
+            httpx_args={'http2': HTTP2_AVAILABLE, 'limits': CONNECTION_LIMITS}
         )
         
         # Initialize state
         self.agent: Optional[Agent] = None
-        self.rate_limiter = RateLimiter()
+        self.rate_limiter = RateLimiter(api_semaphore)
         
     async def initialize(self) -> None:
         """Initialize agent state and verify connection
@@ -59,6 +92,7 @@ class AgentManager:
         except Exception as e:
             raise Exception(f'Failed to initialize agent state: {e}')
             
+    @ttl_cache(STATUS_TTL)
     async def get_agent_status(self) -> Agent:
         """Get current agent status
         
@@ -87,4 +121,8 @@ class AgentManager:
             # Wrap any error with our standard message
             if str(e).startswith('Failed to get agent status'):
                 raise
-            raise Exception(f'Failed to get agent status: {e}')
\ No newline at end of file
+            raise Exception(f'Failed to get agent status: {e}')
+
+    async def aclose(self) -> None:
+        """Close the shared HTTP connection pool"""
+        await self.client.get_async_httpx_client().aclose()
@@ -9,6 +9,7 @@ import logging
 
 from space_traders_api_client import AuthenticatedClient
 from space_traders_api_client.models.contract import Contract
+from space_traders_api_client.models.deliver_contract_body import DeliverContractBody
 from space_traders_api_client.models.ship import Ship
 from space_traders_api_client.models.ship_nav_status import ShipNavStatus
 from space_traders_api_client.models.navigate_ship_body import NavigateShipBody
@@ -35,9 +36,12 @@ from space_traders_api_client.api.systems import (
     get_systems
 )
 
+from .agent_manager import AgentManager
 from .mining import MiningManager # Updated import
+from .pagination import fetch_all_pages
 from .shipyard import ShipyardManager
 from .rate_limiter import RateLimiter
+from .ttl_cache import invalidate, ttl_cache
 from .fleet_manager import FleetManager
 from .system_manager import SystemManager
 
@@ -46,41 +50,72 @@ logger = logging.getLogger(__name__)
 
 class ContractManager:
     """Manages contract operations and fulfillment"""
+
+    CONTRACTS_TTL = 3.0  # Seconds a contracts refresh is reused within a cycle
     
-    def __init__(self, client: AuthenticatedClient):
+    def __init__(
+        self,
+        client: AuthenticatedClient,
+        api_semaphore: Optional[asyncio.Semaphore] = None,
+        fleet_manager: Optional[FleetManager] = None,
+        agent_manager: Optional[AgentManager] = None
+    ):
         """Initialize ContractManager
         
         Args:
             client: Authenticated API client
+            api_semaphore: Optional semaphore shared by all managers to bound
+                concurrent API requests
+            fleet_manager: The fleet manager whose ship locks guard the ships
+                this manager commands; a private one is created if omitted
+            agent_manager: Agent manager whose cached status is dropped
+                when a ship purchase spends credits
         """
         self.client = client
         self.contracts: Dict[str, Contract] = {}
-        self.shipyard_manager = ShipyardManager(client)
-        self.rate_limiter = RateLimiter()
+        self.api_semaphore = api_semaphore
+        self.fleet_manager = fleet_manager or FleetManager(client, api_semaphore)
+        self.shipyard_manager = ShipyardManager(
+            client,
+            api_semaphore,
+            fleet_manager=self.fleet_manager,
+            agent_manager=agent_manager
+        )
+        self.rate_limiter = RateLimiter(api_semaphore)
         
+    @ttl_cache(CONTRACTS_TTL)
     async def update_contracts(self) -> None:
-        """Update the list of available contracts"""
+        """Update the list of available contracts
+
+        Fetches the first page of contracts, then any remaining pages
+        concurrently.
+        """
         try:
-            response = await self.rate_limiter.execute_with_retry(
-                get_contracts.asyncio_detailed,
-                task_name="update_contracts",
-                client=self.client
+            contracts = await fetch_all_pages(
+                self._get_contracts_page,
+                'contracts'
             )
-            
-            if response.status_code == 200 and response.parsed:
-                self.contracts = {
-                    contract.id: contract
-                    for contract in response.parsed.data
-                }
-                logger.info(f"Found {len(self.contracts)} active contracts")
-            else:
-                # Log error but don't throw exception
-                logger.error(f"Failed to get contracts: {response.status_code}")
-                self.contracts = {}  # Clear contracts on error
+            # Update in place so existing references see the refresh
+            for stale_id in self.contracts.keys() - {c.id for c in contracts}:
+                del self.contracts[stale_id]
+            for contract in contracts:
+                self.contracts[contract.id] = contract
+            logger.info(f"Found {len(self.contracts)} active contracts")
                 
         except Exception as e:
+            # Log error but don't throw exception
             logger.error(f"Error updating contracts: {e}")
-            self.contracts = {}  # Clear contracts on error
+            self.contracts.clear()  # Clear contracts on error
+
+    async def _get_contracts_page(self, page: int, limit: int):
+        """Request one page of the agent's contracts"""
+        return await self.rate_limiter.execute_with_retry(
+            get_contracts.asyncio_detailed,
+            task_name="update_contracts",
+            client=self.client,
+            page=page,
+            limit=limit
+        )
                 
     async def accept_contract(self, contract_id: str) -> bool:
         """Accept a contract by ID"""
@@ -93,6 +128,7 @@ class ContractManager:
         
         if response.status_code == 200:
             logger.info(f"Successfully accepted contract {contract_id}")
+            invalidate(self, 'update_contracts')
             await self.update_contracts()  # Refresh contracts
             return True
         else:
@@ -114,36 +150,39 @@ class ContractManager:
             trade_symbol: Symbol of the trade good
             units: Number of units to deliver
         """
-        # First dock the ship
-        dock_response = await self.rate_limiter.execute_with_retry(
-            dock_ship.asyncio_detailed,
-            task_name="dock_ship_for_delivery",
-            ship_symbol=ship_symbol,
-            client=self.client
-        )
+        # Hold the ship so its worker can't move it between dock and delivery
+        async with self.fleet_manager.ship_lock(ship_symbol):
+            # First dock the ship
+            dock_response = await self.rate_limiter.execute_with_retry(
+                dock_ship.asyncio_detailed,
+                task_name="dock_ship_for_delivery",
+                ship_symbol=ship_symbol,
+                client=self.client
+            )
         
-        if dock_response.status_code != 200:
-            logger.error(f"Failed to dock ship: {dock_response.status_code}")
-            return False
+            if dock_response.status_code != 200:
+                logger.error(f"Failed to dock ship: {dock_response.status_code}")
+                return False
         
-        # Then deliver the cargo
-        response = await self.rate_limiter.execute_with_retry(
-            deliver_contract.asyncio_detailed,
-            task_name="deliver_contract_cargo",
-            contract_id=contract_id,
-            client=self.client,
-            json_body={
-                "shipSymbol": ship_symbol,
-                "tradeSymbol": trade_symbol,
-                "units": units
-            }
-        )
+            # Then deliver the cargo
+            response = await self.rate_limiter.execute_with_retry(
+                deliver_contract.asyncio_detailed,
+                task_name="deliver_contract_cargo",
+                contract_id=contract_id,
+                client=self.client,
+                body=DeliverContractBody(
+                    ship_symbol=ship_symbol,
+                    trade_symbol=trade_symbol,
+                    units=units
+                )
+            )
         
         if response.status_code == 200:
             logger.info(
                 f"Successfully delivered {units} units of {trade_symbol} "
                 f"for contract {contract_id}"
             )
+            invalidate(self, 'update_contracts')
             return True
         else:
             logger.error(f"Failed to deliver cargo: {response.status_code}")
@@ -162,6 +201,7 @@ class ContractManager:
         
         if response.status_code == 200:
             logger.info(f"Successfully fulfilled contract {contract_id}")
+            invalidate(self, 'update_contracts')
             await self.update_contracts()  # Refresh contracts
             return True
         else:
@@ -209,54 +249,62 @@ class ContractManager:
                 await self.fulfill_contract(contract.id)
                 return
             
-            # Not yet fulfilled, process requirements
-            if not hasattr(contract_details.terms, 'deliver'):
+            # Not yet fulfilled; project the outstanding deliveries once
+            try:
+                outstanding = [
+                    (
+                        delivery.trade_symbol,
+                        delivery.destination_symbol,
+                        delivery.units_required - delivery.units_fulfilled
+                    )
+                    for delivery in contract_details.terms.deliver
+                    if delivery.units_fulfilled < delivery.units_required
+                ]
+            except AttributeError:
                 logger.error('Contract has no delivery requirements')
                 return
+            if not outstanding:
+                return
+                
+            # Get ships capable of mining and hauling, once for all deliveries
+            mining_ships, hauler_ships = self.fleet_manager.get_ships_by_type()
+
+            for trade_symbol, destination_symbol, remaining in outstanding:
+                logger.info(
+                    f"Processing delivery: {remaining} units of "
+                    f"{trade_symbol} to {destination_symbol}"
+                )
                 
-            for delivery in contract_details.terms.deliver:
-                if delivery.units_fulfilled < delivery.units_required:
-                    remaining = delivery.units_required - delivery.units_fulfilled
-                    logger.info(
-                        f"Processing delivery: {remaining} units of "
-                        f"{delivery.trade_symbol} to {delivery.destination_symbol}"
+                if not mining_ships:
+                    logger.info("No mining ships available, attempting to purchase one...")
+                    current_system = next(iter(ships.values())).nav.system_symbol
+                    purchase_response = await self.shipyard_manager.purchase_mining_ship(
+                        system_symbol=current_system
                     )
-                    
-                    # Get ships capable of mining and hauling
-                    fleet_manager = FleetManager(self.client)
-                    mining_ships, hauler_ships = fleet_manager.get_ships_by_type()
-                    
-                    if not mining_ships:
-                        logger.info("No mining ships available, attempting to purchase one...")
-                        current_system = next(iter(ships.values())).nav.system_symbol
-                        purchase_response = await self.shipyard_manager.purchase_mining_ship(
-                            system_symbol=current_system
-                        )
-                        if not purchase_response:
-                            logger.error("Failed to acquire mining ship")
-                            return
-                        else:
-                            logger.info("Mining ship purchased, restart processing with updated fleet")
-                            return
-                            
-                    if not hauler_ships:
-                        logger.info("No hauler ships available, attempting to purchase one...")
-                        current_system = mining_ships[0].nav.system_symbol
-                        purchase_response = await self.shipyard_manager.purchase_command_ship(
-                            system_symbol=current_system,
-                            min_cargo_capacity=remaining
-                        )
-                        if not purchase_response:
-                            logger.error("Failed to acquire hauler ship")
-                            return
-                        else:
-                            logger.info("Hauler ship purchased, restart processing with updated fleet")
-                            return
-                            
-                    # Process with each mining ship...
-                    return  # TODO: Implement full mining and delivery logic
+                    if not purchase_response:
+                        logger.error("Failed to acquire mining ship")
+                        return
+                    else:
+                        logger.info("Mining ship purchased, restart processing with updated fleet")
+                        return
+                        
+                if not hauler_ships:
+                    logger.info("No hauler ships available, attempting to purchase one...")
+                    current_system = mining_ships[0].nav.system_symbol
+                    purchase_response = await self.shipyard_manager.purchase_command_ship(
+                        system_symbol=current_system,
+                        min_cargo_capacity=remaining
+                    )
+                    if not purchase_response:
+                        logger.error("Failed to acquire hauler ship")
+                        return
+                    else:
+                        logger.info("Hauler ship purchased, restart processing with updated fleet")
+                        return
+                        
+                # Process with each mining ship...
+                return  # TODO: Implement full mining and delivery logic
                     
         except Exception as e:
             contract_id = contract.id if hasattr(contract, 'id') else 'unknown'
-            logger.error(f'Error processing contract {contract_id}: {e}')
-            logger.error('Full traceback:', exc_info=True)
\ No newline at end of file
+            logger.exception(f'Error processing contract {contract_id}: {e}')
\ No newline at end of file
@@ -3,11 +3,14 @@ Fleet and navigation management for SpaceTraders
 """
 import asyncio
 import logging
+from datetime import datetime, timezone
 from typing import Dict, Optional, List, Tuple
 
 from space_traders_api_client import AuthenticatedClient
+from space_traders_api_client.errors import UnexpectedStatus
 from space_traders_api_client.api.fleet import (
     dock_ship,
+    get_my_ship,
     get_my_ships,
     navigate_ship,
     orbit_ship,
@@ -20,45 +23,100 @@ from space_traders_api_client.models.navigate_ship_body import NavigateShipBody
 from space_traders_api_client.models.refuel_ship_body import RefuelShipBody
 from space_traders_api_client.models.transfer_cargo_transfer_cargo_request import TransferCargoTransferCargoRequest
 
+from .pagination import fetch_all_pages
 from .rate_limiter import RateLimiter
+from .ttl_cache import invalidate, ttl_cache
 
 logger = logging.getLogger(__name__)
 
 
 class FleetManager:
     """Manages ship operations and navigation"""
+
+    FLEET_TTL = 3.0  # Seconds a fleet refresh is reused within a cycle
     
-    def __init__(self, client: AuthenticatedClient):
+    def __init__(
+        self,
+        client: AuthenticatedClient,
+        api_semaphore: Optional[asyncio.Semaphore] = None
+    ):
         """Initialize FleetManager
         
         Args:
             client: Authenticated API client
+            api_semaphore: Optional semaphore shared by all managers to bound
+                concurrent API requests
         """
         self.client = client
         self.ships: Dict[str, Ship] = {}
-        self.rate_limiter = RateLimiter()
+        self.rate_limiter = RateLimiter(api_semaphore)
+        # Bumped whenever self.ships changes so ship_list() can reuse its tuple
+        self._ships_version = 0
+        self._ship_list: Tuple[Ship, ...] = ()
+        self._ship_list_version = 0
+        # Held while a ship is being commanded, so two callers never
+        # interleave orders to the same ship
+        self._ship_locks: Dict[str, asyncio.Lock] = {}
+
+    def ship_lock(self, ship_symbol: str) -> asyncio.Lock:
+        """Get the lock serializing commands to a ship
+
+        Args:
+            ship_symbol: Symbol of the ship
+
+        Returns:
+            The ship's lock, created on first use
+        """
+        lock = self._ship_locks.get(ship_symbol)
+        if lock is None:
+            lock = self._ship_locks[ship_symbol] = asyncio.Lock()
+        return lock
+
+    def ship_list(self) -> Tuple[Ship, ...]:
+        """Get a snapshot of the fleet, rebuilt only after the fleet changes
 
+        Returns:
+            Tuple of ships, safe to iterate while the fleet is refreshed
+        """
+        if (
+            self._ship_list_version != self._ships_version
+            or len(self._ship_list) != len(self.ships)
+        ):
+            self._ship_list = tuple(self.ships.values())
+            self._ship_list_version = self._ships_version
+        return self._ship_list
+
+    @ttl_cache(FLEET_TTL)
     async def update_fleet(self) -> None:
         """Update status of all ships
+
+        Fetches the first page of ships, then any remaining pages
+        concurrently, so one refresh covers the whole fleet.
         
         Raises:
             Exception: If unable to retrieve ship data after retries
         """
-        response = await self.rate_limiter.execute_with_retry(
+        ships = await fetch_all_pages(self._get_ships_page, 'ships')
+
+        # Update in place so existing references see the refresh
+        for stale_symbol in self.ships.keys() - {ship.symbol for ship in ships}:
+            del self.ships[stale_symbol]
+            self._ship_locks.pop(stale_symbol, None)
+        for ship in ships:
+            self.ships[ship.symbol] = ship
+        self._ships_version += 1
+        ship_list = "\n".join(f"- {symbol}" for symbol in self.ships.keys())
+        logger.info(f"Updated fleet status. Current ships:\n{ship_list}")
+
+    async def _get_ships_page(self, page: int, limit: int):
+        """Request one page of the agent's ships"""
+        return await self.rate_limiter.execute_with_retry(
             get_my_ships.asyncio_detailed,
             task_name="update_fleet",
-            client=self.client
+            client=self.client,
+            page=page,
+            limit=limit
         )
-        
-        if response.status_code == 200 and response.parsed:
-            self.ships = {
-                ship.symbol: ship
-                for ship in response.parsed.data
-            }
-            ship_list = "\n".join(f"- {symbol}" for symbol in self.ships.keys())
-            logger.info(f"Updated fleet status. Current ships:\n{ship_list}")
-        else:
-            raise Exception(f'Failed to get ships (code: {response.status_code})')
 
     def get_ships_by_type(self) -> Tuple[List[Ship], List[Ship]]:
         """Separate ships into mining and command ships based on role and equipment
@@ -179,7 +237,7 @@ class FleetManager:
             task_name="transfer_cargo",
             ship_symbol=from_ship.symbol,
             client=self.client,
-            json_body=transfer_body
+            body=transfer_body
         )
         
         if response.status_code == 200:
@@ -237,6 +295,11 @@ class FleetManager:
         
         if response.status_code == 200:
             logger.info(f"Successfully initiated navigation to {waypoint_symbol}")
+            invalidate(self, 'update_fleet')
+            if response.parsed:
+                # Keep the arrival time so wait_for_arrival can sleep until it
+                ship.nav = response.parsed.data.nav
+                ship.fuel = response.parsed.data.fuel
             return True
         else:
             logger.error(f"Navigation failed: {response.status_code}")
@@ -262,6 +325,7 @@ class FleetManager:
         
         if response.status_code == 200:
             logger.info(f"Successfully docked ship {ship_symbol}")
+            invalidate(self, 'update_fleet')
             return True
         else:
             logger.error(f"Failed to dock ship {ship_symbol}: {response.status_code}")
@@ -317,6 +381,7 @@ class FleetManager:
         
         if response.status_code == 200:
             logger.info(f"Successfully moved ship {ship_symbol} to orbit")
+            invalidate(self, 'update_fleet')
             return True
         else:
             logger.error(f"Failed to move ship {ship_symbol} to orbit: {response.status_code}")
@@ -326,6 +391,9 @@ class FleetManager:
         
     async def wait_for_arrival(self, ship_symbol: str) -> Optional[Ship]:
         """Wait for ship to arrive at destination
+
+        Sleeps until the route's arrival time, then confirms with a single
+        ship request. Polling only continues if the ship is still in transit.
         
         Args:
             ship_symbol: Symbol of the ship to wait for
@@ -333,33 +401,37 @@ class FleetManager:
         Returns:
             Ship object if arrived successfully, None if error or timeout
         """
-        max_attempts = 30  # 5 minutes with 10s sleep
+        max_attempts = 30
         attempts = 0
+        ship = self.ships.get(ship_symbol)
         
         while attempts < max_attempts:
+            # Sleep until the expected arrival instead of polling the whole trip
+            if ship and ship.nav.status == ShipNavStatus.IN_TRANSIT:
+                delay = self._seconds_until_arrival(ship)
+                logger.info(f"Ship {ship_symbol} arrives in {delay:.0f}s")
+                await asyncio.sleep(delay)
+
             try:
-                # Update fleet status to get latest ship info
                 response = await self.rate_limiter.execute_with_retry(
-                    get_my_ships.asyncio_detailed,
+                    get_my_ship.asyncio_detailed,
                     task_name="check_ship_arrival",
+                    ship_symbol=ship_symbol,
                     client=self.client
                 )
                 
+                if response.status_code == 404:
+                    logger.error(f"Ship {ship_symbol} not found")
+                    return None
                 if response.status_code != 200 or not response.parsed:
                     logger.error(f"Failed to get ship status: {response.status_code}")
                     await asyncio.sleep(1)
                     attempts += 1
                     continue
                     
-                ship = next(
-                    (s for s in response.parsed.data
-                     if s.symbol == ship_symbol),
-                    None
-                )
-                
-                if not ship:
-                    logger.error(f"Ship {ship_symbol} not found")
-                    return None
+                ship = response.parsed.data
+                self.ships[ship_symbol] = ship
+                self._ships_version += 1
                     
                 if ship.nav.status != ShipNavStatus.IN_TRANSIT:
                     logger.info(f"Ship {ship_symbol} has arrived at {ship.nav.waypoint_symbol}")
@@ -369,13 +441,28 @@ class FleetManager:
                     f'Ship {ship_symbol} in transit to {ship.nav.waypoint_symbol}... '
                     f'({attempts + 1}/{max_attempts})'
                 )
-                await asyncio.sleep(10)
                 attempts += 1
                 
             except Exception as e:
-                logger.error(f"Error checking ship arrival: {e}", exc_info=True)
+                if isinstance(e, UnexpectedStatus) and e.status_code == 404:
+                    # Raised, not returned, by clients that raise on status
+                    logger.error(f"Ship {ship_symbol} not found")
+                    return None
+                logger.exception(f"Error checking ship arrival: {e}")
                 await asyncio.sleep(1)
                 attempts += 1
                 
         logger.error(f'Timeout waiting for ship {ship_symbol} to arrive')
-        return None
\ No newline at end of file
+        return None
+
+    @staticmethod
+    def _seconds_until_arrival(ship: Ship) -> float:
+        """Get seconds until a ship's expected arrival, at least one"""
+        try:
+            delay = (
+                ship.nav.route.arrival - datetime.now(timezone.utc)
+            ).total_seconds()
+        except (AttributeError, TypeError):
+            # No usable arrival time, fall back to a fixed poll interval
+            return 10.0
+        return max(delay, 1.0)
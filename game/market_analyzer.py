@@ -1,6 +1,7 @@
 """
 Market analysis and trading opportunity detection
 """
+import heapq
 from typing import Dict, List, Optional, Tuple
 from dataclasses import dataclass
 from datetime import datetime, timedelta
@@ -148,6 +149,9 @@ class TradeOpportunity:
 class MarketAnalyzer:
     """Analyzes market data and identifies trading opportunities"""
 
+    # Trends use a window ending now, so memoized insights go stale over time
+    INSIGHTS_TTL = timedelta(minutes=5)
+
     def __init__(
         self,
         cache_duration: timedelta = timedelta(hours=1)
@@ -158,6 +162,12 @@ class MarketAnalyzer:
         ] = {}
         self.market_cache: Dict[str, Tuple[datetime, Market]] = {}
         self.cache_duration = cache_duration
+        # Market symbol -> data version, bumped on every update
+        self._market_versions: Dict[str, int] = {}
+        # Market symbol -> (data version, computed at, insights)
+        self._insights_cache: Dict[
+            str, Tuple[int, datetime, Dict[str, any]]
+        ] = {}
 
     def update_market_data(
         self,
@@ -170,6 +180,9 @@ class MarketAnalyzer:
 
         # Update market cache
         self.market_cache[market.symbol] = (timestamp, market)
+        self._market_versions[market.symbol] = (
+            self._market_versions.get(market.symbol, 0) + 1
+        )
 
         # Initialize price history for market if needed
         if market.symbol not in self.price_history:
@@ -199,9 +212,20 @@ class MarketAnalyzer:
         self,
         markets: List[Market],
         min_profit_margin: float = 0.1,
-        max_distance: int = 100
+        max_distance: int = 100,
+        top_k: Optional[int] = None
     ) -> List[TradeOpportunity]:
-        """Identify profitable trade opportunities between markets"""
+        """Identify profitable trade opportunities between markets
+
+        Args:
+            markets: Markets to compare
+            min_profit_margin: Minimum profit margin to include
+            max_distance: Maximum distance between markets
+            top_k: Only return this many best opportunities, if set
+
+        Returns:
+            Opportunities ordered by score, best first
+        """
         opportunities = []
 
         for source_market in markets:
@@ -264,14 +288,32 @@ class MarketAnalyzer:
                     opportunities.append(opportunity)
 
         # Sort by opportunity score
-        opportunities.sort(key=lambda x: x.score(), reverse=True)
+        if top_k is not None:
+            return heapq.nlargest(
+                top_k, opportunities, key=TradeOpportunity.score
+            )
+        opportunities.sort(key=TradeOpportunity.score, reverse=True)
         return opportunities
 
     def get_market_insights(self, market_symbol: str) -> Dict[str, any]:
-        """Get market analysis insights"""
+        """Get market analysis insights
+
+        Insights are recomputed after the market's data has changed, or
+        once INSIGHTS_TTL has passed so snapshots age out of the trend window.
+        """
         if market_symbol not in self.price_history:
             return {}
 
+        version = self._market_versions.get(market_symbol, 0)
+        now = datetime.now()
+        cached = self._insights_cache.get(market_symbol)
+        if (
+            cached is not None
+            and cached[0] == version
+            and now - cached[1] < self.INSIGHTS_TTL
+        ):
+            return cached[2]
+
         insights = {
             "price_trends": {},
             "trading_volume": {},
@@ -316,4 +358,10 @@ class MarketAnalyzer:
                     "Strong downward price trend"
                 )
 
+        # Rendered once per data version so callers can log it directly
+        insights["recommendations_text"] = "\n- ".join(
+            insights["recommendations"]
+        )
+
+        self._insights_cache[market_symbol] = (version, now, insights)
         return insights
\ No newline at end of file
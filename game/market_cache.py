@@ -0,0 +1,198 @@
+"""
+Two-tier (memory + disk) cache for market data
+"""
+import asyncio
+import logging
+import os
+import tempfile
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import Optional
+
+from space_traders_api_client import json_codec
+from space_traders_api_client.models.market import Market
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class CacheEntry:
+    """A cached market with its expiry and access bookkeeping"""
+    market: Market
+    expires_at: float  # time.monotonic() deadline
+    access_count: int = 0
+    last_accessed: float = 0.0
+
+
+class MarketCache:
+    """LRU memory cache backed by optional hourly JSON files on disk
+
+    Memory entries expire after ``ttl`` seconds. Disk entries are stored as
+    ``{cache_dir}/{waypoint}/{yyyymmddhh}.json`` and are used while younger
+    than ``ttl`` seconds, so a restart can reuse recently fetched markets.
+    Shards are replaced atomically and pruned once older than ``ttl``.
+    """
+
+    def __init__(
+        self,
+        ttl: float,
+        max_entries: int = 256,
+        cache_dir: Optional[Path] = None
+    ):
+        """Initialize MarketCache
+
+        Args:
+            ttl: Seconds a market stays fresh
+            max_entries: Maximum markets held in memory
+            cache_dir: Directory for the disk tier, disabled if None
+        """
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.cache_dir = cache_dir
+        self._entries: "OrderedDict[str, CacheEntry]" = OrderedDict()
+        self._last_prune = 0.0  # time.time() of the last disk sweep
+
+    def get(self, waypoint_symbol: str) -> Optional[Market]:
+        """Get a fresh market from memory
+
+        Args:
+            waypoint_symbol: Symbol of the market waypoint
+
+        Returns:
+            The market, or None if missing or expired
+        """
+        entry = self._entries.get(waypoint_symbol)
+        if entry is None:
+            return None
+        now = time.monotonic()
+        if entry.expires_at <= now:
+            del self._entries[waypoint_symbol]
+            return None
+        entry.access_count += 1
+        entry.last_accessed = now
+        self._entries.move_to_end(waypoint_symbol)
+        return entry.market
+
+    def peek(self, waypoint_symbol: str) -> Optional[Market]:
+        """Get a fresh market from memory without touching its entry
+
+        Unlike get(), neither LRU order nor access bookkeeping changes, and
+        an expired entry is left for get() or put() to replace.
+
+        Args:
+            waypoint_symbol: Symbol of the market waypoint
+
+        Returns:
+            The market, or None if missing or expired
+        """
+        entry = self._entries.get(waypoint_symbol)
+        if entry is None or entry.expires_at <= time.monotonic():
+            return None
+        return entry.market
+
+    def is_expired(self, waypoint_symbol: str) -> bool:
+        """Check whether memory holds an expired entry for a waypoint"""
+        entry = self._entries.get(waypoint_symbol)
+        return entry is not None and entry.expires_at <= time.monotonic()
+
+    def put(self, waypoint_symbol: str, market: Market) -> None:
+        """Store a market in memory, evicting the least recently used
+
+        Args:
+            waypoint_symbol: Symbol of the market waypoint
+            market: Market data to cache
+        """
+        now = time.monotonic()
+        self._entries[waypoint_symbol] = CacheEntry(
+            market=market,
+            expires_at=now + self.ttl,
+            last_accessed=now
+        )
+        self._entries.move_to_end(waypoint_symbol)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    async def load(self, waypoint_symbol: str) -> Optional[Market]:
+        """Get a fresh market from disk, promoting it into memory
+
+        Args:
+            waypoint_symbol: Symbol of the market waypoint
+
+        Returns:
+            The market, or None if the disk tier has no fresh copy
+        """
+        if self.cache_dir is None:
+            return None
+        try:
+            market = await asyncio.to_thread(self._read, waypoint_symbol)
+        except Exception as e:
+            logger.warning(f"Error reading cached market {waypoint_symbol}: {e}")
+            return None
+        if market is not None:
+            self.put(waypoint_symbol, market)
+        return market
+
+    async def store(self, waypoint_symbol: str, market: Market) -> None:
+        """Write a market through to memory and disk
+
+        Args:
+            waypoint_symbol: Symbol of the market waypoint
+            market: Market data to cache
+        """
+        self.put(waypoint_symbol, market)
+        if self.cache_dir is None:
+            return
+        try:
+            await asyncio.to_thread(self._write, waypoint_symbol, market)
+        except Exception as e:
+            logger.warning(f"Error writing cached market {waypoint_symbol}: {e}")
+
+    def _path(self, waypoint_symbol: str, timestamp: float) -> Path:
+        """Get the hourly shard path for a waypoint"""
+        bucket = datetime.fromtimestamp(timestamp).strftime("%Y%m%d%H")
+        return self.cache_dir / waypoint_symbol / f"{bucket}.json"
+
+    def _read(self, waypoint_symbol: str) -> Optional[Market]:
+        """Read a market from the current hourly shard if still fresh"""
+        now = time.time()
+        path = self._path(waypoint_symbol, now)
+        if not path.exists():
+            return None
+        with open(path, 'rb') as f:
+            data = json_codec.loads(f.read())
+        if now - data['fetched_at'] >= self.ttl:
+            return None
+        return Market.from_dict(data['market'])
+
+    def _write(self, waypoint_symbol: str, market: Market) -> None:
+        """Write a market to its hourly shard, pruning stale shards"""
+        now = time.time()
+        path = self._path(waypoint_symbol, now)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        # Write then rename so a crash never leaves a truncated shard
+        fd, tmp_name = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                f.write(json_codec.dumps(
+                    {'fetched_at': now, 'market': market.to_dict()}
+                ))
+            os.replace(tmp_name, path)
+        except BaseException:
+            os.unlink(tmp_name)
+            raise
+        if now - self._last_prune >= self.ttl:
+            self._last_prune = now
+            self._prune(now)
+
+    def _prune(self, now: float) -> None:
+        """Delete shards and leftover temp files older than the TTL"""
+        for path in self.cache_dir.glob("*/*"):
+            try:
+                if now - path.stat().st_mtime >= self.ttl:
+                    path.unlink()
+            except OSError:
+                # Removed by a concurrent prune
+                continue
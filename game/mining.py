@@ -1,3 +1,4 @@
+import asyncio
 import logging
 from typing import Dict, List, Optional
 from datetime import datetime
@@ -7,7 +8,7 @@ from dataclasses import dataclass, field
 from space_traders_api_client.models.survey import Survey
 from space_traders_api_client.models.extraction import Extraction
 from space_traders_api_client.api.fleet import create_survey, extract_resources
-# Removed: from space_traders_api_client.models.extract_resources_body import ExtractResourcesBody # Not used directly in this file after changes
+from space_traders_api_client.models.extract_resources_body import ExtractResourcesBody
 from space_traders_api_client.models.waypoint_type import WaypointType # Added
 from space_traders_api_client.models.ship import Ship # Added
 from space_traders_api_client.models.waypoint import Waypoint # Added
@@ -41,18 +42,25 @@ class MiningTarget:
 class MiningManager: # Renamed from SurveyManager to MiningManager for broader scope
     """Manages mining operations, including finding sites and survey management."""
     
-    def __init__(self, client, system_manager: SystemManager): # Added system_manager
+    def __init__(
+        self,
+        client,
+        system_manager: SystemManager, # Added system_manager
+        api_semaphore: Optional[asyncio.Semaphore] = None
+    ):
         """Initialize the mining manager
         
         Args:
             client: The authenticated SpaceTraders client
             system_manager: The manager for system and waypoint data
+            api_semaphore: Optional semaphore shared by all managers to bound
+                concurrent API requests
         """
         self.client = client
         self.system_manager = system_manager # Store SystemManager instance
         self.active_surveys: Dict[str, Survey] = {}  # signature -> Survey
         self.extraction_history: List[ExtractionResult] = []
-        self.rate_limiter = RateLimiter()
+        self.rate_limiter = RateLimiter(api_semaphore)
         
     def add_survey(self, survey: Survey) -> None:
         """Add a new survey to tracking"""
@@ -257,7 +265,7 @@ class MiningManager: # Renamed from SurveyManager to MiningManager for broader s
         current_waypoint_symbol = ship.nav.waypoint_symbol
         logger.info(f"Ship {ship.symbol} attempting extraction at {current_waypoint_symbol}...")
 
-        json_body = {}
+        body = ExtractResourcesBody()
         if survey:
             # Validate survey: check expiration and if it's for the current waypoint
             if datetime.now() >= survey.expiration.replace(tzinfo=None):
@@ -270,7 +278,7 @@ class MiningManager: # Renamed from SurveyManager to MiningManager for broader s
                 survey = None # Do not use survey for wrong location
             else:
                 logger.info(f"Using survey {survey.signature} for extraction by {ship.symbol}.")
-                json_body = {"survey": survey.to_dict()}
+                body = ExtractResourcesBody(survey=survey)
 
         if not survey:
             logger.info(f"No valid survey provided or found for {ship.symbol} at {current_waypoint_symbol}. Performing regular extraction.")
@@ -280,7 +288,7 @@ class MiningManager: # Renamed from SurveyManager to MiningManager for broader s
             task_name=f"extract_resources_{ship.symbol}",
             ship_symbol=ship.symbol,
             client=self.client,
-            json_body=json_body if json_body else None # Pass None if no survey
+            body=body
         )
         
         if response.status_code == 201 and response.parsed:
@@ -0,0 +1,51 @@
+"""
+Helpers for reading every page of a paginated API endpoint
+"""
+import asyncio
+from typing import Any, Awaitable, Callable, List
+
+# Largest page size the SpaceTraders API accepts
+PAGE_LIMIT = 20
+
+
+async def fetch_all_pages(
+    fetch_page: Callable[[int, int], Awaitable[Any]],
+    description: str,
+    page_limit: int = PAGE_LIMIT
+) -> List[Any]:
+    """Fetch the first page, then every remaining page concurrently
+
+    Args:
+        fetch_page: Coroutine function taking (page, limit) and returning
+            the API response for that page
+        description: What is being fetched, used in error messages
+        page_limit: Items requested per page
+
+    Returns:
+        Items from every page, in page order
+
+    Raises:
+        Exception: If any page does not return parsed data
+    """
+    response = await fetch_page(1, page_limit)
+    _check_page(response, description)
+
+    items = list(response.parsed.data)
+    page_count = -(-response.parsed.meta.total // page_limit)  # Ceiling division
+    if page_count > 1:
+        responses = await asyncio.gather(*(
+            fetch_page(page, page_limit)
+            for page in range(2, page_count + 1)
+        ))
+        for page_response in responses:
+            _check_page(page_response, description)
+            items.extend(page_response.parsed.data)
+    return items
+
+
+def _check_page(response: Any, description: str) -> None:
+    """Raise if a page response failed"""
+    if response.status_code != 200 or not response.parsed:
+        raise Exception(
+            f'Failed to get {description} (code: {response.status_code})'
+        )
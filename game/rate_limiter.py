@@ -8,6 +8,8 @@ from typing import Optional, Dict, Any
 from datetime import datetime, timezone
 import logging
 
+from space_traders_api_client.errors import UnexpectedStatus
+
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
@@ -15,8 +17,13 @@ logger = logging.getLogger(__name__)
 class RateLimiter:
     """Manages API rate limiting"""
     
-    def __init__(self):
-        """Initialize rate limiter"""
+    def __init__(self, semaphore: Optional[asyncio.Semaphore] = None):
+        """Initialize rate limiter
+
+        Args:
+            semaphore: Optional semaphore shared between rate limiters to
+                bound the total number of in-flight API requests
+        """
         self.burst_limit = 30
         self.rate_per_second = 2
         self.min_request_interval = 1 / self.rate_per_second
@@ -27,6 +34,7 @@ class RateLimiter:
         self._request_queue = asyncio.Queue()
         self._queue_processor_task = None
         self._running = True
+        self._semaphore = semaphore
 
     async def start_queue_processor(self):
         """Start the queue processor if not already running"""
@@ -55,7 +63,11 @@ class RateLimiter:
                 
                 # Execute request
                 try:
-                    result = await callback(*args, **kwargs)
+                    if self._semaphore is not None:
+                        async with self._semaphore:
+                            result = await callback(*args, **kwargs)
+                    else:
+                        result = await callback(*args, **kwargs)
                     if not future.cancelled():
                         future.set_result(result)
                 except Exception as e:
@@ -164,6 +176,7 @@ class RateLimiter:
             Result from callback
         
         Raises:
+            UnexpectedStatus: On a client error other than 429, without retrying
             Exception: If all retries fail
         """
         attempt = 0
@@ -209,6 +222,16 @@ class RateLimiter:
                     
             except Exception as e:
                 last_error = e
+                if isinstance(e, UnexpectedStatus) and e.status_code == 429:
+                    # Clients that raise on unexpected status surface 429s
+                    # here; wait out the limit outside the request queue
+                    retry_after = await self.handle_response(e)
+                    await asyncio.sleep(retry_after)
+                    attempt += 1
+                    continue
+                if isinstance(e, UnexpectedStatus) and e.status_code < 500:
+                    # Client errors will fail again; let the caller see them
+                    raise
                 logger.error(
                     f"{task_name} error (attempt {attempt + 1}/{max_retries}): {e}"
                 )
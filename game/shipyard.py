@@ -4,6 +4,8 @@ Shipyard management for purchasing and configuring ships
 from typing import Optional, List, Dict, Tuple
 import json
 import asyncio
+import logging
+import time
 
 from space_traders_api_client import AuthenticatedClient
 from space_traders_api_client.models.ship_mount import ShipMount
@@ -13,11 +15,13 @@ from space_traders_api_client.models.waypoint_trait_symbol import WaypointTraitS
 from space_traders_api_client.models.ship_mount_symbol import ShipMountSymbol
 from space_traders_api_client.models.install_mount_install_mount_request import InstallMountInstallMountRequest
 from space_traders_api_client.models.refuel_ship_body import RefuelShipBody
+from space_traders_api_client.models.navigate_ship_body import NavigateShipBody
+from space_traders_api_client.models.purchase_ship_body import PurchaseShipBody
+from space_traders_api_client.models.ship_type import ShipType
 from space_traders_api_client.api.fleet import (
     get_mounts,
     install_mount,
     purchase_ship,
-    get_my_ships,
     navigate_ship,
     orbit_ship,
     dock_ship,
@@ -29,6 +33,12 @@ from space_traders_api_client.api.systems import (
     get_systems,
 )
 
+from .agent_manager import AgentManager
+from .fleet_manager import FleetManager
+from .ttl_cache import invalidate
+
+logger = logging.getLogger(__name__)
+
 
 class ShipyardManager:
     """Manages shipyard operations and ship modifications"""
@@ -36,15 +46,46 @@ class ShipyardManager:
     MINING_SHIP_TYPES = ["SHIP_MINING_DRONE", "SHIP_MINER"]
     TRANSPORT_SHIP_TYPES = ["SHIP_LIGHT_HAULER", "SHIP_HEAVY_FREIGHTER"]
     RATE_LIMIT_DELAY = 0.5  # Delay between API calls to avoid rate limiting
+    SHIPYARD_CACHE_TTL = 3600  # Seconds to reuse a system's shipyard list
     
-    def __init__(self, client: AuthenticatedClient):
+    def __init__(
+        self,
+        client: AuthenticatedClient,
+        api_semaphore: Optional[asyncio.Semaphore] = None,
+        fleet_manager: Optional[FleetManager] = None,
+        agent_manager: Optional[AgentManager] = None
+    ):
         """Initialize ShipyardManager
         
         Args:
             client: Authenticated API client
+            api_semaphore: Optional semaphore shared by all managers to bound
+                concurrent API requests
+            fleet_manager: Fleet manager used to wait out ship travel; a
+                private one is created if omitted
+            agent_manager: Agent manager whose cached status is dropped
+                after a purchase spends credits
         """
         self.client = client
+        self._api_semaphore = api_semaphore
+        self.fleet_manager = fleet_manager or FleetManager(client, api_semaphore)
+        self.agent_manager = agent_manager
+        # system symbol -> (monotonic expiry, shipyard waypoint symbols)
+        self._shipyard_cache: Dict[str, Tuple[float, List[str]]] = {}
         
+    async def _request(self, endpoint, **kwargs):
+        """Call an endpoint, holding the shared API semaphore if one was given"""
+        if self._api_semaphore is None:
+            return await endpoint(**kwargs)
+        async with self._api_semaphore:
+            return await endpoint(**kwargs)
+
+    def _invalidate_after_purchase(self) -> None:
+        """Drop the cached fleet and agent refreshes a purchase made stale"""
+        invalidate(self.fleet_manager, 'update_fleet')
+        if self.agent_manager is not None:
+            invalidate(self.agent_manager, 'get_agent_status')
+
     async def get_ship_mounts(self, ship_symbol: str) -> List[ShipMount]:
         """Get current mounts on a ship
         
@@ -55,17 +96,18 @@ class ShipyardManager:
             List of currently installed mounts
         """
         try:
-            response = await get_mounts.asyncio_detailed(
+            response = await self._request(
+                get_mounts.asyncio_detailed,
                 ship_symbol=ship_symbol,
                 client=self.client
             )
             if response.status_code == 200 and response.parsed:
                 return response.parsed.data
             else:
-                print(f"Failed to get ship mounts: {response.status_code}")
+                logger.error("Failed to get ship mounts: %s", response.status_code)
                 return []
         except Exception as e:
-            print(f"Error getting ship mounts: {e}")
+            logger.exception("Error getting ship mounts: %s", e)
             return []
 
     async def install_mount(
@@ -83,20 +125,21 @@ class ShipyardManager:
             Transaction details if successful, None otherwise
         """
         try:
-            response = await install_mount.asyncio_detailed(
+            response = await self._request(
+                install_mount.asyncio_detailed,
                 ship_symbol=ship_symbol,
                 client=self.client,
-                json_body=body
+                body=body
             )
             if response.status_code == 201 and response.parsed:
-                print(f"Successfully installed mount on {ship_symbol}")
+                logger.info("Successfully installed mount on %s", ship_symbol)
                 return response.parsed.data.transaction
             else:
-                print(f"Failed to install mount: {response.status_code}")
-                print(f"Response: {response}")
+                logger.error("Failed to install mount: %s", response.status_code)
+                logger.error("Response: %s", response)
                 return None
         except Exception as e:
-            print(f"Error installing mount: {e}")
+            logger.exception("Error installing mount: %s", e)
             return None
             
     async def get_shipyard_info(self, waypoint: str) -> Optional[Dict]:
@@ -111,7 +154,8 @@ class ShipyardManager:
         try:
             await asyncio.sleep(self.RATE_LIMIT_DELAY)  # Rate limiting
             system = waypoint.split('-')[0] + '-' + waypoint.split('-')[1]  # Extract system from waypoint
-            response = await get_shipyard.asyncio_detailed(
+            response = await self._request(
+                get_shipyard.asyncio_detailed,
                 system_symbol=system,
                 waypoint_symbol=waypoint,
                 client=self.client
@@ -125,14 +169,14 @@ class ShipyardManager:
                     retry_after = error_data.get('error', {}).get('data', {}).get('retryAfter', 1)
                 except:
                     pass
-                print(f"Rate limited, waiting {retry_after} seconds...")
+                logger.warning("Rate limited, waiting %s seconds...", retry_after)
                 await asyncio.sleep(retry_after)
                 return await self.get_shipyard_info(waypoint)  # Retry
             else:
-                print(f"Failed to get shipyard info: {response.status_code}")
+                logger.error("Failed to get shipyard info: %s", response.status_code)
                 return None
         except Exception as e:
-            print(f"Error getting shipyard info: {e}")
+            logger.exception("Error getting shipyard info: %s", e)
             return None
             
     def has_mining_mount(self, mounts: List[ShipMount]) -> bool:
@@ -144,7 +188,6 @@ class ShipyardManager:
         Returns:
             True if mining mount found, False otherwise
         """
-        from space_traders_api_client.models.ship_mount_symbol import ShipMountSymbol
         mining_mounts = [
             ShipMountSymbol.MOUNT_MINING_LASER_I,
             ShipMountSymbol.MOUNT_MINING_LASER_II,
@@ -164,13 +207,19 @@ class ShipyardManager:
         Returns:
             List of waypoint symbols that have shipyards
         """
+        # Shipyards don't move, so reuse a recent scan of the system
+        cached = self._shipyard_cache.get(system_symbol)
+        if cached and cached[0] > time.monotonic():
+            return list(cached[1])
+
         shipyards = []
         try:
             # Get all waypoints in system with pagination
             page = 1
             while True:
                 await asyncio.sleep(self.RATE_LIMIT_DELAY)  # Rate limiting
-                response = await get_system_waypoints.asyncio_detailed(
+                response = await self._request(
+                    get_system_waypoints.asyncio_detailed,
                     system_symbol=system_symbol,
                     client=self.client,
                     page=page,
@@ -184,12 +233,12 @@ class ShipyardManager:
                         retry_after = error_data.get('error', {}).get('data', {}).get('retryAfter', 1)
                     except:
                         pass
-                    print(f"Rate limited, waiting {retry_after} seconds...")
+                    logger.warning("Rate limited, waiting %s seconds...", retry_after)
                     await asyncio.sleep(retry_after)
                     continue  # Retry same page
                 
                 if response.status_code != 200 or not response.parsed:
-                    print(f"Failed to get waypoints: {response.status_code}")
+                    logger.error("Failed to get waypoints: %s", response.status_code)
                     break
 
                 # Look for shipyard waypoints and markets
@@ -200,20 +249,21 @@ class ShipyardManager:
                     has_marketplace = any(trait.symbol == WaypointTraitSymbol.MARKETPLACE for trait in waypoint.traits)
                     
                     # Print details about the waypoint and its traits
-                    print(f"Waypoint {waypoint.symbol} ({waypoint.type_}):")
-                    print(f"  Traits: {[trait.symbol for trait in waypoint.traits]}")
+                    if logger.isEnabledFor(logging.DEBUG):
+                        logger.debug("Waypoint %s (%s):", waypoint.symbol, waypoint.type_)
+                        logger.debug("  Traits: %s", [trait.symbol for trait in waypoint.traits])
                     
                     if has_shipyard:
-                        print(f"  Found shipyard!")
+                        logger.debug("  Found shipyard!")
                         shipyards.append(waypoint.symbol)
                         found_any = True
                     elif has_marketplace:
-                        print(f"  Has marketplace, checking for shipyard...")
+                        logger.debug("  Has marketplace, checking for shipyard...")
                         # Query the waypoint specifically as it might have more details
                         await asyncio.sleep(self.RATE_LIMIT_DELAY)
                         shipyard_info = await self.get_shipyard_info(waypoint.symbol)
                         if shipyard_info:
-                            print(f"  Confirmed shipyard at marketplace!")
+                            logger.debug("  Confirmed shipyard at marketplace!")
                             shipyards.append(waypoint.symbol)
                             found_any = True
                 
@@ -224,11 +274,16 @@ class ShipyardManager:
                 else:
                     break  # No more pages
             
-            print(f"Found {len(shipyards)} shipyards in system {system_symbol}")
+            logger.info("Found %s shipyards in system %s", len(shipyards), system_symbol)
+            if shipyards:
+                self._shipyard_cache[system_symbol] = (
+                    time.monotonic() + self.SHIPYARD_CACHE_TTL,
+                    list(shipyards)
+                )
             return shipyards
 
         except Exception as e:
-            print(f"Error finding shipyards: {e}")
+            logger.exception("Error finding shipyards: %s", e)
             return []
 
     async def find_nearby_systems(self, limit: int = 20) -> List[str]:
@@ -245,7 +300,8 @@ class ShipyardManager:
             page = 1
             while len(systems) < limit:
                 await asyncio.sleep(self.RATE_LIMIT_DELAY)  # Rate limiting
-                response = await get_systems.asyncio_detailed(
+                response = await self._request(
+                    get_systems.asyncio_detailed,
                     client=self.client,
                     page=page,
                     limit=20  # Max page size
@@ -258,7 +314,7 @@ class ShipyardManager:
                         retry_after = error_data.get('error', {}).get('data', {}).get('retryAfter', 1)
                     except:
                         pass
-                    print(f"Rate limited, waiting {retry_after} seconds...")
+                    logger.warning("Rate limited, waiting %s seconds...", retry_after)
                     await asyncio.sleep(retry_after)
                     continue  # Retry the same page
                 
@@ -272,13 +328,13 @@ class ShipyardManager:
                         
                     page += 1
                 else:
-                    print(f"Failed to get nearby systems: {response.status_code}")
+                    logger.error("Failed to get nearby systems: %s", response.status_code)
                     break
                     
             return systems[:limit]
                 
         except Exception as e:
-            print(f"Error getting nearby systems: {e}")
+            logger.exception("Error getting nearby systems: %s", e)
             return []
 
     async def find_available_mining_ship(self, system_symbol: str) -> Optional[Tuple[str, Dict]]:
@@ -290,12 +346,12 @@ class ShipyardManager:
         Returns:
             Tuple of (waypoint symbol, ship details) if found, None otherwise
         """
-        print(f"Searching for available mining ships in system {system_symbol}")
+        logger.info("Searching for available mining ships in system %s", system_symbol)
         try:
             # First find all shipyards
             shipyards = await self.find_shipyards_in_system(system_symbol)
             if not shipyards:
-                print("No shipyards found in system")
+                logger.warning("No shipyards found in system")
                 return None
 
             # Check each shipyard for mining ships
@@ -316,27 +372,32 @@ class ShipyardManager:
                             # Get fuel capacity from frame
                             frame = ship.get('frame', {})
                             fuel_capacity = frame.get('fuelCapacity', 0)
-                            print(
-                                f"Found {ship['type']} with {fuel_capacity} fuel capacity "
-                                f"at {waypoint} for {price} credits"
+                            logger.info(
+                                "Found %s with %s fuel capacity at %s for %s credits",
+                                ship['type'],
+                                fuel_capacity,
+                                waypoint,
+                                price
                             )
                             best_price = price
                             best_ship = ship
                             best_waypoint = waypoint
 
             if best_ship and best_waypoint:
-                print(
-                    f"Selected {best_ship['type']} at {best_waypoint} "
-                    f"for {best_price} credits "
-                    f"(fuel capacity: {best_ship.get('frame', {}).get('fuelCapacity', 0)})"
+                logger.info(
+                    "Selected %s at %s for %s credits (fuel capacity: %s)",
+                    best_ship['type'],
+                    best_waypoint,
+                    best_price,
+                    best_ship.get('frame', {}).get('fuelCapacity', 0)
                 )
                 return (best_waypoint, best_ship)
             else:
-                print("No mining ships available in any shipyard")
+                logger.warning("No mining ships available in any shipyard")
                 return None
 
         except Exception as e:
-            print(f"Error finding available mining ships: {e}")
+            logger.exception("Error finding available mining ships: %s", e)
             return None
 
     async def find_mining_ship_in_nearby_systems(
@@ -362,21 +423,21 @@ class ShipyardManager:
                 if min_fuel_capacity is None or ship.get('frame', {}).get('fuelCapacity', 0) >= min_fuel_capacity:
                     return result
                 else:
-                    print(
-                        f"Found ship with insufficient fuel capacity: "
-                        f"{ship.get('frame', {}).get('fuelCapacity', 0)} "
-                        f"(need {min_fuel_capacity})"
+                    logger.warning(
+                        "Found ship with insufficient fuel capacity: %s (need %s)",
+                        ship.get('frame', {}).get('fuelCapacity', 0),
+                        min_fuel_capacity
                     )
                 
             # If not found, check nearby systems
             nearby_systems = await self.find_nearby_systems()
-            print(f"Checking {len(nearby_systems)} nearby systems for mining ships")
+            logger.info("Checking %s nearby systems for mining ships", len(nearby_systems))
             
             for system in nearby_systems:
                 if system == current_system:
                     continue
                     
-                print(f"Checking system {system}")
+                logger.debug("Checking system %s", system)
                 result = await self.find_available_mining_ship(system)
                 if result:
                     waypoint, ship = result
@@ -384,16 +445,16 @@ class ShipyardManager:
                     if min_fuel_capacity is None or ship.get('frame', {}).get('fuelCapacity', 0) >= min_fuel_capacity:
                         return result
                     else:
-                        print(
-                            f"Found ship with insufficient fuel capacity: "
-                            f"{ship.get('frame', {}).get('fuelCapacity', 0)} "
-                            f"(need {min_fuel_capacity})"
+                        logger.warning(
+                            "Found ship with insufficient fuel capacity: %s (need %s)",
+                            ship.get('frame', {}).get('fuelCapacity', 0),
+                            min_fuel_capacity
                         )
                     
             return None
             
         except Exception as e:
-            print(f"Error searching nearby systems: {e}")
+            logger.exception("Error searching nearby systems: %s", e)
             return None
 
     async def purchase_command_ship(
@@ -440,10 +501,13 @@ class ShipyardManager:
                             continue
                             
                         if price < best_price:
-                            print(
-                                f"Found {ship['type']} at {waypoint}\n"
-                                f"  Cargo: {cargo_capacity}, Fuel: {fuel_capacity}\n"
-                                f"  Price: {price} credits"
+                            logger.info(
+                                "Found %s at %s\n  Cargo: %s, Fuel: %s\n  Price: %s credits",
+                                ship['type'],
+                                waypoint,
+                                cargo_capacity,
+                                fuel_capacity,
+                                price
                             )
                             best_price = price
                             best_ship = ship
@@ -451,35 +515,34 @@ class ShipyardManager:
             
             if best_ship and best_waypoint:
                 # Purchase the ship
-                print(f"Attempting to purchase {best_ship['type']} at {best_waypoint}")
-                
-                from space_traders_api_client.models.purchase_ship_body import PurchaseShipBody
-                from space_traders_api_client.models.ship_type import ShipType
+                logger.info("Attempting to purchase %s at %s", best_ship['type'], best_waypoint)
                 
                 body = PurchaseShipBody(
                     ship_type=ShipType(best_ship['type']),
                     waypoint_symbol=best_waypoint
                 )
                 
-                response = await purchase_ship.asyncio_detailed(
+                response = await self._request(
+                    purchase_ship.asyncio_detailed,
                     client=self.client,
                     body=body
                 )
                 
                 if response.status_code == 201 and response.parsed:
-                    print(f"Successfully purchased command ship: {response.parsed.data.ship.symbol}")
+                    self._invalidate_after_purchase()
+                    logger.info("Successfully purchased command ship: %s", response.parsed.data.ship.symbol)
                     return response.parsed
                 else:
-                    print(f"Failed to purchase ship: {response.status_code}")
+                    logger.error("Failed to purchase ship: %s", response.status_code)
                     if response.content:
-                        print(f"Response: {response.content.decode()}")
+                        logger.error("Response: %s", response.content.decode())
                     return None
             else:
-                print("No suitable command ships found")
+                logger.warning("No suitable command ships found")
                 return None
                 
         except Exception as e:
-            print(f"Error purchasing command ship: {e}")
+            logger.exception("Error purchasing command ship: %s", e)
             return None
 
     async def purchase_mining_ship(
@@ -504,24 +567,19 @@ class ShipyardManager:
             )
             if not result:
                 if min_fuel_capacity:
-                    print(
-                        f"Could not find any available mining ships "
-                        f"with {min_fuel_capacity} fuel capacity"
+                    logger.error(
+                        "Could not find any available mining ships with %s fuel capacity",
+                        min_fuel_capacity
                     )
                 else:
-                    print("Could not find any available mining ships")
+                    logger.error("Could not find any available mining ships")
                 return None
 
             waypoint, ship = result
-            print(f"Attempting to purchase {ship['type']} at {waypoint} for {ship['purchasePrice']} credits")
+            logger.info("Attempting to purchase %s at %s for %s credits", ship['type'], waypoint, ship['purchasePrice'])
 
             # Purchase the ship
             await asyncio.sleep(self.RATE_LIMIT_DELAY)  # Rate limiting
-            from space_traders_api_client.models.purchase_ship_body import PurchaseShipBody
-            from space_traders_api_client.models.ship_type import ShipType
-            from space_traders_api_client.models.navigate_ship_body import NavigateShipBody
-            from space_traders_api_client.models.ship_mount_symbol import ShipMountSymbol
-            from space_traders_api_client.models.install_mount_install_mount_request import InstallMountInstallMountRequest
 
             # Create the request body
             body = PurchaseShipBody(
@@ -529,7 +587,8 @@ class ShipyardManager:
                 waypoint_symbol=waypoint
             )
 
-            response = await purchase_ship.asyncio_detailed(
+            response = await self._request(
+                purchase_ship.asyncio_detailed,
                 client=self.client,
                 body=body
             )
@@ -541,89 +600,80 @@ class ShipyardManager:
                     retry_after = error_data.get('error', {}).get('data', {}).get('retryAfter', 1)
                 except:
                     pass
-                print(f"Rate limited, waiting {retry_after} seconds...")
+                logger.warning("Rate limited, waiting %s seconds...", retry_after)
                 await asyncio.sleep(retry_after)
                 return await self.purchase_mining_ship(system_symbol)  # Retry
 
             if response.status_code == 201 and response.parsed:
+                self._invalidate_after_purchase()
                 ship_symbol = response.parsed.data.ship.symbol
-                print(f"Successfully purchased ship: {ship_symbol}")
+                logger.info("Successfully purchased ship: %s", ship_symbol)
 
                 if response.parsed.data.ship.nav:
                     current_waypoint = response.parsed.data.ship.nav.waypoint_symbol
-                    print(f"Ship is at waypoint {current_waypoint}")
+                    logger.info("Ship is at waypoint %s", current_waypoint)
 
                     # Try to find a shipyard to install the mount
-                    print("Searching for shipyard to install mining mount...")
+                    logger.info("Searching for shipyard to install mining mount...")
                     shipyards = await self.find_shipyards_in_system(system_symbol)
                     if shipyards:
                         for shipyard in shipyards:
                             # First make sure ship is refueled
-                            dock_response = await dock_ship.asyncio_detailed(
+                            dock_response = await self._request(
+                                dock_ship.asyncio_detailed,
                                 ship_symbol=ship_symbol,
                                 client=self.client
                             )
                             if dock_response.status_code != 200:
-                                print(f"Failed to dock for refueling: {dock_response.status_code}")
+                                logger.error("Failed to dock for refueling: %s", dock_response.status_code)
                                 continue
                                 
-                            refuel_response = await refuel_ship.asyncio_detailed(
+                            refuel_response = await self._request(
+                                refuel_ship.asyncio_detailed,
                                 ship_symbol=ship_symbol,
                                 client=self.client,
                                 body=RefuelShipBody()
                             )
                             if refuel_response.status_code != 200:
-                                print(f"Failed to refuel: {refuel_response.status_code}")
+                                logger.error("Failed to refuel: %s", refuel_response.status_code)
                                 continue
                             else:
-                                print("Ship refueled successfully")
+                                logger.info("Ship refueled successfully")
                                 
                             # Then navigate to the shipyard if needed
                             if current_waypoint != shipyard:
-                                print(f"Navigating to shipyard at {shipyard}")
+                                logger.info("Navigating to shipyard at %s", shipyard)
                                         
                                 # First move ship to orbit if needed
-                                orbit_response = await orbit_ship.asyncio_detailed(
+                                orbit_response = await self._request(
+                                    orbit_ship.asyncio_detailed,
                                     ship_symbol=ship_symbol,
                                     client=self.client
                                 )
                                 if orbit_response.status_code != 200:
-                                    print(f"Failed to orbit: {orbit_response.status_code}")
+                                    logger.error("Failed to orbit: %s", orbit_response.status_code)
                                     continue
 
                                 nav_body = NavigateShipBody(waypoint_symbol=shipyard)
-                                nav_response = await navigate_ship.asyncio_detailed(
+                                nav_response = await self._request(
+                                    navigate_ship.asyncio_detailed,
                                     ship_symbol=ship_symbol,
                                     client=self.client,
                                     body=nav_body
                                 )
                                         
                                 if nav_response.status_code != 200:
-                                    print(f"Failed to navigate: {nav_response.status_code}")
+                                    logger.error("Failed to navigate: %s", nav_response.status_code)
                                     if nav_response.content:
-                                        print(f"Response: {nav_response.content.decode()}")
+                                        logger.error("Response: %s", nav_response.content.decode())
                                     continue
                                 
-                                # Wait for arrival
-                                try:
-                                    while True:
-                                        await asyncio.sleep(5)  # Check every 5 seconds
-                                        ship_response = await get_my_ships.asyncio_detailed(
-                                            client=self.client
-                                        )
-                                        if ship_response.status_code == 200 and ship_response.parsed:
-                                            ship = next(
-                                                (s for s in ship_response.parsed.data
-                                                 if s.symbol == ship_symbol),
-                                                None
-                                            )
-                                            if ship and ship.nav.status != "IN_TRANSIT":
-                                                break
-                                except Exception as e:
-                                    print(f"Error waiting for arrival: {e}")
+                                ship_data = await self.fleet_manager.wait_for_arrival(ship_symbol)
+                                if not ship_data:
+                                    logger.error("Ship %s did not arrive at %s", ship_symbol, shipyard)
                                     continue
                             
-                            print(f"Attempting to install mining mount...")
+                            logger.info("Attempting to install mining mount...")
                             mount_body = InstallMountInstallMountRequest(
                                 symbol=ShipMountSymbol.MOUNT_MINING_LASER_I
                             )
@@ -633,18 +683,18 @@ class ShipyardManager:
                             )
                             
                             if transaction:
-                                print(
-                                    f"Successfully installed mining mount for "
-                                    f"{transaction.price_paid} credits"
+                                logger.info(
+                                    "Successfully installed mining mount for %s credits",
+                                    transaction.price_paid
                                 )
                                 break
                             else:
-                                print("Failed to install mount at this shipyard, trying another...")
+                                logger.warning("Failed to install mount at this shipyard, trying another...")
 
                     else:
-                        print("No shipyards found to install mining mount")
+                        logger.warning("No shipyards found to install mining mount")
                 else:
-                    print("No navigation data available for ship")
+                    logger.warning("No navigation data available for ship")
                 
                 return response
             else:
@@ -653,9 +703,9 @@ class ShipyardManager:
                     error_msg += f": {response.status_code}"
                 if response.content:
                     error_msg += f"\nResponse: {response.content.decode()}"
-                print(error_msg)
+                logger.error(error_msg)
                 return None
 
         except Exception as e:
-            print(f"Error purchasing mining ship: {e}")
+            logger.exception("Error purchasing mining ship: %s", e)
             return None
\ No newline at end of file
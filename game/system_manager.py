@@ -1,3 +1,4 @@
+import asyncio
 import logging
 from typing import Dict, List, Optional
 
@@ -14,11 +15,15 @@ logger = logging.getLogger(__name__)
 class SystemManager:
     """Manages information about systems and their waypoints."""
 
-    def __init__(self, client: AuthenticatedClient):
+    def __init__(
+        self,
+        client: AuthenticatedClient,
+        api_semaphore: Optional[asyncio.Semaphore] = None
+    ):
         self.client = client
         self.systems: Dict[str, System] = {}
         self.waypoints: Dict[str, List[Waypoint]] = {}  # System symbol -> List of Waypoints
-        self.rate_limiter = RateLimiter()
+        self.rate_limiter = RateLimiter(api_semaphore)
 
     def add_system(self, system: System):
         """Adds a system to the manager."""
@@ -90,7 +95,7 @@ class SystemManager:
             else:
                 logger.error(f"Failed to discover systems: {response.status_code}")
         except Exception as e:
-            logger.error(f"Error during system discovery: {e}", exc_info=True)
+            logger.exception(f"Error during system discovery: {e}")
 
     async def discover_waypoints_in_system(self, system_symbol: str):
         """Scans for waypoints in a given system and adds them to the manager."""
@@ -138,4 +143,4 @@ class SystemManager:
             else:
                 logger.error(f"Failed to discover waypoints for system {system_symbol}: {response.status_code}")
         except Exception as e:
-            logger.error(f"Error during waypoint discovery for system {system_symbol}: {e}", exc_info=True)
+            logger.exception(f"Error during waypoint discovery for system {system_symbol}: {e}")
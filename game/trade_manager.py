@@ -1,10 +1,16 @@
 """
 Trade route and market management for SpaceTraders
 """
+import asyncio
+import collections
+import itertools
 import logging
-from typing import List, Optional
+import time
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
 
 from space_traders_api_client import AuthenticatedClient
+from space_traders_api_client.errors import UnexpectedStatus
 from space_traders_api_client.api.fleet import (
     purchase_cargo,
     sell_cargo,
@@ -15,6 +21,7 @@ from space_traders_api_client.api.systems import (
     get_market,
 )
 from space_traders_api_client.models.market import Market
+from space_traders_api_client.models.waypoint import Waypoint
 from space_traders_api_client.models.waypoint_trait_symbol import (
     WaypointTraitSymbol,
 )
@@ -25,43 +32,303 @@ from space_traders_api_client.models import (
 )
 
 from .market_analyzer import MarketAnalyzer, TradeOpportunity
+from .market_cache import MarketCache
 from .rate_limiter import RateLimiter
 
 logger = logging.getLogger(__name__)
 
+# Value -> member lookup, avoids the Enum constructor on every trade call
+_TRADE_SYMBOLS: Dict[str, trade_types.TradeSymbol] = {
+    t.value: t for t in trade_types.TradeSymbol
+}
+
+
+def _trade_symbol(value: str) -> trade_types.TradeSymbol:
+    """Resolve a trade symbol string to its enum member"""
+    return _TRADE_SYMBOLS.get(value) or trade_types.TradeSymbol(value)
+
+
+def _has_marketplace(waypoint: Waypoint) -> bool:
+    """Check whether a waypoint has the MARKETPLACE trait"""
+    return any(
+        t.symbol is WaypointTraitSymbol.MARKETPLACE
+        for t in waypoint.traits
+    )
+
 
 class TradeManager:
     """Manages market analysis and trade execution"""
+
+    MAX_CONCURRENT_REQUESTS = 5  # Bound on in-flight market/waypoint fetches
+    NO_MARKET_TTL = 300  # Seconds to remember waypoints without a market
+    MARKET_TTL = 60  # Seconds a fetched market is served from memory
+    STATS_LOG_INTERVAL = 100  # Market lookups between cache stats logs
+    ROUTE_SEARCH_TIMEOUT = 10  # Seconds to wait for markets in a search
     
     def __init__(
         self,
         client: AuthenticatedClient,
-        market_analyzer: MarketAnalyzer
+        market_analyzer: MarketAnalyzer,
+        api_semaphore: Optional[asyncio.Semaphore] = None,
+        market_cache_dir: Optional[Path] = None
     ):
         """Initialize TradeManager
         
         Args:
             client: Authenticated API client
             market_analyzer: Market analysis component
+            api_semaphore: Optional semaphore shared by all managers to bound
+                concurrent API requests
+            market_cache_dir: Optional directory to persist fetched markets
         """
         self.client = client
         self.market_analyzer = market_analyzer
-        self.rate_limiter = RateLimiter()
+        self.rate_limiter = RateLimiter(api_semaphore)
+        # System symbol -> waypoints; waypoint traits do not change
+        self.waypoints_cache: Dict[str, List[Waypoint]] = {}
+        self._request_semaphore = asyncio.Semaphore(
+            self.MAX_CONCURRENT_REQUESTS
+        )
+        # Waypoint symbol -> in-flight market fetch shared by callers
+        self._pending_markets: Dict[str, asyncio.Future] = {}
+        # Waypoint symbol -> monotonic expiry of a "no market" result
+        self._no_market: Dict[str, float] = {}
+        self.market_cache = MarketCache(
+            ttl=self.MARKET_TTL,
+            cache_dir=market_cache_dir
+        )
+        self._cache_stats: collections.Counter = collections.Counter()
+
+    def cache_stats(self) -> Dict[str, int]:
+        """Get market cache counters
+
+        Returns:
+            Total lookups plus counts of hit, disk_hit, miss, expired,
+            negative_hit and inflight_coalesced lookups
+        """
+        return dict(self._cache_stats)
         
-    async def update_market_data(self, waypoint_symbol: str) -> None:
-        """Update market data for analysis"""
-        try:
-            # Extract system symbol from waypoint symbol (format: SYSTEM-X-X)
-            system_symbol = "-".join(waypoint_symbol.split("-")[:2])
+    async def get_market_details(
+        self,
+        waypoint_symbol: str
+    ) -> Optional[Market]:
+        """Fetch market details for a waypoint
+
+        Markets are served from memory, then disk, for MARKET_TTL seconds
+        and concurrent calls for the same waypoint share a single request.
+        Waypoints that recently had no market are skipped.
+
+        Args:
+            waypoint_symbol: Symbol of the marketplace waypoint
+
+        Returns:
+            Market data if available, None otherwise
+        """
+        self._cache_stats["lookup"] += 1
+        if self._cache_stats["lookup"] % self.STATS_LOG_INTERVAL == 0:
+            logger.debug(f"Market cache stats: {self.cache_stats()}")
+
+        if self._is_no_market_cached(waypoint_symbol):
+            self._cache_stats["negative_hit"] += 1
+            return None
+
+        if self.market_cache.is_expired(waypoint_symbol):
+            self._cache_stats["expired"] += 1
+        market = self.market_cache.get(waypoint_symbol)
+        if market is not None:
+            self._cache_stats["hit"] += 1
+            return market
+
+        pending = self._pending_markets.get(waypoint_symbol)
+        if pending is not None:
+            self._cache_stats["inflight_coalesced"] += 1
+        else:
+            self._cache_stats["miss"] += 1
+            pending = asyncio.ensure_future(
+                self._fetch_market(waypoint_symbol)
+            )
+            self._pending_markets[waypoint_symbol] = pending
+            pending.add_done_callback(
+                lambda _: self._pending_markets.pop(waypoint_symbol, None)
+            )
+        # Shield so one cancelled caller does not cancel the shared fetch
+        return await asyncio.shield(pending)
+
+    async def _fetch_market(self, waypoint_symbol: str) -> Optional[Market]:
+        """Load market details from disk or request them from the API"""
+        market = await self.market_cache.load(waypoint_symbol)
+        if market is not None:
+            self._cache_stats["disk_hit"] += 1
+            return market
+
+        # Extract system symbol from waypoint symbol (format: SYSTEM-X-X)
+        system_symbol = "-".join(waypoint_symbol.split("-")[:2])
+        async with self._request_semaphore:
+            try:
+                response = await self.rate_limiter.execute_with_retry(
+                    get_market.asyncio_detailed,
+                    task_name="get_market",
+                    system_symbol=system_symbol,
+                    waypoint_symbol=waypoint_symbol,
+                    client=self.client
+                )
+            except UnexpectedStatus as e:
+                if e.status_code not in (400, 404):
+                    raise
+                logger.info(f"No marketplace at {waypoint_symbol}")
+                self._mark_no_market(waypoint_symbol)
+                return None
+        if response.status_code == 200 and response.parsed:
+            market = response.parsed.data
+            # Only fresh data is a new price point; cache hits would repeat one
+            self.market_analyzer.update_market_data(market)
+            await self.market_cache.store(waypoint_symbol, market)
+            return market
+        if response.status_code in (400, 404):
+            # Clients that do not raise on unexpected status return it instead
+            logger.info(f"No marketplace at {waypoint_symbol}")
+            self._mark_no_market(waypoint_symbol)
+        return None
+
+    def _mark_no_market(self, waypoint_symbol: str) -> None:
+        """Remember that a waypoint has no market for NO_MARKET_TTL"""
+        self._no_market[waypoint_symbol] = (
+            time.monotonic() + self.NO_MARKET_TTL
+        )
+
+    def _is_no_market_cached(self, waypoint_symbol: str) -> bool:
+        """Check the negative cache, dropping the entry once expired"""
+        expiry = self._no_market.get(waypoint_symbol)
+        if expiry is None:
+            return False
+        if expiry <= time.monotonic():
+            del self._no_market[waypoint_symbol]
+            return False
+        return True
+
+    async def get_system_waypoints(self, system_symbol: str) -> List[Waypoint]:
+        """Get waypoints for a system, fetching them only once
+
+        Args:
+            system_symbol: Symbol of the system
+
+        Returns:
+            List of waypoints, empty if they could not be retrieved
+        """
+        if system_symbol in self.waypoints_cache:
+            return self.waypoints_cache[system_symbol]
+
+        async with self._request_semaphore:
             response = await self.rate_limiter.execute_with_retry(
-                get_market.asyncio_detailed,
-                task_name="update_market_data",
+                get_system_waypoints.asyncio_detailed,
+                task_name="get_system_waypoints",
                 system_symbol=system_symbol,
-                waypoint_symbol=waypoint_symbol,
                 client=self.client
             )
-            if response.status_code == 200 and response.parsed:
-                self.market_analyzer.update_market_data(response.parsed.data)
+        if response.status_code != 200 or not response.parsed:
+            return []
+
+        self.waypoints_cache[system_symbol] = response.parsed.data
+        return response.parsed.data
+
+    async def _get_marketplace_symbols(self, system_symbol: str) -> List[str]:
+        """Get symbols of the marketplace waypoints in a system
+
+        Args:
+            system_symbol: Symbol of the system
+
+        Returns:
+            Waypoint symbols worth requesting market data for
+        """
+        waypoints = await self.get_system_waypoints(system_symbol)
+        marketplace_symbols = []
+        for waypoint in waypoints:
+            if self._is_no_market_cached(waypoint.symbol):
+                continue
+            if not _has_marketplace(waypoint):
+                self._mark_no_market(waypoint.symbol)
+                continue
+            marketplace_symbols.append(waypoint.symbol)
+        return marketplace_symbols
+
+    async def _get_markets_within_deadline(
+        self,
+        waypoint_symbols: List[str]
+    ) -> List[Market]:
+        """Fetch markets concurrently, keeping what arrives in time
+
+        Lookups still pending after ROUTE_SEARCH_TIMEOUT are cancelled.
+        Their shared fetches keep running and fill the cache for the
+        next search.
+
+        Args:
+            waypoint_symbols: Marketplace waypoints to fetch
+
+        Returns:
+            Markets retrieved before the deadline
+        """
+        if not waypoint_symbols:
+            return []
+        tasks = [
+            asyncio.ensure_future(self.get_market_details(symbol))
+            for symbol in waypoint_symbols
+        ]
+        done, pending = await asyncio.wait(
+            tasks, timeout=self.ROUTE_SEARCH_TIMEOUT
+        )
+        for task in pending:
+            task.cancel()
+        if pending:
+            logger.warning(
+                f"Route search deadline hit, skipping {len(pending)} "
+                f"of {len(tasks)} markets"
+            )
+        return [
+            task.result() for task in tasks
+            if task in done and task.exception() is None and task.result()
+        ]
+
+    async def warm(self, system_symbol: str) -> None:
+        """Prefetch waypoints and markets of a system into the caches
+
+        Args:
+            system_symbol: Symbol of the system to warm
+        """
+        try:
+            marketplace_symbols = await self._get_marketplace_symbols(
+                system_symbol
+            )
+            await asyncio.gather(*(
+                self.get_market_details(symbol)
+                for symbol in marketplace_symbols
+            ))
+            logger.info(
+                f"Warmed {len(marketplace_symbols)} markets in {system_symbol}"
+            )
+        except Exception as e:
+            logger.error(f"Error warming market cache: {e}")
+
+    def _is_known_non_marketplace(self, waypoint_symbol: str) -> bool:
+        """Check cached waypoint traits for a waypoint without a market"""
+        if self._is_no_market_cached(waypoint_symbol):
+            return True
+        system_symbol = "-".join(waypoint_symbol.split("-")[:2])
+        for waypoint in self.waypoints_cache.get(system_symbol, []):
+            if waypoint.symbol == waypoint_symbol:
+                return not _has_marketplace(waypoint)
+        return False
+
+    async def update_market_data(self, waypoint_symbol: str) -> None:
+        """Update market data for analysis
+
+        The analyzer is fed by the API fetch itself, so a market still
+        fresh in the cache adds no new price snapshot.
+        """
+        try:
+            if self._is_known_non_marketplace(waypoint_symbol):
+                logger.info(f"No marketplace at {waypoint_symbol}")
+                return
+            await self.get_market_details(waypoint_symbol)
         except Exception as e:
             logger.error(f"Error updating market data: {e}")
 
@@ -87,44 +354,21 @@ class TradeManager:
                 
             systems = systems_response.parsed.data
             
-            # Get market data for each system
-            markets: List[Market] = []
-            for system in systems:
-                waypoints = await self.rate_limiter.execute_with_retry(
-                    get_system_waypoints.asyncio_detailed,
-                    task_name="get_system_waypoints",
-                    system_symbol=system.symbol,
-                    client=self.client
-                )
-                if waypoints.status_code != 200 or not waypoints.parsed:
-                    continue
-                    
-                for waypoint in waypoints.parsed.data:
-                    if WaypointTraitSymbol.MARKETPLACE in [
-                        t.symbol for t in waypoint.traits
-                    ]:
-                        # Extract system symbol from waypoint symbol
-                        system_symbol = "-".join(
-                            waypoint.symbol.split("-")[:2]
-                        )
-                        market_response = await self.rate_limiter.execute_with_retry(
-                            get_market.asyncio_detailed,
-                            task_name="get_market",
-                            system_symbol=system_symbol,
-                            waypoint_symbol=waypoint.symbol,
-                            client=self.client
-                        )
-                        if (
-                            market_response.status_code == 200 
-                            and market_response.parsed
-                        ):
-                            markets.append(market_response.parsed.data)
-                            
+            # Get market data for all systems concurrently
+            system_marketplaces = await asyncio.gather(*(
+                self._get_marketplace_symbols(system.symbol)
+                for system in systems
+            ))
+            markets = await self._get_markets_within_deadline(list(
+                itertools.chain.from_iterable(system_marketplaces)
+            ))
+
             # Find trade opportunities
             opportunities = self.market_analyzer.get_trade_opportunities(
                 markets=markets,
                 min_profit_margin=0.2,
-                max_distance=100
+                max_distance=100,
+                top_k=1
             )
             
             if not opportunities:
@@ -146,7 +390,7 @@ class TradeManager:
         """Execute a purchase at current market"""
         try:
             body = cargo_request.PurchaseCargoPurchaseCargoRequest(
-                symbol=trade_types.TradeSymbol(trade_symbol),
+                symbol=_trade_symbol(trade_symbol),
                 units=units
             )
             response = await self.rate_limiter.execute_with_retry(
@@ -170,7 +414,7 @@ class TradeManager:
         """Execute a sale at current market"""
         try:
             body = sell_request.SellCargoSellCargoRequest(
-                symbol=trade_types.TradeSymbol(trade_symbol),
+                symbol=_trade_symbol(trade_symbol),
                 units=units
             )
             response = await self.rate_limiter.execute_with_retry(
@@ -183,4 +427,88 @@ class TradeManager:
             return response.status_code == 201
         except Exception as e:
             logger.error(f"Error selling cargo: {e}")
-            return False
\ No newline at end of file
+            return False
+
+    async def execute_purchases(
+        self,
+        ship_symbol: str,
+        orders: List[Tuple[str, int]]
+    ) -> List[bool]:
+        """Execute several purchases at current market in one batch
+
+        Args:
+            ship_symbol: Symbol of the purchasing ship
+            orders: (trade_symbol, units) pairs to purchase
+
+        Returns:
+            Success flag for each order, in order
+        """
+        bodies = [
+            cargo_request.PurchaseCargoPurchaseCargoRequest(
+                symbol=_trade_symbol(trade_symbol),
+                units=units
+            )
+            for trade_symbol, units in orders
+        ]
+        responses = await asyncio.gather(
+            *(
+                self.rate_limiter.execute_with_retry(
+                    purchase_cargo.asyncio_detailed,
+                    task_name="execute_purchases",
+                    ship_symbol=ship_symbol,
+                    client=self.client,
+                    body=body
+                )
+                for body in bodies
+            ),
+            return_exceptions=True
+        )
+        return self._batch_results(responses, "purchasing cargo")
+
+    async def execute_sales(
+        self,
+        ship_symbol: str,
+        orders: List[Tuple[str, int]]
+    ) -> List[bool]:
+        """Execute several sales at current market in one batch
+
+        Args:
+            ship_symbol: Symbol of the selling ship
+            orders: (trade_symbol, units) pairs to sell
+
+        Returns:
+            Success flag for each order, in order
+        """
+        bodies = [
+            sell_request.SellCargoSellCargoRequest(
+                symbol=_trade_symbol(trade_symbol),
+                units=units
+            )
+            for trade_symbol, units in orders
+        ]
+        responses = await asyncio.gather(
+            *(
+                self.rate_limiter.execute_with_retry(
+                    sell_cargo.asyncio_detailed,
+                    task_name="execute_sales",
+                    ship_symbol=ship_symbol,
+                    client=self.client,
+                    body=body
+                )
+                for body in bodies
+            ),
+            return_exceptions=True
+        )
+        return self._batch_results(responses, "selling cargo")
+
+    @staticmethod
+    def _batch_results(responses: list, action: str) -> List[bool]:
+        """Convert gathered responses into per-order success flags"""
+        results = []
+        for response in responses:
+            if isinstance(response, Exception):
+                logger.error(f"Error {action}: {response}")
+                results.append(False)
+            else:
+                results.append(response.status_code == 201)
+        return results
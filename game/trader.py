@@ -1,14 +1,17 @@
 import asyncio
+import random
+from pathlib import Path
 from datetime import timedelta, datetime # Added datetime
-from typing import Optional, List # Added List
+from typing import Dict, Optional, List, Tuple # Added List
 
 from space_traders_api_client.models.ship import Ship
 from space_traders_api_client.models.ship_nav_status import ShipNavStatus
 from space_traders_api_client.models.system import System
 from space_traders_api_client.models.agent import Agent
-# Removed: from space_traders_api_client.api.systems import get_systems (now handled by SystemManager)
+from space_traders_api_client.api.systems import get_systems
 # Added WaypointType for _manage_mining_ship
 from space_traders_api_client.models.waypoint_type import WaypointType
+from space_traders_api_client.models.waypoint_trait_symbol import WaypointTraitSymbol
 
 from .agent_manager import AgentManager
 from .contract_manager import ContractManager
@@ -21,8 +24,18 @@ import logging # Added logging
 
 logger = logging.getLogger(__name__) # Added logger
 
+# Module-level aliases avoid repeated enum attribute lookups in the ship loop
+_DOCKED = ShipNavStatus.DOCKED
+_IN_TRANSIT = ShipNavStatus.IN_TRANSIT
+
+
 class SpaceTrader:
     """Main game automation class"""
+
+    MAX_CONCURRENT_API_REQUESTS = 2  # In-flight API requests across all managers
+    SYSTEMS_CACHE_TTL = timedelta(hours=24)  # System catalogs rarely change
+    SHIP_WORKER_INTERVAL = 5  # Seconds between passes of a ship worker
+    MAX_ERROR_BACKOFF = 60  # Cap in seconds for the trade loop's error backoff
     
     def __init__(self, token: Optional[str] = None):
         """Initialize the SpaceTrader with optional token
@@ -30,30 +43,47 @@ class SpaceTrader:
         Args:
             token: Optional API token. If not provided, will read from env var.
         """
+        # Shared by every manager to bound in-flight requests. It limits
+        # concurrency, not rate; each RateLimiter paces its own calls.
+        self.api_semaphore = asyncio.Semaphore(self.MAX_CONCURRENT_API_REQUESTS)
+
         # Initialize managers
-        self.agent_manager = AgentManager(token)
-        self.system_manager = SystemManager(self.agent_manager.client) # Instantiate SystemManager
-        self.fleet_manager = FleetManager(self.agent_manager.client)
+        self.agent_manager = AgentManager(token, self.api_semaphore)
+        self.system_manager = SystemManager(self.agent_manager.client, self.api_semaphore) # Instantiate SystemManager
+        self.fleet_manager = FleetManager(self.agent_manager.client, self.api_semaphore)
         self.market_analyzer = MarketAnalyzer(
             cache_duration=timedelta(minutes=15)
         )
         self.trade_manager = TradeManager(
             self.agent_manager.client,
-            self.market_analyzer
+            self.market_analyzer,
+            self.api_semaphore,
+            market_cache_dir=Path.home() / ".spacetraders" / "market"
+        )
+        self.contract_manager = ContractManager(
+            self.agent_manager.client,
+            self.api_semaphore,
+            fleet_manager=self.fleet_manager,
+            agent_manager=self.agent_manager
         )
-        self.contract_manager = ContractManager(self.agent_manager.client)
         # self.survey_manager = SurveyManager( # Old
         #     client=self.agent_manager.client
         # )
         self.mining_manager = MiningManager( # New
             client=self.agent_manager.client,
-            system_manager=self.system_manager
+            system_manager=self.system_manager,
+            api_semaphore=self.api_semaphore
         )
         
         # Initialize state
         self.agent: Optional[Agent] = None
         self.last_system_scan_time: Optional[datetime] = None
         self.system_scan_interval: timedelta = timedelta(hours=1) # Scan systems every hour
+        # (limit, page) -> (fetch time, systems)
+        self._systems_cache: Dict[
+            Tuple[int, Optional[int]], Tuple[datetime, List[System]]
+        ] = {}
+        self._systems_cache_lock = asyncio.Lock()
 
 
     @property
@@ -76,11 +106,26 @@ class SpaceTrader:
         """Initialize the game state and verify connection"""
         await self.agent_manager.initialize()
         self.agent = self.agent_manager.agent
-        await self.fleet_manager.update_fleet()
-        await self.contract_manager.update_contracts()
+        # Ships and contracts only depend on the agent, so load them together
+        await asyncio.gather(
+            self.fleet_manager.update_fleet(),
+            self.contract_manager.update_contracts()
+        )
+        # Prefetch home system markets so the first route search is cached
+        if self.agent and self.agent.headquarters:
+            await self.trade_manager.warm(
+                "-".join(self.agent.headquarters.split("-")[:2])
+            )
         # Initial system scan
         await self.scan_systems_and_waypoints(initial_scan=True)
 
+    async def aclose(self):
+        """Release the shared HTTP connection pool on shutdown"""
+        logger.info(
+            f"Market cache stats: {self.trade_manager.cache_stats()}"
+        )
+        await self.agent_manager.aclose()
+
 
     async def scan_systems_and_waypoints(self, initial_scan: bool = False):
         """Scans for systems and their waypoints using SystemManager."""
@@ -117,7 +162,47 @@ class SpaceTrader:
         self.last_system_scan_time = now
         logger.info(f"System and waypoint scan complete. Total systems: {len(self.system_manager.get_all_systems())}, Total waypoints: {self.system_manager.get_total_waypoints_count()}")
 
-    # This method replaces the old scan_systems
+    async def scan_systems(
+        self,
+        limit: int = 20,
+        page: Optional[int] = None
+    ) -> List[System]:
+        """Fetch a page of systems, served from cache for SYSTEMS_CACHE_TTL
+
+        Args:
+            limit: Number of systems to request
+            page: Optional page number
+
+        Returns:
+            List of systems, empty if the request failed
+        """
+        key = (limit, page)
+        # The lock keeps concurrent first calls from all hitting the API
+        async with self._systems_cache_lock:
+            cached = self._systems_cache.get(key)
+            if cached and datetime.now() - cached[0] < self.SYSTEMS_CACHE_TTL:
+                return cached[1]
+
+            kwargs = {"client": self.agent_manager.client, "limit": limit}
+            if page is not None:
+                kwargs["page"] = page
+            try:
+                async with self.api_semaphore:
+                    response = await get_systems.asyncio_detailed(**kwargs)
+            except Exception as e:
+                logger.error(f"Error scanning systems: {e}")
+                return []
+
+            if response.status_code != 200 or not response.parsed:
+                logger.warning(f"Failed to scan systems: {response.status_code}")
+                return []
+
+            systems = response.parsed.data
+            for system in systems:
+                self.system_manager.add_system(system)
+            self._systems_cache[key] = (datetime.now(), systems)
+            return systems
+
     async def get_nearby_systems(self, limit: int = 5) -> List[System]:
         """
         Retrieves a list of nearby or known systems from SystemManager.
@@ -142,39 +227,80 @@ class SpaceTrader:
         5. Handles contract deliveries
         """
         try:
-            # Periodically scan for systems and waypoints
-            await self.scan_systems_and_waypoints()
-
-            # Update ship statuses
-            await self.fleet_manager.update_fleet()
+            await self._refresh_fleet_state()
             
-            # Update contracts
-            await self.contract_manager.update_contracts()
-            
-            # Process each ship
-            for ship in self.fleet_manager.ships.values():
-                await self._process_ship(ship)
+            # Snapshot the fleet so background updates can't mutate it mid-iteration
+            ships_snapshot = self.fleet_manager.ship_list()
+
+            # Process all ships concurrently; API calls are bounded by api_semaphore
+            await asyncio.gather(*(
+                self._safe(self._command_ship(ship), f"ship {ship.symbol}")
+                for ship in ships_snapshot
+            ))
                 
-            # Check for deliverable contracts
-            # ... (rest of the method remains the same)
-            for contract_id, contract in self.contract_manager.contracts.items():
-                if not contract.accepted:
-                    logger.info(f"Found unaccepted contract {contract_id}") # Changed print to logger.info
-                    await self.contract_manager.accept_contract(contract_id)
-                elif contract.fulfilled:
-                    logger.info(f"Contract {contract_id} is already fulfilled") # Changed print to logger.info
-                else:
-                    logger.info(f"Processing contract {contract_id}") # Changed print to logger.info
-                    await self.contract_manager.process_contract(
-                        contract,
-                        self.fleet_manager.ships,
-                        self.mining_manager, # Updated to mining_manager
-                        self.system_manager
-                    )
+            await self._handle_contracts()
                     
-        except Exception as e:
-            import traceback
-            logger.error('Error managing fleet:', exc_info=True) # Changed print to logger.error
+        except Exception:
+            logger.exception('Error managing fleet') # Changed print to logger.error
+
+    async def _refresh_fleet_state(self):
+        """Scan systems when due and refresh ships and contracts"""
+        # Periodically scan for systems and waypoints
+        await self.scan_systems_and_waypoints()
+
+        # Update ship statuses
+        await self.fleet_manager.update_fleet()
+        
+        # Update contracts
+        await self.contract_manager.update_contracts()
+
+    async def _handle_contracts(self):
+        """Accept or progress all known contracts concurrently"""
+        contracts_snapshot = tuple(self.contract_manager.contracts.items())
+        await asyncio.gather(*(
+            self._safe(
+                self._handle_contract(contract_id, contract),
+                f"contract {contract_id}"
+            )
+            for contract_id, contract in contracts_snapshot
+        ))
+
+    async def _safe(self, coro, label: str):
+        """Await a unit of concurrent work, logging instead of raising errors
+
+        Args:
+            coro: The coroutine to run
+            label: What the work is for, used in the log message
+
+        Returns:
+            The coroutine's result, or None if it raised
+        """
+        try:
+            return await coro
+        except Exception:
+            logger.exception('Error handling %s', label)
+            return None
+
+    async def _handle_contract(self, contract_id: str, contract):
+        """Accept or progress a single contract
+
+        Args:
+            contract_id: ID of the contract
+            contract: The contract to handle
+        """
+        if not contract.accepted:
+            logger.info(f"Found unaccepted contract {contract_id}") # Changed print to logger.info
+            await self.contract_manager.accept_contract(contract_id)
+        elif contract.fulfilled:
+            logger.info(f"Contract {contract_id} is already fulfilled") # Changed print to logger.info
+        else:
+            logger.info(f"Processing contract {contract_id}") # Changed print to logger.info
+            await self.contract_manager.process_contract(
+                contract,
+                self.fleet_manager.ships,
+                self.mining_manager, # Updated to mining_manager
+                self.system_manager
+            )
 
     async def _process_ship(self, ship: Ship):
         """Process individual ship actions based on its state
@@ -184,36 +310,39 @@ class SpaceTrader:
         """
         try:
             if not hasattr(ship, 'nav'):
-                logger.warning('Ship {} has no navigation data'.format(ship.symbol)) # Changed print to logger.warning
+                logger.warning('Ship %s has no navigation data', ship.symbol) # Changed print to logger.warning
                 return
+
+            # Looked up once; used by every branch below
+            ship_symbol = ship.symbol
+            status = ship.nav.status
+            waypoint_symbol = ship.nav.waypoint_symbol
                 
-            if ship.nav.status == ShipNavStatus.IN_TRANSIT:
+            if status is _IN_TRANSIT:
                 logger.info( # Changed print to logger.info
-                    'Ship {} is in transit to {}'.format(
-                        ship.symbol,
-                        ship.nav.waypoint_symbol
-                    )
+                    'Ship %s is in transit to %s',
+                    ship_symbol,
+                    waypoint_symbol
                 )
                 return
                 
-            if ship.nav.status == ShipNavStatus.DOCKED:
+            role_hint = ship_symbol.upper()
+            if status is _DOCKED:
                 logger.info( # Changed print to logger.info
-                    'Ship {} is docked at {}'.format(
-                        ship.symbol,
-                        ship.nav.waypoint_symbol
-                    )
+                    'Ship %s is docked at %s',
+                    ship_symbol,
+                    waypoint_symbol
                 )
                 await self._handle_market_actions(ship)
             # This is a simplified role check. Could be based on ship registration or other metadata.
-            elif "MINER" in ship.symbol.upper() or "PROBE" in ship.symbol.upper() or "SURVEYOR" in ship.symbol.upper():
+            elif "MINER" in role_hint or "PROBE" in role_hint or "SURVEYOR" in role_hint:
                  await self._manage_mining_ship(ship)
             else: # Ship is IN_ORBIT and not a designated miner
                 logger.info( # Changed print to logger.info
-                    'Ship {} is {} at {}'.format(
-                        ship.symbol,
-                        ship.nav.status,
-                        ship.nav.waypoint_symbol
-                    )
+                    'Ship %s is %s at %s',
+                    ship_symbol,
+                    status,
+                    waypoint_symbol
                 )
                 # Potentially add logic here for ships that are IN_ORBIT but not DOCKED,
                 # e.g., if they need to dock or perform other actions.
@@ -224,26 +353,26 @@ class SpaceTrader:
                 current_waypoint_obj = None
                 for system_obj in self.system_manager.get_all_systems():
                     for wp in self.system_manager.get_waypoints_in_system(system_obj.symbol):
-                        if wp.symbol == ship.nav.waypoint_symbol:
+                        if wp.symbol == waypoint_symbol:
                             current_waypoint_obj = wp
                             break
                     if current_waypoint_obj:
                         break
                 
-                if current_waypoint_obj and WaypointType.MARKETPLACE in [t.symbol for t in current_waypoint_obj.traits]:
-                     logger.info(f"Ship {ship.symbol} is in orbit at a marketplace. Docking to check trades.")
-                     await self.fleet_manager.dock_ship(ship.symbol)
+                if current_waypoint_obj and any(t.symbol is WaypointTraitSymbol.MARKETPLACE for t in current_waypoint_obj.traits):
+                     logger.info(f"Ship {ship_symbol} is in orbit at a marketplace. Docking to check trades.")
+                     await self.fleet_manager.dock_ship(ship_symbol)
                      # The ship will be processed again in the next cycle, now docked.
 
 
         except Exception as e:
-            logger.error('Error processing ship {}: {}'.format(ship.symbol, e), exc_info=True) # Changed print to logger.error
+            logger.exception('Error processing ship %s: %s', ship.symbol, e) # Changed print to logger.error
 
     async def _manage_mining_ship(self, ship: Ship):
         logger.info(f"Managing mining ship: {ship.symbol} at {ship.nav.waypoint_symbol}, Status: {ship.nav.status}")
 
         # Ensure ship is in orbit or docked to perform actions
-        if ship.nav.status == ShipNavStatus.IN_TRANSIT:
+        if ship.nav.status is _IN_TRANSIT:
             logger.info(f"Mining ship {ship.symbol} is in transit. Waiting for arrival.")
             return # Wait for it to arrive
 
@@ -305,13 +434,14 @@ class SpaceTrader:
 
 
         # 1. Refuel if needed (and if possible at this waypoint)
-        can_refuel_here = WaypointType.MARKETPLACE in [t.symbol for t in current_waypoint_obj.traits]
+        can_refuel_here = any(t.symbol is WaypointTraitSymbol.MARKETPLACE for t in current_waypoint_obj.traits)
 
         if ship.fuel.current < ship.fuel.capacity * 0.25: # Refuel if less than 25%
             if can_refuel_here:
                 logger.info(f"Ship {ship.symbol} fuel low ({ship.fuel.current}/{ship.fuel.capacity}). Attempting to refuel at {ship.nav.waypoint_symbol}.")
-                if ship.nav.status != ShipNavStatus.DOCKED:
-                    await self.fleet_manager.dock_ship(ship.symbol)
+                if ship.nav.status is not _DOCKED:
+                    if await self.fleet_manager.dock_ship(ship.symbol):
+                        ship.nav.status = ShipNavStatus.DOCKED # Update local status
 
                 refuel_success = await self.fleet_manager.refuel_ship(ship.symbol)
                 if refuel_success:
@@ -319,7 +449,7 @@ class SpaceTrader:
                 else:
                     logger.warning(f"Failed to refuel ship {ship.symbol} at {ship.nav.waypoint_symbol}. Proceeding with caution.")
                 # Whether refuel succeeded or not, ensure ship is in orbit for next actions unless delivering
-                if ship.nav.status == ShipNavStatus.DOCKED:
+                if ship.nav.status is _DOCKED:
                      await self.fleet_manager.orbit_ship(ship.symbol)
                      ship.nav.status = ShipNavStatus.IN_ORBIT # Update local status
             else:
@@ -340,22 +470,25 @@ class SpaceTrader:
                  logger.info(f"Navigating ship {ship.symbol} to HQ {hq_waypoint_symbol} to deliver cargo.")
                  await self.fleet_manager.navigate_to_waypoint(ship.symbol, hq_waypoint_symbol)
             else: # Already at HQ
-                if ship.nav.status != ShipNavStatus.DOCKED:
-                    await self.fleet_manager.dock_ship(ship.symbol)
+                if ship.nav.status is not _DOCKED:
+                    if await self.fleet_manager.dock_ship(ship.symbol):
+                        ship.nav.status = ShipNavStatus.DOCKED # Update local status
                 # Sell all cargo - this is a simplification.
                 # Should ideally sell specific goods based on market or contract.
                 if ship.cargo.inventory: # Check if there's anything to sell
-                    for item in ship.cargo.inventory:
-                        logger.info(f"Attempting to sell {item.units} of {item.symbol} from ship {ship.symbol} at HQ.")
-                        sale_success = await self.trade_manager.execute_sale(ship.symbol, item.symbol, item.units)
+                    # Submit every sale at once rather than one round-trip per good
+                    orders = [(item.symbol, item.units) for item in ship.cargo.inventory]
+                    logger.info(f"Attempting to sell {orders} from ship {ship.symbol} at HQ.")
+                    results = await self.trade_manager.execute_sales(ship.symbol, orders)
+                    for (trade_symbol, _), sale_success in zip(orders, results):
                         if not sale_success:
-                            logger.warning(f"Failed to sell {item.symbol} from ship {ship.symbol} at HQ.")
+                            logger.warning(f"Failed to sell {trade_symbol} from ship {ship.symbol} at HQ.")
                             # Consider what to do if sale fails (e.g. jettison if stuck)
                 else:
                     logger.info(f"Ship {ship.symbol} is at HQ with full cargo, but inventory is empty. This is unexpected.")
 
                 # After selling, orbit again if planning more actions, or stay docked if cycle ends.
-                if ship.nav.status == ShipNavStatus.DOCKED:
+                if ship.nav.status is _DOCKED:
                     await self.fleet_manager.orbit_ship(ship.symbol)
                     ship.nav.status = ShipNavStatus.IN_ORBIT # Update local status
             return
@@ -375,7 +508,7 @@ class SpaceTrader:
 
         if not active_survey_for_resource:
             logger.info(f"No good active survey for {targeted_resource} at {ship.nav.waypoint_symbol} for ship {ship.symbol}. Attempting to create one.")
-            if ship.nav.status == ShipNavStatus.DOCKED: # Surveying requires orbit
+            if ship.nav.status is _DOCKED: # Surveying requires orbit
                 await self.fleet_manager.orbit_ship(ship.symbol)
                 ship.nav.status = ShipNavStatus.IN_ORBIT
 
@@ -388,7 +521,7 @@ class SpaceTrader:
                 # Could try mining without survey or wait for cooldown
 
         # 4. Mine
-        if ship.nav.status == ShipNavStatus.DOCKED: # Mining requires orbit
+        if ship.nav.status is _DOCKED: # Mining requires orbit
             await self.fleet_manager.orbit_ship(ship.symbol)
             ship.nav.status = ShipNavStatus.IN_ORBIT # Update local status
 
@@ -405,53 +538,95 @@ class SpaceTrader:
             logger.warning(f"Mining attempt by {ship.symbol} at {ship.nav.waypoint_symbol} did not yield results or failed. Cooldown might be active.")
             # Cooldown or other issues are logged by extract_resources_at_waypoint
             
+    def _can_sell_here(self, ship: Ship) -> bool:
+        """Check whether any cargo can be sold at the ship's waypoint
+
+        Peeks at the cached market only, leaving its LRU position and expiry
+        alone; without one the answer is assumed yes.
+
+        Args:
+            ship: The docked ship
+
+        Returns:
+            False only if the cached market trades none of the ship's cargo
+        """
+        market = self.trade_manager.market_cache.peek(ship.nav.waypoint_symbol)
+        if market is None:
+            return True
+        sellable = {good.symbol for good in market.exports}
+        sellable.update(good.symbol for good in market.imports)
+        sellable.update(good.symbol for good in market.exchange)
+        return any(item.symbol in sellable for item in ship.cargo.inventory)
+
     async def _handle_market_actions(self, ship: Ship):
         """Handle market-related actions for a ship"""
         try:
             if not hasattr(ship, 'cargo'):
-                logger.warning('Ship {} has no cargo data'.format(ship.symbol)) # Changed print to logger.warning
+                logger.warning('Ship %s has no cargo data', ship.symbol) # Changed print to logger.warning
                 return
                 
-            logger.info('Analyzing market options for ship {}'.format(ship.symbol)) # Changed print to logger.info
-            logger.info('Current cargo: {}/{} units'.format( # Changed print to logger.info
+            logger.info('Analyzing market options for ship %s', ship.symbol) # Changed print to logger.info
+            logger.info( # Changed print to logger.info
+                'Current cargo: %s/%s units',
                 ship.cargo.units,
                 ship.cargo.capacity
-            ))
-            
-            await self.trade_manager.update_market_data(
-                ship.nav.waypoint_symbol
             )
+
+            # A full ship can only sell; skip the market fetch if nothing sells here
+            if (
+                ship.cargo.units >= ship.cargo.capacity
+                and not self._can_sell_here(ship)
+            ):
+                logger.info(
+                    'Ship %s is full and has nothing to sell at %s, skipping market',
+                    ship.symbol,
+                    ship.nav.waypoint_symbol
+                )
+                return
             
-            insights = self.market_analyzer.get_market_insights(
+            market_update = self.trade_manager.update_market_data(
                 ship.nav.waypoint_symbol
             )
-            
-            if insights.get("recommendations"):
-                logger.info("Market recommendations:") # Changed print to logger.info
-                for rec in insights["recommendations"]:
-                    logger.info(f"- {rec}") # Changed print to logger.info
-                    
+            best_route = None
             if ship.cargo.units < ship.cargo.capacity:
+                # The route search does not depend on the local market refresh,
+                # so run both concurrently.
                 # Pass SystemManager to find_best_trade_route if it needs to calculate distances
                 # based on system/waypoint data. For now, assuming it doesn't.
-                best_route = await self.trade_manager.find_best_trade_route(
-                    ship_symbol=ship.symbol,
-                    # current_system_symbol=self.current_system.symbol if self.current_system else None,
-                    # system_manager=self.system_manager # Pass if needed
-                )
-                if best_route:
-                    logger.info( # Changed print to logger.info
-                        f"Found route: {best_route.source_market} -> "
-                        f"{best_route.target_market}"
+                _, best_route = await asyncio.gather(
+                    market_update,
+                    self.trade_manager.find_best_trade_route(
+                        ship_symbol=ship.symbol,
+                        # current_system_symbol=self.current_system.symbol if self.current_system else None,
+                        # system_manager=self.system_manager # Pass if needed
                     )
-                    logger.info( # Changed print to logger.info
-                        f"Expected profit: {best_route.profit_per_unit} "
-                        f"credits per unit"
-                    )
-                    await self._execute_trade_route(ship, best_route)
+                )
+            else:
+                await market_update
+
+            insights = self.market_analyzer.get_market_insights(
+                ship.nav.waypoint_symbol
+            )
+
+            if insights.get("recommendations"):
+                logger.info( # Changed print to logger.info
+                    "Market recommendations:\n- %s",
+                    insights["recommendations_text"]
+                )
+
+            if best_route:
+                logger.info( # Changed print to logger.info
+                    f"Found route: {best_route.source_market} -> "
+                    f"{best_route.target_market}"
+                )
+                logger.info( # Changed print to logger.info
+                    f"Expected profit: {best_route.profit_per_unit} "
+                    f"credits per unit"
+                )
+                await self._execute_trade_route(ship, best_route)
             
         except Exception as e:
-            logger.error(f"Error handling market actions for ship {ship.symbol}: {e}", exc_info=True) # Changed print to logger.error
+            logger.exception(f"Error handling market actions for ship {ship.symbol}: {e}") # Changed print to logger.error
             
     async def _execute_trade_route(
         self,
@@ -481,7 +656,7 @@ class SpaceTrader:
                 ship.nav = ship_data.nav
 
             # Ensure ship is docked at source market
-            if ship.nav.status != ShipNavStatus.DOCKED:
+            if ship.nav.status is not _DOCKED:
                 logger.info(f"Docking ship {ship.symbol} at {route.source_market}")
                 success = await self.fleet_manager.dock_ship(ship.symbol)
                 if not success:
@@ -517,7 +692,7 @@ class SpaceTrader:
                 ship.nav = ship_data.nav
 
             # Ensure ship is docked at target market
-            if ship.nav.status != ShipNavStatus.DOCKED:
+            if ship.nav.status is not _DOCKED:
                 logger.info(f"Docking ship {ship.symbol} at {route.target_market}")
                 success = await self.fleet_manager.dock_ship(ship.symbol)
                 if not success:
@@ -546,28 +721,98 @@ class SpaceTrader:
             return True
             
         except Exception as e:
-            logger.error(f"Error executing trade route: {e}", exc_info=True) # Changed print to logger.error
+            logger.exception(f"Error executing trade route: {e}") # Changed print to logger.error
             return False
             
-    async def trade_loop(self):
-        """Main trading loop"""
+    async def _ship_worker(self, ship_symbol: str):
+        """Keep processing one ship until it leaves the fleet
+
+        Each ship runs in its own worker so one ship travelling or trading
+        never holds up the others.
+
+        Args:
+            ship_symbol: Symbol of the ship to work
+        """
         while True:
-            try:
-                logger.info("\n--- Starting new trading cycle ---\n") # Changed print to logger.info
-                
-                # Update agent status
-                await self.agent_manager.get_agent_status()
-                if self.agent_manager.agent: # Update local agent copy
-                    self.agent = self.agent_manager.agent
-                
-                # Manage fleet operations (includes system scan)
-                await self.manage_fleet()
-                
-                # Add delay to avoid rate limiting
-                logger.info("\nWaiting 5 seconds before next cycle...") # Changed print to logger.info
-                await asyncio.sleep(5)
-                
-            except Exception as e:
-                logger.error('Error in trade loop:', exc_info=True) # Changed print to logger.error
-                logger.info('\nWaiting 10 seconds after error...') # Changed print to logger.error
-                await asyncio.sleep(10)
\ No newline at end of file
+            ship = self.fleet_manager.ships.get(ship_symbol)
+            if ship is None:
+                logger.info(f"Ship {ship_symbol} left the fleet, stopping worker")
+                return
+            await self._command_ship(ship)
+            await asyncio.sleep(self.SHIP_WORKER_INTERVAL)
+
+    async def _command_ship(self, ship: Ship):
+        """Process a ship while holding its lock
+
+        Contract handling commands ships too; the lock keeps its orders
+        from interleaving with the ship's own worker.
+
+        Args:
+            ship: The ship to process
+        """
+        async with self.fleet_manager.ship_lock(ship.symbol):
+            await self._process_ship(ship)
+
+    def _start_ship_workers(self, workers: Dict[str, asyncio.Task]):
+        """Start a worker for every ship that does not have a live one"""
+        for ship_symbol in self.fleet_manager.ships:
+            worker = workers.get(ship_symbol)
+            if worker is None or worker.done():
+                workers[ship_symbol] = asyncio.create_task(
+                    self._ship_worker(ship_symbol)
+                )
+
+    def _error_backoff(self, consecutive_errors: int) -> float:
+        """Get the delay before retrying after consecutive loop errors
+
+        Exponential (1s, 2s, 4s, ...) capped at MAX_ERROR_BACKOFF, plus up to
+        a second of jitter so retries do not line up with fixed windows.
+
+        Args:
+            consecutive_errors: Errors seen since the last successful cycle
+
+        Returns:
+            Delay in seconds
+        """
+        return min(self.MAX_ERROR_BACKOFF, 2 ** consecutive_errors) + random.random()
+
+    async def trade_loop(self):
+        """Main trading loop
+
+        Ships are worked by long-lived per-ship tasks; this loop refreshes
+        shared state and contracts, and starts workers for new ships.
+        """
+        workers: Dict[str, asyncio.Task] = {}
+        consecutive_errors = 0
+        try:
+            while True:
+                try:
+                    logger.info("\n--- Starting new trading cycle ---\n") # Changed print to logger.info
+                    
+                    # Update agent status while refreshing systems, ships and contracts
+                    await asyncio.gather(
+                        self.agent_manager.get_agent_status(),
+                        self._refresh_fleet_state()
+                    )
+                    if self.agent_manager.agent: # Update local agent copy
+                        self.agent = self.agent_manager.agent
+                    
+                    self._start_ship_workers(workers)
+                    await self._handle_contracts()
+                    
+                    consecutive_errors = 0
+                    
+                    # Add delay to avoid rate limiting
+                    logger.info("\nWaiting 5 seconds before next cycle...") # Changed print to logger.info
+                    await asyncio.sleep(5)
+                    
+                except Exception:
+                    logger.exception('Error in trade loop') # Changed print to logger.error
+                    delay = self._error_backoff(consecutive_errors)
+                    consecutive_errors += 1
+                    logger.info(f'\nWaiting {delay:.1f} seconds after error...') # Changed print to logger.error
+                    await asyncio.sleep(delay)
+        finally:
+            for worker in workers.values():
+                worker.cancel()
+            await asyncio.gather(*workers.values(), return_exceptions=True)
\ No newline at end of file
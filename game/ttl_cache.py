@@ -0,0 +1,56 @@
+"""
+Short-lived memoization for refresh calls made several times per cycle
+"""
+import functools
+import time
+from typing import Any, Awaitable, Callable, Dict, Tuple, TypeVar
+
+T = TypeVar('T')
+
+_CACHE_ATTR = '_ttl_cache'
+
+
+def ttl_cache(seconds: float) -> Callable[
+    [Callable[..., Awaitable[T]]], Callable[..., Awaitable[T]]
+]:
+    """Reuse an async method's result on the same instance for a few seconds
+
+    Only argument-less methods are supported; the cache key is the method
+    name. Exceptions are not cached.
+
+    Args:
+        seconds: How long a result stays fresh
+
+    Returns:
+        Method decorator
+    """
+    def decorator(method: Callable[..., Awaitable[T]]) -> Callable[..., Awaitable[T]]:
+        key = method.__name__
+
+        @functools.wraps(method)
+        async def wrapper(self) -> T:
+            cache: Dict[str, Tuple[float, Any]] = self.__dict__.setdefault(
+                _CACHE_ATTR, {}
+            )
+            entry = cache.get(key)
+            if entry is not None and entry[0] > time.monotonic():
+                return entry[1]
+            result = await method(self)
+            cache[key] = (time.monotonic() + seconds, result)
+            return result
+
+        return wrapper
+    return decorator
+
+
+def invalidate(obj: Any, *method_names: str) -> None:
+    """Drop cached results so the next call refreshes
+
+    Args:
+        obj: Instance whose methods are cached
+        method_names: Names of the cached methods to invalidate
+    """
+    cache = obj.__dict__.get(_CACHE_ATTR)
+    if cache:
+        for name in method_names:
+            cache.pop(name, None)
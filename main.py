@@ -4,11 +4,39 @@ SpaceTraders Game Client Entry Point
 """
 import os
 import json
+import queue
 import asyncio
+import logging
+from logging.handlers import QueueHandler, QueueListener
 from game.trader import SpaceTrader
 from game.register import RegistrationManager, generate_agent_symbol
 from space_traders_api_client.models.faction_symbol import FactionSymbol
 
+STARTING_FACTION = FactionSymbol("COSMIC")
+
+def install_event_loop() -> None:
+    """Use uvloop's faster event loop when the optional extra is installed"""
+    try:
+        import uvloop
+    except ImportError:
+        return
+    uvloop.install()
+
+def setup_logging() -> QueueListener:
+    """Route log records through a queue so handler I/O stays off the event loop
+
+    The level can be raised with the LOG_LEVEL env var (e.g. WARNING) to skip
+    formatting of INFO messages entirely.
+    """
+    logging.basicConfig()  # No-op if handlers are already configured
+    root = logging.getLogger()
+    root.setLevel(os.getenv("LOG_LEVEL", "INFO").upper())
+    log_queue = queue.SimpleQueue()
+    listener = QueueListener(log_queue, *root.handlers, respect_handler_level=True)
+    root.handlers = [QueueHandler(log_queue)]
+    listener.start()
+    return listener
+
 async def main():
     """Main entry point for the SpaceTraders game client"""
     registration_manager = RegistrationManager()
@@ -26,7 +54,7 @@ async def main():
             # Register new agent
             success = registration_manager.register_agent(
                 symbol=agent_symbol,
-                faction=FactionSymbol("COSMIC")  # Starting faction
+                faction=STARTING_FACTION
             )
             if success:
                 token = registration_manager.load_existing_token()
@@ -71,7 +99,14 @@ async def main():
         
     except Exception as e:
         print(f"Error during game operations: {e}")
+    finally:
+        await trader.aclose()
 
 if __name__ == "__main__":
-    # Run the async main function
-    asyncio.run(main())
+    listener = setup_logging()
+    install_event_loop()
+    try:
+        # Run the async main function
+        asyncio.run(main())
+    finally:
+        listener.stop()
@@ -0,0 +1,94 @@
+"""Builds the request functions for simple per-ship POST endpoints
+
+Endpoint modules keep their typed public functions and delegate the request
+to an implementation generated here once at import time, closing over the URL
+template, the module's ``_parse_response`` and the expected status code.
+"""
+
+import functools
+from typing import Any, Awaitable, Callable, NamedTuple, Optional, Union
+
+import httpx
+
+from ..client import AuthenticatedClient, Client
+from ..types import Response
+
+_JSON_HEADERS = {"Content-Type": "application/json"}
+# Copied per request; dict.copy() of a fixed-size dict beats rebuilding the literal
+_BODY_KWARGS_TEMPLATE = {"method": "post", "url": "", "content": b"", "headers": _JSON_HEADERS}
+
+ParseResponse = Callable[..., Optional[Any]]
+
+
+def build_response(
+    client: Union[AuthenticatedClient, Client],
+    response: httpx.Response,
+    status: int,
+    parse_response: ParseResponse,
+) -> Response[Any]:
+    """Wrap an httpx response, deferring ``parse_response`` on the success status
+
+    Any other status is parsed immediately, so an unexpected status still raises
+    from the request call when the client is set to raise.
+    """
+    if response.status_code == status:
+        # Callers often only check the status, so decode the body on first access
+        return Response(
+            status_code=response.status_code,
+            content=response.content,
+            headers=response.headers,
+            parse=lambda: parse_response(client=client, response=response),
+        )
+    return Response(
+        status_code=response.status_code,
+        content=response.content,
+        headers=response.headers,
+        parsed=parse_response(client=client, response=response),
+    )
+
+
+class PostEndpoint(NamedTuple):
+    """The request implementations wrapped by an endpoint module"""
+
+    sync_detailed: Callable[..., Response[Any]]
+    asyncio_detailed: Callable[..., Awaitable[Response[Any]]]
+
+
+def make_post_endpoint(
+    url_template: str,
+    parse_response: ParseResponse,
+    status: int,
+) -> PostEndpoint:
+    """Generate the request functions for a POST /my/ships/{ship_symbol}/... endpoint
+
+    Args:
+        url_template (str): Path with a ``{ship_symbol}`` placeholder.
+        parse_response: The endpoint module's ``_parse_response``.
+        status (int): The documented success status code.
+
+    Returns:
+        PostEndpoint: ``(sync_detailed, asyncio_detailed)``, each taking
+        ``ship_symbol``, ``client`` and an optional request ``body``.
+    """
+
+    @functools.lru_cache(maxsize=1024)
+    def url_for(ship_symbol: str) -> str:
+        return url_template.format(ship_symbol=ship_symbol)
+
+    def get_kwargs(ship_symbol: str, body: Any) -> dict[str, Any]:
+        if body is None:
+            return {"method": "post", "url": url_for(ship_symbol)}
+        kwargs = _BODY_KWARGS_TEMPLATE.copy()
+        kwargs["url"] = url_for(ship_symbol)
+        kwargs["content"] = body.to_json_bytes()
+        return kwargs
+
+    def sync_detailed(ship_symbol: str, *, client: AuthenticatedClient, body: Any = None) -> Response[Any]:
+        response = client.get_httpx_client().request(**get_kwargs(ship_symbol, body))
+        return build_response(client, response, status, parse_response)
+
+    async def asyncio_detailed(ship_symbol: str, *, client: AuthenticatedClient, body: Any = None) -> Response[Any]:
+        response = await client.get_async_httpx_client().request(**get_kwargs(ship_symbol, body))
+        return build_response(client, response, status, parse_response)
+
+    return PostEndpoint(sync_detailed, asyncio_detailed)
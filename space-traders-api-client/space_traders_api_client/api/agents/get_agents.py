@@ -1,9 +1,8 @@
-from http import HTTPStatus
 from typing import Any, Optional, Union
 
 import httpx
 
-from ... import errors
+from ... import errors, json_codec
 from ...client import AuthenticatedClient, Client
 from ...models.get_agents_response_200 import GetAgentsResponse200
 from ...types import UNSET, Response, Unset
@@ -35,7 +34,7 @@ def _parse_response(
     *, client: Union[AuthenticatedClient, Client], response: httpx.Response
 ) -> Optional[GetAgentsResponse200]:
     if response.status_code == 200:
-        response_200 = GetAgentsResponse200.from_dict(response.json())
+        response_200 = GetAgentsResponse200.from_dict(json_codec.loads(response.content))
 
         return response_200
     if client.raise_on_unexpected_status:
@@ -48,7 +47,7 @@ def _build_response(
     *, client: Union[AuthenticatedClient, Client], response: httpx.Response
 ) -> Response[GetAgentsResponse200]:
     return Response(
-        status_code=HTTPStatus(response.status_code),
+        status_code=response.status_code,
         content=response.content,
         headers=response.headers,
         parsed=_parse_response(client=client, response=response),
@@ -1,9 +1,8 @@
-from http import HTTPStatus
 from typing import Any, Optional, Union
 
 import httpx
 
-from ... import errors
+from ... import errors, json_codec
 from ...client import AuthenticatedClient, Client
 from ...models.get_my_agent_response_200 import GetMyAgentResponse200
 from ...types import Response
@@ -22,7 +21,7 @@ def _parse_response(
     *, client: Union[AuthenticatedClient, Client], response: httpx.Response
 ) -> Optional[GetMyAgentResponse200]:
     if response.status_code == 200:
-        response_200 = GetMyAgentResponse200.from_dict(response.json())
+        response_200 = GetMyAgentResponse200.from_dict(json_codec.loads(response.content))
 
         return response_200
     if client.raise_on_unexpected_status:
@@ -35,7 +34,7 @@ def _build_response(
     *, client: Union[AuthenticatedClient, Client], response: httpx.Response
 ) -> Response[GetMyAgentResponse200]:
     return Response(
-        status_code=HTTPStatus(response.status_code),
+        status_code=response.status_code,
         content=response.content,
         headers=response.headers,
         parsed=_parse_response(client=client, response=response),
@@ -1,13 +1,16 @@
-from http import HTTPStatus
 from typing import Any, Optional, Union
 
 import httpx
 
-from ... import errors
+from ... import errors, json_codec
 from ...client import AuthenticatedClient, Client
 from ...models.deliver_contract_body import DeliverContractBody
 from ...models.deliver_contract_response_200 import DeliverContractResponse200
 from ...types import Response
+from .._endpoint_factory import build_response
+
+_JSON_HEADERS = {"Content-Type": "application/json"}
+_URL_TMPL = "/my/contracts/%s/deliver"
 
 
 def _get_kwargs(
@@ -15,19 +18,13 @@ def _get_kwargs(
     *,
     body: DeliverContractBody,
 ) -> dict[str, Any]:
-    headers: dict[str, Any] = {}
-
     _kwargs: dict[str, Any] = {
         "method": "post",
-        "url": f"/my/contracts/{contract_id}/deliver",
+        "url": _URL_TMPL % contract_id,
     }
 
-    _body = body.to_dict()
-
-    _kwargs["json"] = _body
-    headers["Content-Type"] = "application/json"
-
-    _kwargs["headers"] = headers
+    _kwargs["content"] = json_codec.dumps(body.to_dict())
+    _kwargs["headers"] = _JSON_HEADERS
     return _kwargs
 
 
@@ -35,7 +32,7 @@ def _parse_response(
     *, client: Union[AuthenticatedClient, Client], response: httpx.Response
 ) -> Optional[DeliverContractResponse200]:
     if response.status_code == 200:
-        response_200 = DeliverContractResponse200.from_dict(response.json())
+        response_200 = DeliverContractResponse200.from_dict(json_codec.loads(response.content))
 
         return response_200
     if client.raise_on_unexpected_status:
@@ -47,12 +44,7 @@ def _parse_response(
 def _build_response(
     *, client: Union[AuthenticatedClient, Client], response: httpx.Response
 ) -> Response[DeliverContractResponse200]:
-    return Response(
-        status_code=HTTPStatus(response.status_code),
-        content=response.content,
-        headers=response.headers,
-        parsed=_parse_response(client=client, response=response),
-    )
+    return build_response(client, response, 200, _parse_response)
 
 
 def sync_detailed(
@@ -1,20 +1,21 @@
-from http import HTTPStatus
 from typing import Any, Optional, Union
 
 import httpx
 
-from ... import errors
+from ... import errors, json_codec
 from ...client import AuthenticatedClient, Client
 from ...models.fulfill_contract_response_200 import FulfillContractResponse200
 from ...types import Response
 
+_URL_TMPL = "/my/contracts/%s/fulfill"
+
 
 def _get_kwargs(
     contract_id: str,
 ) -> dict[str, Any]:
     _kwargs: dict[str, Any] = {
         "method": "post",
-        "url": f"/my/contracts/{contract_id}/fulfill",
+        "url": _URL_TMPL % contract_id,
     }
 
     return _kwargs
@@ -24,7 +25,7 @@ def _parse_response(
     *, client: Union[AuthenticatedClient, Client], response: httpx.Response
 ) -> Optional[FulfillContractResponse200]:
     if response.status_code == 200:
-        response_200 = FulfillContractResponse200.from_dict(response.json())
+        response_200 = FulfillContractResponse200.from_dict(json_codec.loads(response.content))
 
         return response_200
     if client.raise_on_unexpected_status:
@@ -37,7 +38,7 @@ def _build_response(
     *, client: Union[AuthenticatedClient, Client], response: httpx.Response
 ) -> Response[FulfillContractResponse200]:
     return Response(
-        status_code=HTTPStatus(response.status_code),
+        status_code=response.status_code,
         content=response.content,
         headers=response.headers,
         parsed=_parse_response(client=client, response=response),
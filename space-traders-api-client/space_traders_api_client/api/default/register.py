@@ -1,32 +1,27 @@
-from http import HTTPStatus
 from typing import Any, Optional, Union
 
 import httpx
 
-from ... import errors
+from ... import errors, json_codec
 from ...client import AuthenticatedClient, Client
 from ...models.register_body import RegisterBody
 from ...models.register_response_201 import RegisterResponse201
 from ...types import Response
 
+_JSON_HEADERS = {"Content-Type": "application/json"}
+
 
 def _get_kwargs(
     *,
     body: RegisterBody,
 ) -> dict[str, Any]:
-    headers: dict[str, Any] = {}
-
     _kwargs: dict[str, Any] = {
         "method": "post",
         "url": "/register",
     }
 
-    _body = body.to_dict()
-
-    _kwargs["json"] = _body
-    headers["Content-Type"] = "application/json"
-
-    _kwargs["headers"] = headers
+    _kwargs["content"] = json_codec.dumps(body.to_dict())
+    _kwargs["headers"] = _JSON_HEADERS
     return _kwargs
 
 
@@ -34,7 +29,7 @@ def _parse_response(
     *, client: Union[AuthenticatedClient, Client], response: httpx.Response
 ) -> Optional[RegisterResponse201]:
     if response.status_code == 201:
-        response_201 = RegisterResponse201.from_dict(response.json())
+        response_201 = RegisterResponse201.from_dict(json_codec.loads(response.content))
 
         return response_201
     if client.raise_on_unexpected_status:
@@ -47,7 +42,7 @@ def _build_response(
     *, client: Union[AuthenticatedClient, Client], response: httpx.Response
 ) -> Response[RegisterResponse201]:
     return Response(
-        status_code=HTTPStatus(response.status_code),
+        status_code=response.status_code,
         content=response.content,
         headers=response.headers,
         parsed=_parse_response(client=client, response=response),
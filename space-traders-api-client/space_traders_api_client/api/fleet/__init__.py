@@ -0,0 +1,4 @@
+
+from ._batch import Batcher, Call, batch, call
+
+__all__ = ["Batcher", "Call", "batch", "call"]
@@ -0,0 +1,122 @@
+"""Submit several fleet requests together on one client
+
+With HTTP/2 the requests are multiplexed over a single connection, so a batch
+of docks or extractions costs one round of event-loop wake-ups instead of one
+per ship.
+"""
+
+import asyncio
+from collections import deque
+from typing import Any, Awaitable, Callable, NamedTuple, Optional
+
+from ...client import AuthenticatedClient
+from ...types import Response
+
+
+class Call(NamedTuple):
+    """A pending request: an ``asyncio_detailed`` function and its arguments"""
+
+    fn: Callable[..., Awaitable[Response[Any]]]
+    kwargs: dict[str, Any]
+
+
+def call(fn: Callable[..., Awaitable[Response[Any]]], **kwargs: Any) -> Call:
+    """Describe a request to pass to :func:`batch`
+
+    Example:
+        ``call(dock_ship.asyncio_detailed, ship_symbol="SHIP-1")``
+    """
+    return Call(fn, kwargs)
+
+
+async def batch(
+    client: AuthenticatedClient, calls: list[Call], *, return_exceptions: bool = False
+) -> list[Any]:
+    """Run the calls concurrently on ``client``
+
+    Args:
+        client (AuthenticatedClient): Client whose connection pool the calls share.
+        calls (list[Call]): Requests built with :func:`call`.
+        return_exceptions (bool): Return failures in place instead of raising the first.
+
+    Returns:
+        list: The responses, in the order of ``calls``.
+    """
+    return await asyncio.gather(
+        *(fn(client=client, **kwargs) for fn, kwargs in calls),
+        return_exceptions=return_exceptions,
+    )
+
+
+class Batcher:
+    """Coalesce requests submitted within a short window into one concurrent burst
+
+    Requests submitted within ``window`` seconds of each other are sent together
+    with at most ``max_batch`` per burst. Use it as an async context manager, or
+    call :meth:`aclose` when done.
+
+    Example:
+        ``response = await batcher.submit(lambda: orbit_ship.asyncio_detailed("SHIP-1", client=client))``
+    """
+
+    def __init__(self, window: float = 0.005, max_batch: int = 32) -> None:
+        self.window = window
+        self.max_batch = max_batch
+        self._pending: deque[tuple[Callable[[], Awaitable[Any]], asyncio.Future]] = deque()
+        self._in_flight: list[asyncio.Future] = []
+        self._wakeup: Optional[asyncio.Event] = None
+        self._task: Optional[asyncio.Task] = None
+
+    def submit(self, coro_factory: Callable[[], Awaitable[Any]]) -> "asyncio.Future[Any]":
+        """Queue a request; the returned future resolves with its result"""
+        future = asyncio.get_running_loop().create_future()
+        self._pending.append((coro_factory, future))
+        if self._task is None:
+            self._wakeup = asyncio.Event()
+            self._task = asyncio.create_task(self._drain(self._wakeup))
+        self._wakeup.set()
+        return future
+
+    async def _drain(self, wakeup: asyncio.Event) -> None:
+        while True:
+            await wakeup.wait()
+            wakeup.clear()
+            await asyncio.sleep(self.window)
+            while self._pending:
+                burst = [self._pending.popleft() for _ in range(min(self.max_batch, len(self._pending)))]
+                # Already off the queue, so aclose() must find them here
+                self._in_flight = [future for _, future in burst]
+                results = await asyncio.gather(*(factory() for factory, _ in burst), return_exceptions=True)
+                self._in_flight = []
+                for (_, future), result in zip(burst, results):
+                    if future.done():
+                        continue
+                    if isinstance(result, BaseException):
+                        future.set_exception(result)
+                    else:
+                        future.set_result(result)
+
+    async def aclose(self) -> None:
+        """Stop the drain task; requests in flight or still queued are cancelled"""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        for future in self._in_flight:
+            future.cancel()
+        self._in_flight = []
+        while self._pending:
+            _, future = self._pending.popleft()
+            future.cancel()
+
+    async def __aenter__(self) -> "Batcher":
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self.aclose()
+
+
+__all__ = ["Batcher", "Call", "batch", "call"]
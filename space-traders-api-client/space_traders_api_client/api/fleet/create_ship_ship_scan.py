@@ -1,20 +1,21 @@
-from http import HTTPStatus
 from typing import Any, Optional, Union
 
 import httpx
 
-from ... import errors
+from ... import errors, json_codec
 from ...client import AuthenticatedClient, Client
 from ...models.create_ship_ship_scan_response_201 import CreateShipShipScanResponse201
 from ...types import Response
 
+_URL_TMPL = "/my/ships/%s/scan/ships"
+
 
 def _get_kwargs(
     ship_symbol: str,
 ) -> dict[str, Any]:
     _kwargs: dict[str, Any] = {
         "method": "post",
-        "url": f"/my/ships/{ship_symbol}/scan/ships",
+        "url": _URL_TMPL % ship_symbol,
     }
 
     return _kwargs
@@ -24,7 +25,7 @@ def _parse_response(
     *, client: Union[AuthenticatedClient, Client], response: httpx.Response
 ) -> Optional[CreateShipShipScanResponse201]:
     if response.status_code == 201:
-        response_201 = CreateShipShipScanResponse201.from_dict(response.json())
+        response_201 = CreateShipShipScanResponse201.from_dict(json_codec.loads(response.content))
 
         return response_201
     if client.raise_on_unexpected_status:
@@ -37,7 +38,7 @@ def _build_response(
     *, client: Union[AuthenticatedClient, Client], response: httpx.Response
 ) -> Response[CreateShipShipScanResponse201]:
     return Response(
-        status_code=HTTPStatus(response.status_code),
+        status_code=response.status_code,
         content=response.content,
         headers=response.headers,
         parsed=_parse_response(client=client, response=response),
@@ -1,30 +1,19 @@
-from http import HTTPStatus
-from typing import Any, Optional, Union
+from typing import Optional, Union
 
 import httpx
 
-from ... import errors
+from ... import errors, json_codec
 from ...client import AuthenticatedClient, Client
 from ...models.create_survey_response_201 import CreateSurveyResponse201
 from ...types import Response
-
-
-def _get_kwargs(
-    ship_symbol: str,
-) -> dict[str, Any]:
-    _kwargs: dict[str, Any] = {
-        "method": "post",
-        "url": f"/my/ships/{ship_symbol}/survey",
-    }
-
-    return _kwargs
+from .._endpoint_factory import make_post_endpoint
 
 
 def _parse_response(
     *, client: Union[AuthenticatedClient, Client], response: httpx.Response
 ) -> Optional[CreateSurveyResponse201]:
     if response.status_code == 201:
-        response_201 = CreateSurveyResponse201.from_dict(response.json())
+        response_201 = CreateSurveyResponse201.from_dict(json_codec.loads(response.content))
 
         return response_201
     if client.raise_on_unexpected_status:
@@ -33,15 +22,7 @@ def _parse_response(
         return None
 
 
-def _build_response(
-    *, client: Union[AuthenticatedClient, Client], response: httpx.Response
-) -> Response[CreateSurveyResponse201]:
-    return Response(
-        status_code=HTTPStatus(response.status_code),
-        content=response.content,
-        headers=response.headers,
-        parsed=_parse_response(client=client, response=response),
-    )
+_endpoint = make_post_endpoint("/my/ships/{ship_symbol}/survey", _parse_response, 201)
 
 
 def sync_detailed(
@@ -77,15 +58,7 @@ def sync_detailed(
         Response[CreateSurveyResponse201]
     """
 
-    kwargs = _get_kwargs(
-        ship_symbol=ship_symbol,
-    )
-
-    response = client.get_httpx_client().request(
-        **kwargs,
-    )
-
-    return _build_response(client=client, response=response)
+    return _endpoint.sync_detailed(ship_symbol, client=client)
 
 
 def sync(
@@ -160,13 +133,7 @@ async def asyncio_detailed(
         Response[CreateSurveyResponse201]
     """
 
-    kwargs = _get_kwargs(
-        ship_symbol=ship_symbol,
-    )
-
-    response = await client.get_async_httpx_client().request(**kwargs)
-
-    return _build_response(client=client, response=response)
+    return await _endpoint.asyncio_detailed(ship_symbol, client=client)
 
 
 async def asyncio(
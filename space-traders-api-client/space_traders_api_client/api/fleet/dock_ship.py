@@ -1,30 +1,19 @@
-from http import HTTPStatus
-from typing import Any, Optional, Union
+from typing import Optional, Union
 
 import httpx
 
-from ... import errors
+from ... import errors, json_codec
 from ...client import AuthenticatedClient, Client
 from ...models.dock_ship_dock_ship_200_response import DockShipDockShip200Response
 from ...types import Response
-
-
-def _get_kwargs(
-    ship_symbol: str,
-) -> dict[str, Any]:
-    _kwargs: dict[str, Any] = {
-        "method": "post",
-        "url": f"/my/ships/{ship_symbol}/dock",
-    }
-
-    return _kwargs
+from .._endpoint_factory import make_post_endpoint
 
 
 def _parse_response(
     *, client: Union[AuthenticatedClient, Client], response: httpx.Response
 ) -> Optional[DockShipDockShip200Response]:
     if response.status_code == 200:
-        response_200 = DockShipDockShip200Response.from_dict(response.json())
+        response_200 = DockShipDockShip200Response.from_dict(json_codec.loads(response.content))
 
         return response_200
     if client.raise_on_unexpected_status:
@@ -33,15 +22,7 @@ def _parse_response(
         return None
 
 
-def _build_response(
-    *, client: Union[AuthenticatedClient, Client], response: httpx.Response
-) -> Response[DockShipDockShip200Response]:
-    return Response(
-        status_code=HTTPStatus(response.status_code),
-        content=response.content,
-        headers=response.headers,
-        parsed=_parse_response(client=client, response=response),
-    )
+_endpoint = make_post_endpoint("/my/ships/{ship_symbol}/dock", _parse_response, 200)
 
 
 def sync_detailed(
@@ -70,15 +51,7 @@ def sync_detailed(
         Response[DockShipDockShip200Response]
     """
 
-    kwargs = _get_kwargs(
-        ship_symbol=ship_symbol,
-    )
-
-    response = client.get_httpx_client().request(
-        **kwargs,
-    )
-
-    return _build_response(client=client, response=response)
+    return _endpoint.sync_detailed(ship_symbol, client=client)
 
 
 def sync(
@@ -139,13 +112,7 @@ async def asyncio_detailed(
         Response[DockShipDockShip200Response]
     """
 
-    kwargs = _get_kwargs(
-        ship_symbol=ship_symbol,
-    )
-
-    response = await client.get_async_httpx_client().request(**kwargs)
-
-    return _build_response(client=client, response=response)
+    return await _endpoint.asyncio_detailed(ship_symbol, client=client)
 
 
 async def asyncio(
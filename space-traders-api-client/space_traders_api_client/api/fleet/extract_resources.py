@@ -1,41 +1,20 @@
-from http import HTTPStatus
-from typing import Any, Optional, Union
+from typing import Optional, Union
 
 import httpx
 
-from ... import errors
+from ... import errors, json_codec
 from ...client import AuthenticatedClient, Client
 from ...models.extract_resources_body import ExtractResourcesBody
 from ...models.extract_resources_response_201 import ExtractResourcesResponse201
 from ...types import Response
-
-
-def _get_kwargs(
-    ship_symbol: str,
-    *,
-    body: ExtractResourcesBody,
-) -> dict[str, Any]:
-    headers: dict[str, Any] = {}
-
-    _kwargs: dict[str, Any] = {
-        "method": "post",
-        "url": f"/my/ships/{ship_symbol}/extract",
-    }
-
-    _body = body.to_dict()
-
-    _kwargs["json"] = _body
-    headers["Content-Type"] = "application/json"
-
-    _kwargs["headers"] = headers
-    return _kwargs
+from .._endpoint_factory import make_post_endpoint
 
 
 def _parse_response(
     *, client: Union[AuthenticatedClient, Client], response: httpx.Response
 ) -> Optional[ExtractResourcesResponse201]:
     if response.status_code == 201:
-        response_201 = ExtractResourcesResponse201.from_dict(response.json())
+        response_201 = ExtractResourcesResponse201.from_dict(json_codec.loads(response.content))
 
         return response_201
     if client.raise_on_unexpected_status:
@@ -44,15 +23,7 @@ def _parse_response(
         return None
 
 
-def _build_response(
-    *, client: Union[AuthenticatedClient, Client], response: httpx.Response
-) -> Response[ExtractResourcesResponse201]:
-    return Response(
-        status_code=HTTPStatus(response.status_code),
-        content=response.content,
-        headers=response.headers,
-        parsed=_parse_response(client=client, response=response),
-    )
+_endpoint = make_post_endpoint("/my/ships/{ship_symbol}/extract", _parse_response, 201)
 
 
 def sync_detailed(
@@ -84,16 +55,7 @@ def sync_detailed(
         Response[ExtractResourcesResponse201]
     """
 
-    kwargs = _get_kwargs(
-        ship_symbol=ship_symbol,
-        body=body,
-    )
-
-    response = client.get_httpx_client().request(
-        **kwargs,
-    )
-
-    return _build_response(client=client, response=response)
+    return _endpoint.sync_detailed(ship_symbol, client=client, body=body)
 
 
 def sync(
@@ -161,14 +123,7 @@ async def asyncio_detailed(
         Response[ExtractResourcesResponse201]
     """
 
-    kwargs = _get_kwargs(
-        ship_symbol=ship_symbol,
-        body=body,
-    )
-
-    response = await client.get_async_httpx_client().request(**kwargs)
-
-    return _build_response(client=client, response=response)
+    return await _endpoint.asyncio_detailed(ship_symbol, client=client, body=body)
 
 
 async def asyncio(
@@ -1,20 +1,21 @@
-from http import HTTPStatus
 from typing import Any, Optional, Union, cast
 
 import httpx
 
-from ... import errors
+from ... import errors, json_codec
 from ...client import AuthenticatedClient, Client
 from ...models.get_ship_cooldown_response_200 import GetShipCooldownResponse200
 from ...types import Response
 
+_URL_TMPL = "/my/ships/%s/cooldown"
+
 
 def _get_kwargs(
     ship_symbol: str,
 ) -> dict[str, Any]:
     _kwargs: dict[str, Any] = {
         "method": "get",
-        "url": f"/my/ships/{ship_symbol}/cooldown",
+        "url": _URL_TMPL % ship_symbol,
     }
 
     return _kwargs
@@ -24,7 +25,7 @@ def _parse_response(
     *, client: Union[AuthenticatedClient, Client], response: httpx.Response
 ) -> Optional[Union[Any, GetShipCooldownResponse200]]:
     if response.status_code == 200:
-        response_200 = GetShipCooldownResponse200.from_dict(response.json())
+        response_200 = GetShipCooldownResponse200.from_dict(json_codec.loads(response.content))
 
         return response_200
     if response.status_code == 204:
@@ -40,7 +41,7 @@ def _build_response(
     *, client: Union[AuthenticatedClient, Client], response: httpx.Response
 ) -> Response[Union[Any, GetShipCooldownResponse200]]:
     return Response(
-        status_code=HTTPStatus(response.status_code),
+        status_code=response.status_code,
         content=response.content,
         headers=response.headers,
         parsed=_parse_response(client=client, response=response),
@@ -1,41 +1,20 @@
-from http import HTTPStatus
-from typing import Any, Optional, Union
+from typing import Optional, Union
 
 import httpx
 
-from ... import errors
+from ... import errors, json_codec
 from ...client import AuthenticatedClient, Client
 from ...models.jettison_body import JettisonBody
 from ...models.jettison_response_200 import JettisonResponse200
 from ...types import Response
-
-
-def _get_kwargs(
-    ship_symbol: str,
-    *,
-    body: JettisonBody,
-) -> dict[str, Any]:
-    headers: dict[str, Any] = {}
-
-    _kwargs: dict[str, Any] = {
-        "method": "post",
-        "url": f"/my/ships/{ship_symbol}/jettison",
-    }
-
-    _body = body.to_dict()
-
-    _kwargs["json"] = _body
-    headers["Content-Type"] = "application/json"
-
-    _kwargs["headers"] = headers
-    return _kwargs
+from .._endpoint_factory import make_post_endpoint
 
 
 def _parse_response(
     *, client: Union[AuthenticatedClient, Client], response: httpx.Response
 ) -> Optional[JettisonResponse200]:
     if response.status_code == 200:
-        response_200 = JettisonResponse200.from_dict(response.json())
+        response_200 = JettisonResponse200.from_dict(json_codec.loads(response.content))
 
         return response_200
     if client.raise_on_unexpected_status:
@@ -44,15 +23,7 @@ def _parse_response(
         return None
 
 
-def _build_response(
-    *, client: Union[AuthenticatedClient, Client], response: httpx.Response
-) -> Response[JettisonResponse200]:
-    return Response(
-        status_code=HTTPStatus(response.status_code),
-        content=response.content,
-        headers=response.headers,
-        parsed=_parse_response(client=client, response=response),
-    )
+_endpoint = make_post_endpoint("/my/ships/{ship_symbol}/jettison", _parse_response, 200)
 
 
 def sync_detailed(
@@ -77,16 +48,7 @@ def sync_detailed(
         Response[JettisonResponse200]
     """
 
-    kwargs = _get_kwargs(
-        ship_symbol=ship_symbol,
-        body=body,
-    )
-
-    response = client.get_httpx_client().request(
-        **kwargs,
-    )
-
-    return _build_response(client=client, response=response)
+    return _endpoint.sync_detailed(ship_symbol, client=client, body=body)
 
 
 def sync(
@@ -140,14 +102,7 @@ async def asyncio_detailed(
         Response[JettisonResponse200]
     """
 
-    kwargs = _get_kwargs(
-        ship_symbol=ship_symbol,
-        body=body,
-    )
-
-    response = await client.get_async_httpx_client().request(**kwargs)
-
-    return _build_response(client=client, response=response)
+    return await _endpoint.asyncio_detailed(ship_symbol, client=client, body=body)
 
 
 async def asyncio(
@@ -1,30 +1,19 @@
-from http import HTTPStatus
-from typing import Any, Optional, Union
+from typing import Optional, Union
 
 import httpx
 
-from ... import errors
+from ... import errors, json_codec
 from ...client import AuthenticatedClient, Client
 from ...models.negotiate_contract_negotiate_contract_200_response import NegotiateContractNegotiateContract200Response
 from ...types import Response
-
-
-def _get_kwargs(
-    ship_symbol: str,
-) -> dict[str, Any]:
-    _kwargs: dict[str, Any] = {
-        "method": "post",
-        "url": f"/my/ships/{ship_symbol}/negotiate/contract",
-    }
-
-    return _kwargs
+from .._endpoint_factory import make_post_endpoint
 
 
 def _parse_response(
     *, client: Union[AuthenticatedClient, Client], response: httpx.Response
 ) -> Optional[NegotiateContractNegotiateContract200Response]:
     if response.status_code == 201:
-        response_201 = NegotiateContractNegotiateContract200Response.from_dict(response.json())
+        response_201 = NegotiateContractNegotiateContract200Response.from_dict(json_codec.loads(response.content))
 
         return response_201
     if client.raise_on_unexpected_status:
@@ -33,15 +22,7 @@ def _parse_response(
         return None
 
 
-def _build_response(
-    *, client: Union[AuthenticatedClient, Client], response: httpx.Response
-) -> Response[NegotiateContractNegotiateContract200Response]:
-    return Response(
-        status_code=HTTPStatus(response.status_code),
-        content=response.content,
-        headers=response.headers,
-        parsed=_parse_response(client=client, response=response),
-    )
+_endpoint = make_post_endpoint("/my/ships/{ship_symbol}/negotiate/contract", _parse_response, 201)
 
 
 def sync_detailed(
@@ -73,15 +54,7 @@ def sync_detailed(
         Response[NegotiateContractNegotiateContract200Response]
     """
 
-    kwargs = _get_kwargs(
-        ship_symbol=ship_symbol,
-    )
-
-    response = client.get_httpx_client().request(
-        **kwargs,
-    )
-
-    return _build_response(client=client, response=response)
+    return _endpoint.sync_detailed(ship_symbol, client=client)
 
 
 def sync(
@@ -148,13 +121,7 @@ async def asyncio_detailed(
         Response[NegotiateContractNegotiateContract200Response]
     """
 
-    kwargs = _get_kwargs(
-        ship_symbol=ship_symbol,
-    )
-
-    response = await client.get_async_httpx_client().request(**kwargs)
-
-    return _build_response(client=client, response=response)
+    return await _endpoint.asyncio_detailed(ship_symbol, client=client)
 
 
 async def asyncio(
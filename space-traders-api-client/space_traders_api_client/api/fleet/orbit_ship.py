@@ -1,30 +1,20 @@
-from http import HTTPStatus
-from typing import Any, Optional, Union
+from typing import Optional, Union
 
 import httpx
 
-from ... import errors
+from ... import errors, json_codec
 from ...client import AuthenticatedClient, Client
 from ...models.orbit_ship_orbit_ship_200_response import OrbitShipOrbitShip200Response
 from ...types import Response
-
-
-def _get_kwargs(
-    ship_symbol: str,
-) -> dict[str, Any]:
-    _kwargs: dict[str, Any] = {
-        "method": "post",
-        "url": f"/my/ships/{ship_symbol}/orbit",
-    }
-
-    return _kwargs
+from .._endpoint_factory import make_post_endpoint
+from ._batch import batch, call
 
 
 def _parse_response(
     *, client: Union[AuthenticatedClient, Client], response: httpx.Response
 ) -> Optional[OrbitShipOrbitShip200Response]:
     if response.status_code == 200:
-        response_200 = OrbitShipOrbitShip200Response.from_dict(response.json())
+        response_200 = OrbitShipOrbitShip200Response.from_dict(json_codec.loads(response.content))
 
         return response_200
     if client.raise_on_unexpected_status:
@@ -33,15 +23,7 @@ def _parse_response(
         return None
 
 
-def _build_response(
-    *, client: Union[AuthenticatedClient, Client], response: httpx.Response
-) -> Response[OrbitShipOrbitShip200Response]:
-    return Response(
-        status_code=HTTPStatus(response.status_code),
-        content=response.content,
-        headers=response.headers,
-        parsed=_parse_response(client=client, response=response),
-    )
+_endpoint = make_post_endpoint("/my/ships/{ship_symbol}/orbit", _parse_response, 200)
 
 
 def sync_detailed(
@@ -71,15 +53,7 @@ def sync_detailed(
         Response[OrbitShipOrbitShip200Response]
     """
 
-    kwargs = _get_kwargs(
-        ship_symbol=ship_symbol,
-    )
-
-    response = client.get_httpx_client().request(
-        **kwargs,
-    )
-
-    return _build_response(client=client, response=response)
+    return _endpoint.sync_detailed(ship_symbol, client=client)
 
 
 def sync(
@@ -142,13 +116,7 @@ async def asyncio_detailed(
         Response[OrbitShipOrbitShip200Response]
     """
 
-    kwargs = _get_kwargs(
-        ship_symbol=ship_symbol,
-    )
-
-    response = await client.get_async_httpx_client().request(**kwargs)
-
-    return _build_response(client=client, response=response)
+    return await _endpoint.asyncio_detailed(ship_symbol, client=client)
 
 
 async def asyncio(
@@ -184,3 +152,14 @@ async def asyncio(
             client=client,
         )
     ).parsed
+
+
+async def bulk_orbit_ship(
+    ship_symbols: list[str], *, client: AuthenticatedClient
+) -> list[Response[OrbitShipOrbitShip200Response]]:
+    """Put several ships in orbit concurrently on one client
+
+    Returns:
+        list[Response[OrbitShipOrbitShip200Response]]: In the order of ``ship_symbols``
+    """
+    return await batch(client, [call(asyncio_detailed, ship_symbol=symbol) for symbol in ship_symbols])
@@ -1,13 +1,16 @@
-from http import HTTPStatus
 from typing import Any, Optional, Union
 
 import httpx
 
-from ... import errors
+from ... import errors, json_codec
 from ...client import AuthenticatedClient, Client
 from ...models.purchase_cargo_purchase_cargo_201_response import PurchaseCargoPurchaseCargo201Response
 from ...models.purchase_cargo_purchase_cargo_request import PurchaseCargoPurchaseCargoRequest
 from ...types import Response
+from ._batch import batch, call
+
+_JSON_HEADERS = {"Content-Type": "application/json"}
+_URL_TMPL = "/my/ships/%s/purchase"
 
 
 def _get_kwargs(
@@ -15,19 +18,13 @@ def _get_kwargs(
     *,
     body: PurchaseCargoPurchaseCargoRequest,
 ) -> dict[str, Any]:
-    headers: dict[str, Any] = {}
-
     _kwargs: dict[str, Any] = {
         "method": "post",
-        "url": f"/my/ships/{ship_symbol}/purchase",
+        "url": _URL_TMPL % ship_symbol,
     }
 
-    _body = body.to_dict()
-
-    _kwargs["json"] = _body
-    headers["Content-Type"] = "application/json"
-
-    _kwargs["headers"] = headers
+    _kwargs["content"] = body.to_json_bytes()
+    _kwargs["headers"] = _JSON_HEADERS
     return _kwargs
 
 
@@ -35,7 +32,7 @@ def _parse_response(
     *, client: Union[AuthenticatedClient, Client], response: httpx.Response
 ) -> Optional[PurchaseCargoPurchaseCargo201Response]:
     if response.status_code == 201:
-        response_201 = PurchaseCargoPurchaseCargo201Response.from_dict(response.json())
+        response_201 = PurchaseCargoPurchaseCargo201Response.from_dict(json_codec.loads(response.content))
 
         return response_201
     if client.raise_on_unexpected_status:
@@ -48,7 +45,7 @@ def _build_response(
     *, client: Union[AuthenticatedClient, Client], response: httpx.Response
 ) -> Response[PurchaseCargoPurchaseCargo201Response]:
     return Response(
-        status_code=HTTPStatus(response.status_code),
+        status_code=response.status_code,
         content=response.content,
         headers=response.headers,
         parsed=_parse_response(client=client, response=response),
@@ -211,3 +208,19 @@ async def asyncio(
             body=body,
         )
     ).parsed
+
+
+async def bulk_purchase_cargo(
+    requests: list[tuple[str, PurchaseCargoPurchaseCargoRequest]], *, client: AuthenticatedClient
+) -> list[Response[PurchaseCargoPurchaseCargo201Response]]:
+    """Purchase cargo for several ships concurrently on one client
+
+    Args:
+        requests (list[tuple[str, PurchaseCargoPurchaseCargoRequest]]): ``(ship_symbol, body)`` pairs.
+
+    Returns:
+        list[Response[PurchaseCargoPurchaseCargo201Response]]: In the order of ``requests``
+    """
+    return await batch(
+        client, [call(asyncio_detailed, ship_symbol=ship_symbol, body=body) for ship_symbol, body in requests]
+    )
@@ -1,32 +1,27 @@
-from http import HTTPStatus
 from typing import Any, Optional, Union
 
 import httpx
 
-from ... import errors
+from ... import errors, json_codec
 from ...client import AuthenticatedClient, Client
 from ...models.purchase_ship_body import PurchaseShipBody
 from ...models.purchase_ship_response_201 import PurchaseShipResponse201
 from ...types import Response
 
+_JSON_HEADERS = {"Content-Type": "application/json"}
+
 
 def _get_kwargs(
     *,
     body: PurchaseShipBody,
 ) -> dict[str, Any]:
-    headers: dict[str, Any] = {}
-
     _kwargs: dict[str, Any] = {
         "method": "post",
         "url": "/my/ships",
     }
 
-    _body = body.to_dict()
-
-    _kwargs["json"] = _body
-    headers["Content-Type"] = "application/json"
-
-    _kwargs["headers"] = headers
+    _kwargs["content"] = body.to_json_bytes()
+    _kwargs["headers"] = _JSON_HEADERS
     return _kwargs
 
 
@@ -34,7 +29,7 @@ def _parse_response(
     *, client: Union[AuthenticatedClient, Client], response: httpx.Response
 ) -> Optional[PurchaseShipResponse201]:
     if response.status_code == 201:
-        response_201 = PurchaseShipResponse201.from_dict(response.json())
+        response_201 = PurchaseShipResponse201.from_dict(json_codec.loads(response.content))
 
         return response_201
     if client.raise_on_unexpected_status:
@@ -47,7 +42,7 @@ def _build_response(
     *, client: Union[AuthenticatedClient, Client], response: httpx.Response
 ) -> Response[PurchaseShipResponse201]:
     return Response(
-        status_code=HTTPStatus(response.status_code),
+        status_code=response.status_code,
         content=response.content,
         headers=response.headers,
         parsed=_parse_response(client=client, response=response),
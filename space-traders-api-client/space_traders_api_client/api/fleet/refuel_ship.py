@@ -1,33 +1,29 @@
-from http import HTTPStatus
 from typing import Any, Optional, Union
 
 import httpx
 
-from ... import errors
+from ... import errors, json_codec
 from ...client import AuthenticatedClient, Client
 from ...models.refuel_ship_body import RefuelShipBody
 from ...models.refuel_ship_response_200 import RefuelShipResponse200
 from ...types import Response
 
+_JSON_HEADERS = {"Content-Type": "application/json"}
+_URL_TMPL = "/my/ships/%s/refuel"
+
 
 def _get_kwargs(
     ship_symbol: str,
     *,
     body: RefuelShipBody,
 ) -> dict[str, Any]:
-    headers: dict[str, Any] = {}
-
     _kwargs: dict[str, Any] = {
         "method": "post",
-        "url": f"/my/ships/{ship_symbol}/refuel",
+        "url": _URL_TMPL % ship_symbol,
     }
 
-    _body = body.to_dict()
-
-    _kwargs["json"] = _body
-    headers["Content-Type"] = "application/json"
-
-    _kwargs["headers"] = headers
+    _kwargs["content"] = json_codec.dumps(body.to_dict())
+    _kwargs["headers"] = _JSON_HEADERS
     return _kwargs
 
 
@@ -35,7 +31,7 @@ def _parse_response(
     *, client: Union[AuthenticatedClient, Client], response: httpx.Response
 ) -> Optional[RefuelShipResponse200]:
     if response.status_code == 200:
-        response_200 = RefuelShipResponse200.from_dict(response.json())
+        response_200 = RefuelShipResponse200.from_dict(json_codec.loads(response.content))
 
         return response_200
     if client.raise_on_unexpected_status:
@@ -48,7 +44,7 @@ def _build_response(
     *, client: Union[AuthenticatedClient, Client], response: httpx.Response
 ) -> Response[RefuelShipResponse200]:
     return Response(
-        status_code=HTTPStatus(response.status_code),
+        status_code=response.status_code,
         content=response.content,
         headers=response.headers,
         parsed=_parse_response(client=client, response=response),
@@ -1,33 +1,29 @@
-from http import HTTPStatus
 from typing import Any, Optional, Union
 
 import httpx
 
-from ... import errors
+from ... import errors, json_codec
 from ...client import AuthenticatedClient, Client
 from ...models.sell_cargo_sell_cargo_201_response import SellCargoSellCargo201Response
 from ...models.sell_cargo_sell_cargo_request import SellCargoSellCargoRequest
 from ...types import Response
 
+_JSON_HEADERS = {"Content-Type": "application/json"}
+_URL_TMPL = "/my/ships/%s/sell"
+
 
 def _get_kwargs(
     ship_symbol: str,
     *,
     body: SellCargoSellCargoRequest,
 ) -> dict[str, Any]:
-    headers: dict[str, Any] = {}
-
     _kwargs: dict[str, Any] = {
         "method": "post",
-        "url": f"/my/ships/{ship_symbol}/sell",
+        "url": _URL_TMPL % ship_symbol,
     }
 
-    _body = body.to_dict()
-
-    _kwargs["json"] = _body
-    headers["Content-Type"] = "application/json"
-
-    _kwargs["headers"] = headers
+    _kwargs["content"] = json_codec.dumps(body.to_dict())
+    _kwargs["headers"] = _JSON_HEADERS
     return _kwargs
 
 
@@ -35,7 +31,7 @@ def _parse_response(
     *, client: Union[AuthenticatedClient, Client], response: httpx.Response
 ) -> Optional[SellCargoSellCargo201Response]:
     if response.status_code == 201:
-        response_201 = SellCargoSellCargo201Response.from_dict(response.json())
+        response_201 = SellCargoSellCargo201Response.from_dict(json_codec.loads(response.content))
 
         return response_201
     if client.raise_on_unexpected_status:
@@ -48,7 +44,7 @@ def _build_response(
     *, client: Union[AuthenticatedClient, Client], response: httpx.Response
 ) -> Response[SellCargoSellCargo201Response]:
     return Response(
-        status_code=HTTPStatus(response.status_code),
+        status_code=response.status_code,
         content=response.content,
         headers=response.headers,
         parsed=_parse_response(client=client, response=response),
@@ -1,13 +1,14 @@
-from http import HTTPStatus
 from typing import Any, Optional, Union
 
 import httpx
 
-from ... import errors
+from ... import errors, json_codec
 from ...client import AuthenticatedClient, Client
 from ...models.get_shipyard_response_200 import GetShipyardResponse200
 from ...types import Response
 
+_URL_TMPL = "/systems/%s/waypoints/%s/shipyard"
+
 
 def _get_kwargs(
     system_symbol: str,
@@ -15,7 +16,7 @@ def _get_kwargs(
 ) -> dict[str, Any]:
     _kwargs: dict[str, Any] = {
         "method": "get",
-        "url": f"/systems/{system_symbol}/waypoints/{waypoint_symbol}/shipyard",
+        "url": _URL_TMPL % (system_symbol, waypoint_symbol),
     }
 
     return _kwargs
@@ -25,7 +26,7 @@ def _parse_response(
     *, client: Union[AuthenticatedClient, Client], response: httpx.Response
 ) -> Optional[GetShipyardResponse200]:
     if response.status_code == 200:
-        response_200 = GetShipyardResponse200.from_dict(response.json())
+        response_200 = GetShipyardResponse200.from_dict(json_codec.loads(response.content))
 
         return response_200
     if client.raise_on_unexpected_status:
@@ -38,7 +39,7 @@ def _build_response(
     *, client: Union[AuthenticatedClient, Client], response: httpx.Response
 ) -> Response[GetShipyardResponse200]:
     return Response(
-        status_code=HTTPStatus(response.status_code),
+        status_code=response.status_code,
         content=response.content,
         headers=response.headers,
         parsed=_parse_response(client=client, response=response),
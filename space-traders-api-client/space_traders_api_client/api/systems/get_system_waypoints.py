@@ -1,15 +1,16 @@
-from http import HTTPStatus
 from typing import Any, Optional, Union
 
 import httpx
 
-from ... import errors
+from ... import errors, json_codec
 from ...client import AuthenticatedClient, Client
 from ...models.get_system_waypoints_response_200 import GetSystemWaypointsResponse200
 from ...models.waypoint_trait_symbol import WaypointTraitSymbol
 from ...models.waypoint_type import WaypointType
 from ...types import UNSET, Response, Unset
 
+_URL_TMPL = "/systems/%s/waypoints"
+
 
 def _get_kwargs(
     system_symbol: str,
@@ -48,7 +49,7 @@ def _get_kwargs(
 
     _kwargs: dict[str, Any] = {
         "method": "get",
-        "url": f"/systems/{system_symbol}/waypoints",
+        "url": _URL_TMPL % system_symbol,
         "params": params,
     }
 
@@ -59,7 +60,7 @@ def _parse_response(
     *, client: Union[AuthenticatedClient, Client], response: httpx.Response
 ) -> Optional[GetSystemWaypointsResponse200]:
     if response.status_code == 200:
-        response_200 = GetSystemWaypointsResponse200.from_dict(response.json())
+        response_200 = GetSystemWaypointsResponse200.from_dict(json_codec.loads(response.content))
 
         return response_200
     if client.raise_on_unexpected_status:
@@ -72,7 +73,7 @@ def _build_response(
     *, client: Union[AuthenticatedClient, Client], response: httpx.Response
 ) -> Response[GetSystemWaypointsResponse200]:
     return Response(
-        status_code=HTTPStatus(response.status_code),
+        status_code=response.status_code,
         content=response.content,
         headers=response.headers,
         parsed=_parse_response(client=client, response=response),
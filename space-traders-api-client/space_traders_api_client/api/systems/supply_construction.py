@@ -1,14 +1,16 @@
-from http import HTTPStatus
 from typing import Any, Optional, Union
 
 import httpx
 
-from ... import errors
+from ... import errors, json_codec
 from ...client import AuthenticatedClient, Client
 from ...models.supply_construction_body import SupplyConstructionBody
 from ...models.supply_construction_response_201 import SupplyConstructionResponse201
 from ...types import Response
 
+_URL_TMPL = "/systems/%s/waypoints/%s/construction/supply"
+_JSON_HEADERS = {"Content-Type": "application/json"}
+
 
 def _get_kwargs(
     system_symbol: str,
@@ -16,19 +18,13 @@ def _get_kwargs(
     *,
     body: SupplyConstructionBody,
 ) -> dict[str, Any]:
-    headers: dict[str, Any] = {}
-
     _kwargs: dict[str, Any] = {
         "method": "post",
-        "url": f"/systems/{system_symbol}/waypoints/{waypoint_symbol}/construction/supply",
+        "url": _URL_TMPL % (system_symbol, waypoint_symbol),
     }
 
-    _body = body.to_dict()
-
-    _kwargs["json"] = _body
-    headers["Content-Type"] = "application/json"
-
-    _kwargs["headers"] = headers
+    _kwargs["content"] = json_codec.dumps(body.to_dict())
+    _kwargs["headers"] = _JSON_HEADERS
     return _kwargs
 
 
@@ -36,7 +32,7 @@ def _parse_response(
     *, client: Union[AuthenticatedClient, Client], response: httpx.Response
 ) -> Optional[SupplyConstructionResponse201]:
     if response.status_code == 201:
-        response_201 = SupplyConstructionResponse201.from_dict(response.json())
+        response_201 = SupplyConstructionResponse201.from_dict(json_codec.loads(response.content))
 
         return response_201
     if client.raise_on_unexpected_status:
@@ -49,7 +45,7 @@ def _build_response(
     *, client: Union[AuthenticatedClient, Client], response: httpx.Response
 ) -> Response[SupplyConstructionResponse201]:
     return Response(
-        status_code=HTTPStatus(response.status_code),
+        status_code=response.status_code,
         content=response.content,
         headers=response.headers,
         parsed=_parse_response(client=client, response=response),
@@ -136,6 +136,9 @@ class AuthenticatedClient:
 
         ``httpx_args``: A dictionary of additional arguments to be passed to the ``httpx.Client`` and ``httpx.AsyncClient`` constructor.
 
+        ``use_aiohttp``: Send async requests through aiohttp via ``httpx_aiohttp.AiohttpTransport`` (the ``aiohttp``
+        extra). HTTP/2 and connection limits in ``httpx_args`` do not apply to that transport. Default value is False.
+
 
     Attributes:
         raise_on_unexpected_status: Whether or not to raise an errors.UnexpectedStatus if the API returns a
@@ -154,6 +157,7 @@ class AuthenticatedClient:
     _verify_ssl: Union[str, bool, ssl.SSLContext] = field(default=True, kw_only=True, alias="verify_ssl")
     _follow_redirects: bool = field(default=False, kw_only=True, alias="follow_redirects")
     _httpx_args: dict[str, Any] = field(factory=dict, kw_only=True, alias="httpx_args")
+    _use_aiohttp: bool = field(default=False, kw_only=True, alias="use_aiohttp")
     _client: Optional[httpx.Client] = field(default=None, init=False)
     _async_client: Optional[httpx.AsyncClient] = field(default=None, init=False)
 
@@ -220,6 +224,11 @@ class AuthenticatedClient:
         """Get the underlying httpx.AsyncClient, constructing a new one if not previously set"""
         if self._async_client is None:
             self._headers[self.auth_header_name] = f"{self.prefix} {self.token}" if self.prefix else self.token
+            httpx_args = self._httpx_args
+            if self._use_aiohttp:
+                from httpx_aiohttp import AiohttpTransport
+
+                httpx_args = {**httpx_args, "transport": AiohttpTransport()}
             self._async_client = httpx.AsyncClient(
                 base_url=self._base_url,
                 cookies=self._cookies,
@@ -227,6 +236,6 @@ class AuthenticatedClient:
                 timeout=self._timeout,
                 verify=self._verify_ssl,
                 follow_redirects=self._follow_redirects,
-                **self._httpx_args,
+                **httpx_args,
             )
         return self._async_client
\ No newline at end of file
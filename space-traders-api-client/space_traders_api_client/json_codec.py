@@ -0,0 +1,35 @@
+"""Contains the JSON codec used to decode and encode API payloads
+
+orjson is used when installed (the ``orjson`` extra), otherwise the standard library.
+"""
+
+from typing import Any
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - depends on the environment
+    orjson = None
+
+if orjson is not None:
+
+    def loads(data: bytes) -> Any:
+        """Decode JSON bytes"""
+        return orjson.loads(data)
+
+    def dumps(obj: Any) -> bytes:
+        """Encode an object as compact JSON bytes"""
+        return orjson.dumps(obj)
+
+else:
+    import json as _json
+
+    def loads(data: bytes) -> Any:
+        """Decode JSON bytes"""
+        return _json.loads(data)
+
+    def dumps(obj: Any) -> bytes:
+        """Encode an object as compact JSON bytes"""
+        return _json.dumps(obj, separators=(",", ":")).encode()
+
+
+__all__ = ["dumps", "loads"]
@@ -3,6 +3,7 @@ from typing import TYPE_CHECKING, Any, TypeVar, Union
 from attrs import define as _attrs_define
 from attrs import field as _attrs_field
 
+from .. import json_codec
 from ..types import UNSET, Unset
 
 if TYPE_CHECKING:
@@ -11,6 +12,10 @@ if TYPE_CHECKING:
 
 T = TypeVar("T", bound="ExtractResourcesBody")
 
+# A survey is reused for many extractions and its signature identifies its payload
+_ENCODED_BY_SIGNATURE: dict[str, bytes] = {}
+_MAX_ENCODED = 256
+
 
 @_attrs_define
 class ExtractResourcesBody:
@@ -36,6 +41,19 @@ class ExtractResourcesBody:
 
         return field_dict
 
+    def to_json_bytes(self) -> bytes:
+        if self.additional_properties:
+            return json_codec.dumps(self.to_dict())
+        if isinstance(self.survey, Unset):
+            return b"{}"
+        encoded = _ENCODED_BY_SIGNATURE.get(self.survey.signature)
+        if encoded is None:
+            if len(_ENCODED_BY_SIGNATURE) >= _MAX_ENCODED:
+                _ENCODED_BY_SIGNATURE.clear()
+            encoded = json_codec.dumps(self.to_dict())
+            _ENCODED_BY_SIGNATURE[self.survey.signature] = encoded
+        return encoded
+
     @classmethod
     def from_dict(cls: type[T], src_dict: dict[str, Any]) -> T:
         from ..models.survey import Survey
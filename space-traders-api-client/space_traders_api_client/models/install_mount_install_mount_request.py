@@ -3,6 +3,8 @@ from typing import Any, TypeVar
 from attrs import define as _attrs_define
 from attrs import field as _attrs_field
 
+from .. import json_codec
+
 T = TypeVar("T", bound="InstallMountInstallMountRequest")
 
 
@@ -29,6 +31,11 @@ class InstallMountInstallMountRequest:
 
         return field_dict
 
+    def to_json_bytes(self) -> bytes:
+        if self.additional_properties:
+            return json_codec.dumps(self.to_dict())
+        return json_codec.dumps({"symbol": self.symbol})
+
     @classmethod
     def from_dict(cls: type[T], src_dict: dict[str, Any]) -> T:
         d = src_dict.copy()
@@ -3,6 +3,7 @@ from typing import Any, TypeVar
 from attrs import define as _attrs_define
 from attrs import field as _attrs_field
 
+from .. import json_codec
 from ..models.trade_symbol import TradeSymbol
 
 T = TypeVar("T", bound="PurchaseCargoPurchaseCargoRequest")
@@ -36,6 +37,11 @@ class PurchaseCargoPurchaseCargoRequest:
 
         return field_dict
 
+    def to_json_bytes(self) -> bytes:
+        if self.additional_properties:
+            return json_codec.dumps(self.to_dict())
+        return b'{"symbol":"%s","units":%d}' % (self.symbol.value.encode(), self.units)
+
     @classmethod
     def from_dict(cls: type[T], src_dict: dict[str, Any]) -> T:
         d = src_dict.copy()
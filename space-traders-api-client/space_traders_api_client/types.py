@@ -2,9 +2,9 @@
 
 from collections.abc import MutableMapping
 from http import HTTPStatus
-from typing import BinaryIO, Generic, Literal, Optional, TypeVar
+from typing import BinaryIO, Callable, Generic, Literal, Optional, TypeVar, Union
 
-from attrs import define
+from attrs import define, field
 
 
 class Unset:
@@ -35,12 +35,33 @@ T = TypeVar("T")
 
 @define
 class Response(Generic[T]):
-    """A response from an endpoint"""
+    """A response from an endpoint
 
-    status_code: HTTPStatus
+    ``parsed`` may be given directly, or as a ``parse`` callable that is run on first access.
+    ``status_code`` is the raw integer from httpx; use ``status`` for the HTTPStatus member.
+    """
+
+    status_code: Union[int, HTTPStatus]
     content: bytes
     headers: MutableMapping[str, str]
-    parsed: Optional[T]
+    _parsed: Optional[T] = None
+    _parse: Optional[Callable[[], Optional[T]]] = field(default=None, eq=False, repr=False)
+
+    @property
+    def status(self) -> HTTPStatus:
+        return HTTPStatus(self.status_code)
+
+    @property
+    def parsed(self) -> Optional[T]:
+        if self._parse is not None:
+            self._parsed = self._parse()
+            self._parse = None
+        return self._parsed
+
+    @parsed.setter
+    def parsed(self, value: Optional[T]) -> None:
+        self._parsed = value
+        self._parse = None
 
 
 __all__ = ["UNSET", "File", "FileJsonType", "Response", "Unset"]
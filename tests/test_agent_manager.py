@@ -114,6 +114,19 @@ class TestAgentManager:
             
             assert manager.agent == mock_response.parsed.data
 
+    @pytest.mark.asyncio
+    async def test_status_after_initialize_reuses_fetch(self, mock_response, cleanup_queues):
+        """Test the first status check after initialize skips the API"""
+        with patch('game.agent_manager.get_my_agent.asyncio_detailed') as mock_get:
+            mock_get.return_value = mock_response
+
+            manager = AgentManager("test_token")
+            await manager.initialize()
+            agent = await manager.get_agent_status()
+
+            assert agent is manager.agent
+            mock_get.assert_called_once()
+
     @pytest.mark.asyncio
     async def test_initialize_failure(self, cleanup_queues):
         """Test initialization failure"""
@@ -122,4 +135,25 @@ class TestAgentManager:
             
             manager = AgentManager("test_token")
             with pytest.raises(Exception, match="Failed to initialize agent state"):
-                await manager.initialize()
\ No newline at end of file
+                await manager.initialize()
+
+    @pytest.mark.asyncio
+    async def test_aclose_closes_shared_client(self, cleanup_queues):
+        """Test shutdown closes the shared HTTP client"""
+        manager = AgentManager("test_token")
+        http_client = manager.client.get_async_httpx_client()
+
+        await manager.aclose()
+
+        assert http_client.is_closed
+
+    @pytest.mark.asyncio
+    async def test_http_client_is_reused(self, cleanup_queues):
+        """Test every request path gets the same pooled HTTP client"""
+        manager = AgentManager("test_token")
+        http_client = manager.client.get_async_httpx_client()
+
+        assert manager.client.get_async_httpx_client() is http_client
+        assert http_client.headers["Authorization"] == "Bearer test_token"
+
+        await manager.aclose()
@@ -0,0 +1,137 @@
+"""Tests for batched fleet requests"""
+import asyncio
+
+import httpx
+import pytest
+
+from space_traders_api_client import AuthenticatedClient
+from space_traders_api_client.api.fleet import Batcher, batch, call, orbit_ship
+
+
+@pytest.fixture
+async def batcher():
+    """Fixture for a Batcher closed after each test"""
+    batcher = Batcher(window=0.01, max_batch=2)
+    yield batcher
+    await batcher.aclose()
+
+
+def make_client(handler) -> AuthenticatedClient:
+    """Build a client whose requests are answered by ``handler``"""
+    return AuthenticatedClient(
+        base_url="https://api.test",
+        token="test_token",
+        httpx_args={"transport": httpx.MockTransport(handler)},
+    )
+
+
+class TestBatcher:
+    """Test suite for Batcher class"""
+
+    @pytest.mark.asyncio
+    async def test_submit_resolves_with_result(self, batcher):
+        """Test a submitted request resolves with its result"""
+        async def request():
+            return "done"
+
+        assert await batcher.submit(request) == "done"
+
+    @pytest.mark.asyncio
+    async def test_submit_propagates_exception(self, batcher):
+        """Test a failed request raises from its future"""
+        async def request():
+            raise ValueError("API Error")
+
+        with pytest.raises(ValueError, match="API Error"):
+            await batcher.submit(request)
+
+    @pytest.mark.asyncio
+    async def test_requests_in_window_share_burst(self, batcher):
+        """Test requests within the window run together, max_batch at a time"""
+        in_flight = 0
+        bursts = []
+
+        async def request():
+            nonlocal in_flight
+            in_flight += 1
+            await asyncio.sleep(0.01)
+            bursts.append(in_flight)
+            in_flight -= 1
+
+        await asyncio.gather(*(batcher.submit(request) for _ in range(3)))
+
+        assert bursts == [2, 1, 1]
+
+    @pytest.mark.asyncio
+    async def test_aclose_cancels_in_flight_burst(self, batcher):
+        """Test closing mid-burst cancels the burst's futures"""
+        started = asyncio.Event()
+
+        async def request():
+            started.set()
+            await asyncio.sleep(10)
+
+        future = batcher.submit(request)
+        await started.wait()
+        await batcher.aclose()
+
+        with pytest.raises(asyncio.CancelledError):
+            await asyncio.wait_for(future, timeout=1)
+
+    @pytest.mark.asyncio
+    async def test_aclose_cancels_queued_requests(self):
+        """Test closing before the window elapses cancels queued requests"""
+        batcher = Batcher(window=10)
+
+        async def request():
+            return "done"
+
+        future = batcher.submit(request)
+        await batcher.aclose()
+
+        assert future.cancelled()
+
+
+class TestBatch:
+    """Test suite for batch and the bulk endpoint helpers"""
+
+    @pytest.mark.asyncio
+    async def test_batch_keeps_call_order(self):
+        """Test results come back in the order of the calls"""
+        async def echo(client, value):
+            await asyncio.sleep(0.01 * value)
+            return value
+
+        results = await batch(None, [call(echo, value=v) for v in (3, 1, 2)])
+
+        assert results == [3, 1, 2]
+
+    @pytest.mark.asyncio
+    async def test_batch_return_exceptions(self):
+        """Test failures are returned in place when asked"""
+        async def fail(client):
+            raise ValueError("API Error")
+
+        async def succeed(client):
+            return "ok"
+
+        results = await batch(None, [call(fail), call(succeed)], return_exceptions=True)
+
+        assert isinstance(results[0], ValueError)
+        assert results[1] == "ok"
+
+    @pytest.mark.asyncio
+    async def test_bulk_orbit_ship(self):
+        """Test bulk_orbit_ship sends one request per ship on the client"""
+        paths = []
+
+        def handler(request):
+            paths.append(request.url.path)
+            return httpx.Response(200, json={"data": {}})
+
+        client = make_client(handler)
+        responses = await orbit_ship.bulk_orbit_ship(["SHIP-1", "SHIP-2"], client=client)
+        await client.get_async_httpx_client().aclose()
+
+        assert [r.status_code for r in responses] == [200, 200]
+        assert sorted(paths) == ["/my/ships/SHIP-1/orbit", "/my/ships/SHIP-2/orbit"]
@@ -90,11 +90,36 @@ async def test_update_contracts_success(contract_manager, mock_client, mock_cont
         await contract_manager.update_contracts()
 
         assert mock_get.call_count == 1
-        mock_get.assert_called_with(client=mock_client)
+        mock_get.assert_called_with(client=mock_client, page=1, limit=20)
         assert len(contract_manager.contracts) == 1
         assert contract_manager.contracts[mock_contract.id] == mock_contract
 
 
+@pytest.mark.asyncio
+async def test_update_contracts_fetches_all_pages(contract_manager):
+    """Test every page of contracts is loaded in one refresh"""
+    contracts = [ContractFactory.build() for _ in range(21)]
+
+    def page_response(page_contracts):
+        response = MagicMock(status_code=200)
+        response.parsed.data = page_contracts
+        response.parsed.meta = MetaFactory.build(total=21)
+        return response
+
+    with patch(
+        'game.contract_manager.get_contracts.asyncio_detailed',
+        new_callable=AsyncMock
+    ) as mock_get:
+        mock_get.side_effect = [
+            page_response(contracts[:20]),
+            page_response(contracts[20:])
+        ]
+        await contract_manager.update_contracts()
+
+    assert len(contract_manager.contracts) == 21
+    assert [call.kwargs["page"] for call in mock_get.call_args_list] == [1, 2]
+
+
 @pytest.mark.asyncio
 async def test_update_contracts_failure(contract_manager, mock_client):
     """Test contract update failure"""
@@ -107,7 +132,7 @@ async def test_update_contracts_failure(contract_manager, mock_client):
         await contract_manager.update_contracts()
 
         assert mock_get.call_count == 1  # Only called once since 404 is not retried
-        mock_get.assert_called_with(client=mock_client)
+        mock_get.assert_called_with(client=mock_client, page=1, limit=20)
         assert len(contract_manager.contracts) == 0  # No contracts on error
 
 
@@ -120,7 +145,7 @@ async def test_update_contracts_exception(contract_manager, mock_client):
         await contract_manager.update_contracts()
 
         assert mock_get.call_count == 3  # Retries on general exceptions
-        mock_get.assert_called_with(client=mock_client)
+        mock_get.assert_called_with(client=mock_client, page=1, limit=20)
         assert len(contract_manager.contracts) == 0  # No contracts on error
 
 
@@ -416,4 +441,42 @@ async def test_process_contract_invalid_format(
         mock_ships,
         mock_mining_manager, # Updated argument
         mock_system_manager  # Added argument
-    )
\ No newline at end of file
+    )
+
+@pytest.mark.asyncio
+async def test_process_contract_uses_shared_fleet(
+    mock_client,
+    mock_contract,
+    mock_mining_manager,
+    mock_system_manager
+):
+    """Test ships come from the fleet manager passed in, not a fresh one"""
+    fleet_manager = MagicMock()
+    ship = ShipFactory.build()
+    fleet_manager.get_ships_by_type.return_value = ([ship], [ship])
+    manager = ContractManager(mock_client, fleet_manager=fleet_manager)
+
+    with patch('game.contract_manager.get_contract.asyncio_detailed', new_callable=AsyncMock) as mock_get:
+        get_response = MagicMock()
+        get_response.status_code = 200
+        get_response.parsed.data = MagicMock(
+            fulfilled=False,
+            terms=mock_contract.terms
+        )
+        mock_get.return_value = get_response
+
+        with patch.object(
+            manager.shipyard_manager,
+            'purchase_mining_ship',
+            new_callable=AsyncMock
+        ) as mock_purchase:
+            await manager.process_contract(
+                mock_contract,
+                {ship.symbol: ship},
+                mock_mining_manager,
+                mock_system_manager
+            )
+
+    fleet_manager.get_ships_by_type.assert_called_once_with()
+    mock_purchase.assert_not_called()
+    await manager.rate_limiter.cleanup()
@@ -0,0 +1,96 @@
+"""Tests for the factory-built fleet endpoints"""
+import inspect
+from unittest.mock import MagicMock
+
+import httpx
+import pytest
+
+from space_traders_api_client import AuthenticatedClient
+from space_traders_api_client.api._endpoint_factory import make_post_endpoint
+from space_traders_api_client.api.fleet import dock_ship, jettison
+from space_traders_api_client.errors import UnexpectedStatus
+from space_traders_api_client.models.jettison_body import JettisonBody
+from space_traders_api_client.models.trade_symbol import TradeSymbol
+
+
+def make_client(handler, raise_on_unexpected_status: bool = True) -> AuthenticatedClient:
+    """Build a client whose requests are answered by ``handler``"""
+    return AuthenticatedClient(
+        base_url="https://api.test",
+        token="test_token",
+        raise_on_unexpected_status=raise_on_unexpected_status,
+        httpx_args={"transport": httpx.MockTransport(handler)},
+    )
+
+
+def make_endpoint(status: int = 200):
+    """Build an endpoint whose parser is a mock returning a sentinel"""
+    parse_response = MagicMock(return_value="parsed")
+    return make_post_endpoint("/my/ships/{ship_symbol}/test", parse_response, status), parse_response
+
+
+class TestMakePostEndpoint:
+    """Test suite for make_post_endpoint"""
+
+    def test_success_parses_lazily_once(self):
+        """Test the success body is parsed on first access of parsed only"""
+        endpoint, parse_response = make_endpoint()
+        client = make_client(lambda request: httpx.Response(200, json={}))
+
+        response = endpoint.sync_detailed("SHIP-1", client=client)
+
+        assert response.status_code == 200
+        parse_response.assert_not_called()
+        assert response.parsed == "parsed"
+        assert response.parsed == "parsed"
+        parse_response.assert_called_once()
+
+    def test_unexpected_status_raises_from_call(self):
+        """Test an unexpected status is parsed, and raises, immediately"""
+        client = make_client(lambda request: httpx.Response(400, content=b"bad"))
+
+        with pytest.raises(UnexpectedStatus) as exc_info:
+            dock_ship.sync_detailed("SHIP-1", client=client)
+        assert exc_info.value.status_code == 400
+
+    def test_unexpected_status_without_raise(self):
+        """Test an unexpected status gives parsed None when not raising"""
+        client = make_client(
+            lambda request: httpx.Response(400, content=b"bad"),
+            raise_on_unexpected_status=False,
+        )
+
+        response = dock_ship.sync_detailed("SHIP-1", client=client)
+
+        assert response.status_code == 400
+        assert response.parsed is None
+
+    @pytest.mark.asyncio
+    async def test_asyncio_detailed_sends_body(self):
+        """Test the async request posts the JSON body to the ship's URL"""
+        requests = []
+
+        def handler(request):
+            requests.append(request)
+            return httpx.Response(200, json={})
+
+        endpoint, _ = make_endpoint()
+        client = make_client(handler)
+        body = JettisonBody(symbol=TradeSymbol.IRON_ORE, units=5)
+
+        response = await endpoint.asyncio_detailed("SHIP-1", client=client, body=body)
+        await client.get_async_httpx_client().aclose()
+
+        assert response.parsed == "parsed"
+        assert requests[0].url.path == "/my/ships/SHIP-1/test"
+        assert requests[0].headers["Content-Type"] == "application/json"
+        assert requests[0].content == body.to_json_bytes()
+
+    def test_wrappers_keep_typed_signature(self):
+        """Test endpoint modules expose the generated signature and docs"""
+        signature = inspect.signature(jettison.sync_detailed)
+
+        assert signature.parameters["body"].default is inspect.Parameter.empty
+        assert signature.parameters["body"].annotation is JettisonBody
+        assert jettison.asyncio.__doc__.startswith("Jettison Cargo")
+        assert "body" not in inspect.signature(dock_ship.sync_detailed).parameters
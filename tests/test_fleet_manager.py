@@ -0,0 +1,119 @@
+"""Tests for fleet manager functionality"""
+import pytest
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from space_traders_api_client.errors import UnexpectedStatus
+from space_traders_api_client.models.ship_nav_status import ShipNavStatus
+
+from game.fleet_manager import FleetManager
+from game.ttl_cache import invalidate
+from tests.factories import ShipFactory
+
+
+@pytest.fixture
+async def fleet_manager():
+    """Create a FleetManager with a mock client"""
+    manager = FleetManager(MagicMock())
+    yield manager
+    await manager.rate_limiter.cleanup()
+
+
+@pytest.mark.asyncio
+async def test_wait_for_arrival_sleeps_then_confirms_once(fleet_manager):
+    """Test arrival is confirmed with one ship request after sleeping"""
+    in_transit = ShipFactory(symbol="SHIP-1")
+    in_transit.nav.status = ShipNavStatus.IN_TRANSIT
+    fleet_manager.ships["SHIP-1"] = in_transit
+    arrived = ShipFactory(symbol="SHIP-1")
+    arrived.nav.status = ShipNavStatus.IN_ORBIT
+
+    response = MagicMock(status_code=200, parsed=MagicMock(data=arrived))
+    with patch(
+        'game.fleet_manager.get_my_ship.asyncio_detailed',
+        AsyncMock(return_value=response)
+    ) as mock_get_ship, patch(
+        'game.fleet_manager.asyncio.sleep',
+        AsyncMock()
+    ) as mock_sleep:
+        ship = await fleet_manager.wait_for_arrival("SHIP-1")
+
+    assert ship is arrived
+    assert fleet_manager.ships["SHIP-1"] is arrived
+    mock_get_ship.assert_called_once()
+    mock_sleep.assert_called_once_with(1.0)
+
+
+@pytest.mark.asyncio
+async def test_wait_for_arrival_stops_on_missing_ship(fleet_manager):
+    """Test a raised 404 ends the wait instead of being retried"""
+    with patch(
+        'game.fleet_manager.get_my_ship.asyncio_detailed',
+        AsyncMock(side_effect=UnexpectedStatus(404, b""))
+    ) as mock_get_ship, patch(
+        'game.fleet_manager.asyncio.sleep',
+        AsyncMock()
+    ):
+        ship = await fleet_manager.wait_for_arrival("SHIP-1")
+
+    assert ship is None
+    mock_get_ship.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_update_fleet_fetches_all_pages(fleet_manager):
+    """Test every page of ships is loaded in one refresh"""
+    first_page = [ShipFactory() for _ in range(20)]
+    second_page = [ShipFactory() for _ in range(5)]
+
+    def page_response(ships):
+        parsed = MagicMock(data=ships, meta=MagicMock(total=25))
+        return MagicMock(status_code=200, parsed=parsed)
+
+    with patch(
+        'game.fleet_manager.get_my_ships.asyncio_detailed',
+        AsyncMock(side_effect=[
+            page_response(first_page),
+            page_response(second_page)
+        ])
+    ) as mock_get_ships:
+        await fleet_manager.update_fleet()
+
+    assert len(fleet_manager.ships) == 25
+    assert [call.kwargs["page"] for call in mock_get_ships.call_args_list] == [1, 2]
+
+
+@pytest.mark.asyncio
+async def test_update_fleet_updates_ships_in_place(fleet_manager):
+    """Test a refresh keeps the ships dict and drops ships no longer listed"""
+    ships = fleet_manager.ships
+    ships["SHIP-GONE"] = ShipFactory(symbol="SHIP-GONE")
+    current = ShipFactory(symbol="SHIP-1")
+    parsed = MagicMock(data=[current], meta=MagicMock(total=1))
+
+    with patch(
+        'game.fleet_manager.get_my_ships.asyncio_detailed',
+        AsyncMock(return_value=MagicMock(status_code=200, parsed=parsed))
+    ):
+        await fleet_manager.update_fleet()
+
+    assert fleet_manager.ships is ships
+    assert ships == {"SHIP-1": current}
+
+
+@pytest.mark.asyncio
+async def test_ship_list_is_reused_until_fleet_changes(fleet_manager):
+    """Test the ship snapshot is only rebuilt after a refresh"""
+    parsed = MagicMock(data=[ShipFactory(symbol="SHIP-1")], meta=MagicMock(total=1))
+    with patch(
+        'game.fleet_manager.get_my_ships.asyncio_detailed',
+        AsyncMock(return_value=MagicMock(status_code=200, parsed=parsed))
+    ):
+        await fleet_manager.update_fleet()
+        first = fleet_manager.ship_list()
+        assert fleet_manager.ship_list() is first
+
+        parsed.data = [ShipFactory(symbol="SHIP-2")]
+        invalidate(fleet_manager, 'update_fleet')
+        await fleet_manager.update_fleet()
+
+    assert [ship.symbol for ship in fleet_manager.ship_list()] == ["SHIP-2"]
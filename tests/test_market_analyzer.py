@@ -242,9 +242,73 @@ def test_market_analyzer_get_market_insights(mock_market):
     assert "trading_volume" in insights
     assert "supply_levels" in insights
     assert "recommendations" in insights
+    assert insights["recommendations_text"] == "\n- ".join(
+        insights["recommendations"]
+    )
 
     # Verify insights for IRON_ORE
     iron_ore = TradeSymbol.IRON_ORE.value
     assert iron_ore in insights["price_trends"]
     assert iron_ore in insights["trading_volume"]
-    assert iron_ore in insights["supply_levels"]
\ No newline at end of file
+    assert iron_ore in insights["supply_levels"]
+
+
+def test_market_analyzer_get_trade_opportunities_top_k():
+    """Test top_k limits results to the best scoring opportunities"""
+    analyzer = MarketAnalyzer()
+
+    def make_market(symbol, type_, purchase_price, sell_price):
+        return Market(
+            symbol=symbol,
+            exports=[],
+            imports=[],
+            exchange="TEST_EXCHANGE",
+            trade_goods=[
+                MarketTradeGood(
+                    symbol=TradeSymbol.IRON_ORE,
+                    type_=type_,
+                    trade_volume=100,
+                    supply=SupplyLevel.LIMITED,
+                    activity=ActivityLevel.STRONG,
+                    purchase_price=purchase_price,
+                    sell_price=sell_price
+                )
+            ]
+        )
+
+    markets = [
+        make_market("MARKET_A", MarketTradeGoodType.EXPORT, 50, 75),
+        make_market("MARKET_B", MarketTradeGoodType.IMPORT, 70, 80),
+        make_market("MARKET_C", MarketTradeGoodType.IMPORT, 90, 100),
+    ]
+
+    all_opportunities = analyzer.get_trade_opportunities(markets)
+    best = analyzer.get_trade_opportunities(markets, top_k=1)
+
+    assert len(all_opportunities) == 2
+    assert len(best) == 1
+    assert best[0].target_market == "MARKET_C"
+    assert best[0].score() == all_opportunities[0].score()
+
+
+def test_market_analyzer_insights_cached_until_update(mock_market):
+    """Test insights are reused until the market data changes"""
+    analyzer = MarketAnalyzer()
+    analyzer.update_market_data(mock_market)
+
+    first = analyzer.get_market_insights(mock_market.symbol)
+    assert analyzer.get_market_insights(mock_market.symbol) is first
+
+    analyzer.update_market_data(mock_market)
+    assert analyzer.get_market_insights(mock_market.symbol) is not first
+
+
+def test_market_analyzer_insights_expire(mock_market):
+    """Test cached insights are recomputed once INSIGHTS_TTL has passed"""
+    analyzer = MarketAnalyzer()
+    analyzer.update_market_data(mock_market)
+    first = analyzer.get_market_insights(mock_market.symbol)
+
+    analyzer.INSIGHTS_TTL = timedelta(0)
+
+    assert analyzer.get_market_insights(mock_market.symbol) is not first
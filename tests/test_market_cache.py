@@ -0,0 +1,102 @@
+"""Tests for the two-tier market cache"""
+import os
+import time
+
+import pytest
+
+from space_traders_api_client.models.market import Market
+
+from game.market_cache import MarketCache
+
+
+def make_market(symbol: str = "X1-TEST-A1") -> Market:
+    """Create a minimal market"""
+    return Market(symbol=symbol, exports=[], imports=[], exchange=[])
+
+
+def test_memory_tier_evicts_least_recently_used():
+    """Test the memory tier keeps at most max_entries markets"""
+    cache = MarketCache(ttl=60, max_entries=2)
+    cache.put("A", make_market("A"))
+    cache.put("B", make_market("B"))
+    cache.get("A")
+    cache.put("C", make_market("C"))
+
+    assert cache.get("A") is not None
+    assert cache.get("B") is None
+    assert cache.get("C") is not None
+
+
+def test_memory_tier_expires_entries():
+    """Test entries are dropped once their TTL has passed"""
+    cache = MarketCache(ttl=0)
+    cache.put("A", make_market("A"))
+
+    assert cache.is_expired("A")
+    assert cache.get("A") is None
+
+
+def test_peek_leaves_lru_order():
+    """Test peek reads a market without making it recently used"""
+    cache = MarketCache(ttl=60, max_entries=2)
+    cache.put("A", make_market("A"))
+    cache.put("B", make_market("B"))
+
+    assert cache.peek("A").symbol == "A"
+    cache.put("C", make_market("C"))
+
+    assert cache.peek("A") is None
+    assert cache.peek("B") is not None
+
+
+def test_peek_leaves_expired_entry():
+    """Test peek hides an expired market without dropping it"""
+    cache = MarketCache(ttl=0)
+    cache.put("A", make_market("A"))
+
+    assert cache.peek("A") is None
+    assert cache.is_expired("A")
+
+
+@pytest.mark.asyncio
+async def test_disk_tier_survives_restart(tmp_path):
+    """Test a market written to disk is loaded by a new cache"""
+    await MarketCache(ttl=60, cache_dir=tmp_path).store(
+        "X1-TEST-A1", make_market()
+    )
+
+    cache = MarketCache(ttl=60, cache_dir=tmp_path)
+    market = await cache.load("X1-TEST-A1")
+
+    assert market is not None
+    assert market.symbol == "X1-TEST-A1"
+    assert cache.get("X1-TEST-A1") is market
+
+
+@pytest.mark.asyncio
+async def test_disk_write_leaves_only_complete_shard(tmp_path):
+    """Test a write replaces the shard without leaving temp files behind"""
+    cache = MarketCache(ttl=60, cache_dir=tmp_path)
+    await cache.store("X1-TEST-A1", make_market())
+    await cache.store("X1-TEST-A1", make_market())
+
+    files = list((tmp_path / "X1-TEST-A1").iterdir())
+    assert len(files) == 1
+    assert files[0].suffix == ".json"
+
+
+@pytest.mark.asyncio
+async def test_disk_write_prunes_stale_shards(tmp_path):
+    """Test shards older than the TTL are deleted on write"""
+    stale = tmp_path / "X1-TEST-B2" / "2020010100.json"
+    stale.parent.mkdir()
+    stale.write_bytes(b"{}")
+    old = time.time() - 120
+    os.utime(stale, (old, old))
+
+    await MarketCache(ttl=60, cache_dir=tmp_path).store(
+        "X1-TEST-A1", make_market()
+    )
+
+    assert not stale.exists()
+    assert len(list((tmp_path / "X1-TEST-A1").iterdir())) == 1
@@ -5,6 +5,7 @@ from unittest.mock import AsyncMock, patch
 
 from space_traders_api_client.models.survey import Survey
 from space_traders_api_client.models.extraction import Extraction
+from space_traders_api_client.models.extract_resources_body import ExtractResourcesBody
 from space_traders_api_client.models.extraction_yield import ExtractionYield
 from space_traders_api_client.models.survey_deposit import SurveyDeposit
 from space_traders_api_client.models.survey_size import SurveySize
@@ -365,7 +366,7 @@ class TestMiningManager:
                 task_name=f"extract_resources_{mock_ship.symbol}",
                 ship_symbol=mock_ship.symbol,
                 client=mock_client,
-                json_body={"survey": mock_survey.to_dict()}
+                body=ExtractResourcesBody(survey=mock_survey)
             )
 
             assert result is not None
@@ -405,7 +406,7 @@ class TestMiningManager:
                 task_name=f"extract_resources_{mock_ship.symbol}",
                 ship_symbol=mock_ship.symbol,
                 client=mock_client,
-                json_body=None # Expect None or empty dict if no survey
+                body=ExtractResourcesBody()
             )
 
             assert result is not None
@@ -6,6 +6,7 @@ from datetime import datetime, timezone
 import asyncio
 
 from game.rate_limiter import RateLimiter
+from space_traders_api_client.errors import UnexpectedStatus
 
 # Mock response data
 MOCK_RATE_LIMIT_RESPONSE = {
@@ -40,6 +41,13 @@ def mock_429_response():
     return response
 
 
+@pytest.fixture
+def rate_limit_error():
+    """Fixture for the error a raising client gives on a 429"""
+    data = {"error": {"code": 429, "data": {"retryAfter": 0.05}}}
+    return UnexpectedStatus(429, json.dumps(data).encode())
+
+
 @pytest.fixture
 def mock_200_response():
     """Fixture for successful response"""
@@ -160,4 +168,131 @@ class TestRateLimiter:
             task_name="test_task"
         )
         assert result.status_code == 200
-        assert call_count == 2  # One rate limit + one success
\ No newline at end of file
+        assert call_count == 2  # One rate limit + one success
+
+    @pytest.mark.asyncio
+    async def test_execute_with_retry_unexpected_status_429(
+        self,
+        rate_limiter,
+        rate_limit_error,
+        mock_200_response
+    ):
+        """Test a raised 429 waits for retryAfter before the next attempt"""
+        call_times = []
+
+        async def mock_api_call(*args, **kwargs):
+            call_times.append(asyncio.get_running_loop().time())
+            if len(call_times) == 1:
+                raise rate_limit_error
+            return mock_200_response
+
+        result = await rate_limiter.execute_with_retry(
+            mock_api_call,
+            task_name="test_task"
+        )
+        assert result.status_code == 200
+        assert len(call_times) == 2
+        assert call_times[1] - call_times[0] >= 0.05
+        assert rate_limiter.backoff_multiplier == 1.0
+
+    @pytest.mark.asyncio
+    async def test_execute_with_retry_429_bounded_by_max_retries(
+        self,
+        rate_limiter,
+        rate_limit_error
+    ):
+        """Test persistent 429s make at most max_retries requests"""
+        call_count = 0
+
+        async def mock_api_call(*args, **kwargs):
+            nonlocal call_count
+            call_count += 1
+            raise rate_limit_error
+
+        with pytest.raises(Exception, match="test_task failed after 3 attempts"):
+            await rate_limiter.execute_with_retry(
+                mock_api_call,
+                task_name="test_task"
+            )
+        assert call_count == 3
+
+    @pytest.mark.asyncio
+    async def test_execute_with_retry_client_error_not_retried(self, rate_limiter):
+        """Test a raised 4xx reaches the caller after a single attempt"""
+        call_count = 0
+
+        async def mock_api_call(*args, **kwargs):
+            nonlocal call_count
+            call_count += 1
+            raise UnexpectedStatus(404, b"")
+
+        with pytest.raises(UnexpectedStatus) as exc_info:
+            await rate_limiter.execute_with_retry(
+                mock_api_call,
+                task_name="test_task"
+            )
+        assert exc_info.value.status_code == 404
+        assert call_count == 1
+
+    @pytest.mark.asyncio
+    async def test_429_wait_releases_shared_semaphore(
+        self,
+        rate_limit_error,
+        mock_200_response
+    ):
+        """Test other limiters keep running while one waits out a 429"""
+        semaphore = asyncio.Semaphore(1)
+        limited, other = RateLimiter(semaphore), RateLimiter(semaphore)
+        events = []
+
+        async def limited_call(*args, **kwargs):
+            if not events:
+                events.append("limited")
+                raise rate_limit_error
+            events.append("retried")
+            return mock_200_response
+
+        async def other_call(*args, **kwargs):
+            events.append("other")
+            return mock_200_response
+
+        async def delayed_other():
+            await asyncio.sleep(0.01)
+            return await other.execute_with_retry(other_call)
+
+        try:
+            await asyncio.gather(
+                limited.execute_with_retry(limited_call),
+                delayed_other()
+            )
+        finally:
+            await limited.cleanup()
+            await other.cleanup()
+
+        assert events == ["limited", "other", "retried"]
+
+    @pytest.mark.asyncio
+    async def test_shared_semaphore_bounds_concurrency(self):
+        """Test limiters sharing a semaphore never exceed its bound"""
+        semaphore = asyncio.Semaphore(1)
+        limiters = [RateLimiter(semaphore) for _ in range(3)]
+        in_flight = 0
+        max_in_flight = 0
+
+        async def mock_api_call(*args, **kwargs):
+            nonlocal in_flight, max_in_flight
+            in_flight += 1
+            max_in_flight = max(max_in_flight, in_flight)
+            await asyncio.sleep(0.05)
+            in_flight -= 1
+            return MagicMock(status_code=200)
+
+        try:
+            await asyncio.gather(
+                *(limiter.queue_request(mock_api_call) for limiter in limiters)
+            )
+        finally:
+            for limiter in limiters:
+                await limiter.cleanup()
+
+        assert max_in_flight == 1
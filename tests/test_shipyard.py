@@ -1,4 +1,5 @@
 """Tests for shipyard manager"""
+import asyncio
 import pytest
 from unittest.mock import MagicMock, patch, AsyncMock, ANY
 from datetime import datetime, timezone
@@ -66,6 +67,24 @@ def test_has_mining_mount(shipyard_manager):
     assert shipyard_manager.has_mining_mount([]) is False
 
 
+@pytest.mark.asyncio
+async def test_requests_hold_shared_semaphore(mock_client):
+    """Test API calls run under the semaphore shared with other managers"""
+    semaphore = asyncio.Semaphore(1)
+    manager = ShipyardManager(mock_client, semaphore)
+    held = []
+
+    async def mock_get_mounts(**kwargs):
+        held.append(semaphore.locked())
+        return MagicMock(status_code=200, parsed=MagicMock(data=[]))
+
+    with patch('game.shipyard.get_mounts.asyncio_detailed', mock_get_mounts):
+        assert await manager.get_ship_mounts("SHIP-1") == []
+
+    assert held == [True]
+    assert not semaphore.locked()
+
+
 @pytest.mark.asyncio
 async def test_find_shipyards_in_system(shipyard_manager, mock_waypoint):
     """Test finding shipyards in a system"""
@@ -123,6 +142,26 @@ async def test_find_shipyards_multiple_pages(shipyard_manager, mock_waypoint):
         assert mock_waypoint2.symbol in shipyards
 
 
+@pytest.mark.asyncio
+async def test_find_shipyards_is_cached(shipyard_manager, mock_waypoint):
+    """Test a system's shipyards are only scanned once"""
+    with patch(
+        'game.shipyard.get_system_waypoints.asyncio_detailed',
+        new_callable=AsyncMock
+    ) as mock_get:
+        response = MagicMock()
+        response.status_code = 200
+        response.parsed.data = [mock_waypoint]
+        response.parsed.meta = MetaFactory.build(total=1)
+        mock_get.return_value = response
+
+        first = await shipyard_manager.find_shipyards_in_system("TEST-SYSTEM")
+        second = await shipyard_manager.find_shipyards_in_system("TEST-SYSTEM")
+
+        assert first == second == [mock_waypoint.symbol]
+        mock_get.assert_called_once()
+
+
 @pytest.mark.asyncio
 async def test_find_available_mining_ship(shipyard_manager, mock_waypoint):
     """Test finding an available mining ship"""
@@ -253,4 +292,62 @@ async def test_purchase_mining_ship_failure(shipyard_manager):
             result = await shipyard_manager.purchase_mining_ship("TEST-SYSTEM")
 
             assert result is None
-            mock_purchase.assert_called_once()
\ No newline at end of file
+            mock_purchase.assert_called_once()
+
+@pytest.mark.asyncio
+async def test_purchase_mining_ship_waits_with_fleet_manager(mock_client):
+    """Test travel to a mount shipyard is waited out by the fleet manager"""
+    fleet_manager = MagicMock()
+    fleet_manager.wait_for_arrival = AsyncMock(return_value=MagicMock())
+    manager = ShipyardManager(mock_client, fleet_manager=fleet_manager)
+
+    purchase_response = MagicMock(status_code=201)
+    purchase_response.parsed.data.ship.symbol = "NEW-MINING-SHIP"
+    purchase_response.parsed.data.ship.nav.waypoint_symbol = "SHIPYARD-1"
+    ok = AsyncMock(return_value=MagicMock(status_code=200))
+
+    with patch.object(
+        manager,
+        'find_mining_ship_in_nearby_systems',
+        AsyncMock(return_value=("SHIPYARD-1", {'type': 'SHIP_MINING_DRONE', 'purchasePrice': 90000}))
+    ), patch.object(
+        manager, 'find_shipyards_in_system', AsyncMock(return_value=["SHIPYARD-2"])
+    ), patch.object(
+        manager, 'install_mount', AsyncMock(return_value=MagicMock(price_paid=100))
+    ) as mock_install, patch(
+        'game.shipyard.purchase_ship.asyncio_detailed', AsyncMock(return_value=purchase_response)
+    ), patch('game.shipyard.dock_ship.asyncio_detailed', ok), \
+         patch('game.shipyard.refuel_ship.asyncio_detailed', ok), \
+         patch('game.shipyard.orbit_ship.asyncio_detailed', ok), \
+         patch('game.shipyard.navigate_ship.asyncio_detailed', ok), \
+         patch('asyncio.sleep', AsyncMock()):
+        result = await manager.purchase_mining_ship("TEST-SYSTEM")
+
+    assert result is purchase_response
+    fleet_manager.wait_for_arrival.assert_awaited_once_with("NEW-MINING-SHIP")
+    mock_install.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_purchase_invalidates_fleet_and_agent(mock_client):
+    """Test a purchase drops the cached fleet and agent refreshes"""
+    fleet_manager = MagicMock()
+    agent_manager = MagicMock()
+    manager = ShipyardManager(
+        mock_client, fleet_manager=fleet_manager, agent_manager=agent_manager
+    )
+    purchase_response = MagicMock(status_code=201)
+    purchase_response.parsed.data.ship.nav = None
+
+    with patch.object(
+        manager,
+        'find_mining_ship_in_nearby_systems',
+        AsyncMock(return_value=("SHIPYARD-1", {'type': 'SHIP_MINING_DRONE', 'purchasePrice': 90000}))
+    ), patch(
+        'game.shipyard.purchase_ship.asyncio_detailed', AsyncMock(return_value=purchase_response)
+    ), patch('game.shipyard.invalidate') as mock_invalidate, \
+         patch('asyncio.sleep', AsyncMock()):
+        await manager.purchase_mining_ship("TEST-SYSTEM")
+
+    mock_invalidate.assert_any_call(fleet_manager, 'update_fleet')
+    mock_invalidate.assert_any_call(agent_manager, 'get_agent_status')
@@ -0,0 +1,230 @@
+"""Tests for trade manager functionality"""
+import asyncio
+import pytest
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from space_traders_api_client.errors import UnexpectedStatus
+from space_traders_api_client.models.trade_symbol import TradeSymbol
+
+from game.market_analyzer import MarketAnalyzer
+from game.trade_manager import TradeManager
+from tests.factories import WaypointFactory
+
+
+@pytest.fixture
+async def trade_manager():
+    """Create a TradeManager with a mock client"""
+    manager = TradeManager(MagicMock(), MarketAnalyzer())
+    yield manager
+    await manager.rate_limiter.cleanup()
+
+
+def make_response(status_code: int, parsed=None):
+    """Create a mock API response"""
+    response = MagicMock()
+    response.status_code = status_code
+    response.parsed = parsed
+    response.content = b""
+    return response
+
+
+@pytest.mark.asyncio
+async def test_execute_purchases_returns_result_per_order(trade_manager):
+    """Test batch purchase keeps results in order"""
+    with patch(
+        'game.trade_manager.purchase_cargo.asyncio_detailed',
+        AsyncMock(side_effect=[make_response(201), make_response(400)])
+    ) as mock_purchase:
+        results = await trade_manager.execute_purchases(
+            "SHIP-1",
+            [("IRON_ORE", 10), ("COPPER_ORE", 5)]
+        )
+
+    assert results == [True, False]
+    assert mock_purchase.call_count == 2
+    bodies = [call.kwargs["body"] for call in mock_purchase.call_args_list]
+    assert [b.symbol for b in bodies] == [
+        TradeSymbol.IRON_ORE,
+        TradeSymbol.COPPER_ORE
+    ]
+
+
+@pytest.mark.asyncio
+async def test_execute_sales_handles_errors(trade_manager):
+    """Test batch sale reports failures without raising"""
+    with patch.object(
+        trade_manager.rate_limiter,
+        'execute_with_retry',
+        AsyncMock(side_effect=[Exception("API Error"), make_response(201)])
+    ):
+        results = await trade_manager.execute_sales(
+            "SHIP-1",
+            [("IRON_ORE", 10), ("COPPER_ORE", 5)]
+        )
+
+    assert results == [False, True]
+
+
+@pytest.mark.asyncio
+async def test_update_market_data_skips_known_non_marketplace(trade_manager):
+    """Test cached waypoint traits avoid a market request"""
+    trade_manager.waypoints_cache["X1-TEST"] = [
+        WaypointFactory(symbol="X1-TEST-A1", system_symbol="X1-TEST", traits=[])
+    ]
+    with patch(
+        'game.trade_manager.get_market.asyncio_detailed',
+        AsyncMock()
+    ) as mock_get_market:
+        await trade_manager.update_market_data("X1-TEST-A1")
+
+    mock_get_market.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_get_system_waypoints_is_cached(trade_manager):
+    """Test system waypoints are only fetched once"""
+    waypoints = [WaypointFactory(symbol="X1-TEST-A1", system_symbol="X1-TEST")]
+    with patch(
+        'game.trade_manager.get_system_waypoints.asyncio_detailed',
+        AsyncMock(return_value=make_response(200, MagicMock(data=waypoints)))
+    ) as mock_get_waypoints:
+        first = await trade_manager.get_system_waypoints("X1-TEST")
+        second = await trade_manager.get_system_waypoints("X1-TEST")
+
+    assert first == second == waypoints
+    mock_get_waypoints.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_concurrent_market_requests_are_coalesced(trade_manager):
+    """Test concurrent lookups of one waypoint share a request"""
+    market = MagicMock()
+    with patch(
+        'game.trade_manager.get_market.asyncio_detailed',
+        AsyncMock(return_value=make_response(200, MagicMock(data=market)))
+    ) as mock_get_market:
+        results = await asyncio.gather(
+            trade_manager.get_market_details("X1-TEST-A1"),
+            trade_manager.get_market_details("X1-TEST-A1")
+        )
+
+    assert results == [market, market]
+    mock_get_market.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_missing_market_is_negative_cached(trade_manager):
+    """Test a 404 market response is not re-requested within the TTL"""
+    with patch(
+        'game.trade_manager.get_market.asyncio_detailed',
+        AsyncMock(side_effect=UnexpectedStatus(404, b""))
+    ) as mock_get_market:
+        first = await trade_manager.get_market_details("X1-TEST-A1")
+        second = await trade_manager.get_market_details("X1-TEST-A1")
+
+    assert first is None and second is None
+    mock_get_market.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_returned_missing_market_is_negative_cached(trade_manager):
+    """Test a returned 404, from a non-raising client, is negative-cached"""
+    with patch(
+        'game.trade_manager.get_market.asyncio_detailed',
+        AsyncMock(return_value=make_response(404))
+    ) as mock_get_market:
+        first = await trade_manager.get_market_details("X1-TEST-A1")
+        second = await trade_manager.get_market_details("X1-TEST-A1")
+
+    assert first is None and second is None
+    mock_get_market.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_market_cache_stats(trade_manager):
+    """Test repeated market lookups are served from the cache"""
+    market = MagicMock()
+    with patch(
+        'game.trade_manager.get_market.asyncio_detailed',
+        AsyncMock(return_value=make_response(200, MagicMock(data=market)))
+    ) as mock_get_market:
+        await trade_manager.get_market_details("X1-TEST-A1")
+        assert await trade_manager.get_market_details("X1-TEST-A1") is market
+
+    mock_get_market.assert_called_once()
+    stats = trade_manager.cache_stats()
+    assert stats["miss"] == 1
+    assert stats["hit"] == 1
+
+
+@pytest.mark.asyncio
+async def test_slow_markets_are_skipped_after_deadline(trade_manager):
+    """Test the route search keeps markets that arrive before the deadline"""
+    market = MagicMock()
+
+    async def get_market(waypoint_symbol, **kwargs):
+        if waypoint_symbol == "X1-TEST-SLOW":
+            await asyncio.sleep(1)
+        return make_response(200, MagicMock(data=market))
+
+    trade_manager.ROUTE_SEARCH_TIMEOUT = 0.1
+    with patch(
+        'game.trade_manager.get_market.asyncio_detailed',
+        AsyncMock(side_effect=get_market)
+    ):
+        markets = await trade_manager._get_markets_within_deadline(
+            ["X1-TEST-A1", "X1-TEST-SLOW"]
+        )
+
+    assert markets == [market]
+
+
+@pytest.mark.asyncio
+async def test_warm_prefetches_system_markets(trade_manager):
+    """Test warming caches markets so later lookups skip the API"""
+    trade_manager.waypoints_cache["X1-TEST"] = [
+        WaypointFactory(symbol="X1-TEST-A1", system_symbol="X1-TEST"),
+        WaypointFactory(symbol="X1-TEST-B2", system_symbol="X1-TEST", traits=[])
+    ]
+    market = MagicMock()
+    with patch(
+        'game.trade_manager.get_market.asyncio_detailed',
+        AsyncMock(return_value=make_response(200, MagicMock(data=market)))
+    ) as mock_get_market:
+        await trade_manager.warm("X1-TEST")
+        assert await trade_manager.get_market_details("X1-TEST-A1") is market
+
+    mock_get_market.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_cached_market_adds_no_price_snapshot(trade_manager):
+    """Test only API fetches reach the analyzer, not cache hits"""
+    market = MagicMock()
+    trade_manager.market_analyzer = MagicMock()
+    with patch(
+        'game.trade_manager.get_market.asyncio_detailed',
+        AsyncMock(return_value=make_response(200, MagicMock(data=market)))
+    ) as mock_get_market:
+        for _ in range(3):
+            await trade_manager.update_market_data("X1-TEST-A1")
+
+    mock_get_market.assert_called_once()
+    trade_manager.market_analyzer.update_market_data.assert_called_once_with(market)
+
+
+@pytest.mark.asyncio
+async def test_cached_market_keeps_insights_memo(trade_manager):
+    """Test insights are not recomputed for a market served from cache"""
+    market = MagicMock(symbol="X1-TEST-A1")
+    with patch(
+        'game.trade_manager.get_market.asyncio_detailed',
+        AsyncMock(return_value=make_response(200, MagicMock(data=market)))
+    ) as mock_get_market:
+        await trade_manager.update_market_data("X1-TEST-A1")
+        first = trade_manager.market_analyzer.get_market_insights("X1-TEST-A1")
+        await trade_manager.update_market_data("X1-TEST-A1")
+        await trade_manager.update_market_data("X1-TEST-A1")
+
+    mock_get_market.assert_called_once()
+    assert trade_manager.market_analyzer.get_market_insights("X1-TEST-A1") is first
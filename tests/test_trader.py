@@ -3,7 +3,7 @@ Tests for the SpaceTrader game automation
 """
 import asyncio
 from datetime import datetime, timezone
-from unittest.mock import AsyncMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 from space_traders_api_client.models.agent import Agent
@@ -22,18 +22,24 @@ from space_traders_api_client.models.system import System
 from space_traders_api_client.models.system_type import SystemType
 from space_traders_api_client.models.waypoint_type import WaypointType
 from space_traders_api_client.models.ship_nav_status import ShipNavStatus
+from space_traders_api_client.models.market import Market
+from space_traders_api_client.models.trade_good import TradeGood
+from space_traders_api_client.models.trade_symbol import TradeSymbol
 
 # Make sure the game module can be imported
 import sys
 import os
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
+from game.contract_manager import ContractManager
+from game.market_cache import MarketCache
 from game.trader import SpaceTrader
 from game.system_manager import SystemManager # Added
 from game.mining import MiningManager # Added
 
 from tests.factories import (
     AgentFactory,
+    ShipCargoItemFactory,
     ShipFactory,
     SystemFactory,
 )
@@ -310,3 +316,158 @@ async def test_trade_route_full_cargo(trader, mock_ship):
     ):
         await trader._handle_market_actions(mock_ship)
         # Should skip trade route finding for full cargo
+
+
+def test_game_does_not_import_test_factories():
+    """Guard against production code pulling in factory_boy and test helpers"""
+    import subprocess
+
+    result = subprocess.run(
+        [
+            sys.executable,
+            "-c",
+            "import sys, game.trader; "
+            "assert 'factory' not in sys.modules, 'factory_boy imported'; "
+            "assert 'tests.factories' not in sys.modules, 'tests.factories imported'"
+        ],
+        cwd=os.path.abspath(os.path.join(os.path.dirname(__file__), '..')),
+        capture_output=True,
+        text=True
+    )
+    assert result.returncode == 0, result.stderr
+
+
+@pytest.fixture
+def worker_trader(mock_system_manager_trader, mock_mining_manager_trader):
+    """Create a SpaceTrader with a real FleetManager for the ship workers"""
+    with patch('game.trader.AgentManager', MagicMock()), \
+         patch('game.trader.SystemManager', return_value=mock_system_manager_trader), \
+         patch('game.trader.MarketAnalyzer', MagicMock()), \
+         patch('game.trader.TradeManager', MagicMock()), \
+         patch('game.trader.ContractManager', MagicMock()), \
+         patch('game.trader.MiningManager', return_value=mock_mining_manager_trader):
+        t = SpaceTrader("test_token")
+    t.SHIP_WORKER_INTERVAL = 0
+    return t
+
+
+@pytest.mark.asyncio
+async def test_ship_worker_stops_when_ship_leaves(worker_trader, mock_ship):
+    """Test a worker processes its ship until the ship leaves the fleet"""
+    worker_trader.fleet_manager.ships[mock_ship.symbol] = mock_ship
+    passes = 0
+
+    async def process_ship(ship):
+        nonlocal passes
+        passes += 1
+        if passes == 2:
+            del worker_trader.fleet_manager.ships[ship.symbol]
+
+    worker_trader._process_ship = process_ship
+    await asyncio.wait_for(worker_trader._ship_worker(mock_ship.symbol), timeout=1)
+
+    assert passes == 2
+
+
+@pytest.mark.asyncio
+async def test_start_ship_workers_replaces_finished(worker_trader, mock_ship):
+    """Test a worker is started per ship, and restarted only once done"""
+    worker_trader.fleet_manager.ships[mock_ship.symbol] = mock_ship
+    worker_trader._ship_worker = AsyncMock()
+    workers = {}
+
+    worker_trader._start_ship_workers(workers)
+    first = workers[mock_ship.symbol]
+    worker_trader._start_ship_workers(workers)
+    assert workers[mock_ship.symbol] is first
+
+    await first
+    worker_trader._start_ship_workers(workers)
+    assert workers[mock_ship.symbol] is not first
+    await workers[mock_ship.symbol]
+    assert worker_trader._ship_worker.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_trade_loop_cancels_workers(worker_trader, mock_ship):
+    """Test stopping the trade loop cancels the ship workers"""
+    worker_trader.fleet_manager.ships[mock_ship.symbol] = mock_ship
+    worker_trader.agent_manager.get_agent_status = AsyncMock()
+    worker_trader._refresh_fleet_state = AsyncMock()
+    worker_trader._handle_contracts = AsyncMock()
+    started = asyncio.Event()
+
+    async def process_ship(ship):
+        started.set()
+        await asyncio.sleep(10)
+
+    worker_trader._process_ship = process_ship
+    loop_task = asyncio.create_task(worker_trader.trade_loop())
+    await asyncio.wait_for(started.wait(), timeout=1)
+    loop_task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await loop_task
+
+    assert not worker_trader.fleet_manager.ship_lock(mock_ship.symbol).locked()
+
+
+@pytest.mark.asyncio
+async def test_contract_delivery_waits_for_ship_worker(worker_trader, mock_ship):
+    """Test contract handling can't command a ship its worker is processing"""
+    contract_manager = ContractManager(
+        MagicMock(), fleet_manager=worker_trader.fleet_manager
+    )
+    contract_manager.rate_limiter.execute_with_retry = AsyncMock(
+        return_value=MagicMock(status_code=200)
+    )
+    events = []
+    release = asyncio.Event()
+
+    async def process_ship(ship):
+        events.append("worker")
+        await release.wait()
+        events.append("worker done")
+
+    worker_trader._process_ship = process_ship
+    worker = asyncio.create_task(worker_trader._command_ship(mock_ship))
+    await asyncio.sleep(0)
+    delivery = asyncio.create_task(contract_manager.deliver_contract_cargo(
+        "CONTRACT-1", mock_ship.symbol, "IRON_ORE", 10
+    ))
+    await asyncio.sleep(0.01)
+    assert contract_manager.rate_limiter.execute_with_retry.await_count == 0
+
+    release.set()
+    await worker
+    assert await delivery is True
+    assert events == ["worker", "worker done"]
+    assert contract_manager.rate_limiter.execute_with_retry.await_count == 2
+
+
+@pytest.mark.parametrize("listing", ["exports", "imports", "exchange"])
+def test_can_sell_here_checks_every_listing(worker_trader, mock_ship, listing):
+    """Test cargo is sellable when the market lists it in any trade list"""
+    cache = MarketCache(ttl=60, max_entries=2)
+    goods = {"exports": [], "imports": [], "exchange": []}
+    goods[listing] = [TradeGood(symbol=TradeSymbol.IRON_ORE, name="Iron Ore", description="")]
+    cache.put(mock_ship.nav.waypoint_symbol, Market(symbol=mock_ship.nav.waypoint_symbol, **goods))
+    cache.put("OTHER", Market(symbol="OTHER", exports=[], imports=[], exchange=[]))
+    worker_trader.trade_manager.market_cache = cache
+    mock_ship.cargo.inventory = [ShipCargoItemFactory(symbol=TradeSymbol.IRON_ORE)]
+
+    assert worker_trader._can_sell_here(mock_ship)
+    # The check must not make the market the most recently used
+    cache.put("NEWER", Market(symbol="NEWER", exports=[], imports=[], exchange=[]))
+    assert cache.peek(mock_ship.nav.waypoint_symbol) is None
+
+
+def test_can_sell_here_without_buyer(worker_trader, mock_ship):
+    """Test a cached market trading none of the cargo is skipped"""
+    cache = MarketCache(ttl=60)
+    cache.put(mock_ship.nav.waypoint_symbol, Market(
+        symbol=mock_ship.nav.waypoint_symbol, exports=[], imports=[], exchange=[]
+    ))
+    worker_trader.trade_manager.market_cache = cache
+    mock_ship.cargo.inventory = [ShipCargoItemFactory(symbol=TradeSymbol.IRON_ORE)]
+
+    assert not worker_trader._can_sell_here(mock_ship)
@@ -0,0 +1,49 @@
+"""Tests for short-lived method memoization"""
+import pytest
+from unittest.mock import AsyncMock
+
+from game.ttl_cache import invalidate, ttl_cache
+
+
+class Refresher:
+    """Counts how often its cached refresh really runs"""
+
+    def __init__(self):
+        self.fetch = AsyncMock(return_value="state")
+
+    @ttl_cache(60)
+    async def refresh(self):
+        return await self.fetch()
+
+
+@pytest.mark.asyncio
+async def test_result_is_reused_within_ttl():
+    """Test a second call inside the TTL skips the fetch"""
+    refresher = Refresher()
+
+    assert await refresher.refresh() == "state"
+    assert await refresher.refresh() == "state"
+    refresher.fetch.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_invalidate_forces_refresh():
+    """Test invalidating a method makes the next call fetch again"""
+    refresher = Refresher()
+    await refresher.refresh()
+
+    invalidate(refresher, "refresh")
+    await refresher.refresh()
+
+    assert refresher.fetch.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_exceptions_are_not_cached():
+    """Test a failed refresh is retried on the next call"""
+    refresher = Refresher()
+    refresher.fetch.side_effect = [Exception("API Error"), "state"]
+
+    with pytest.raises(Exception, match="API Error"):
+        await refresher.refresh()
+    assert await refresher.refresh() == "state"